@@ -0,0 +1,101 @@
+"""
+세션마다 하나씩 두는 문진 답 기록.
+
+답은 st.session_state.answers 의 AnswerRecord 하나에 모아 둡니다.
+AnswerRecord 는 답 항목마다 슬롯이 하나인 __slots__ 객체이며, 예/아니오/선택 안 함 으로 답하는
+항목은 diagnosis 의 답 코드(ANSWER_YES / ANSWER_NO / ANSWER_OTHER, 작은 정수)로 저장합니다.
+
+answers[key] / answers.get(key) 는 코드가 아니라 답 문자열을 돌려주므로 (Mapping),
+진단(diagnosis)과 보고서(pdf_report, report_summary)는 세션 상태 대신 기록을 그대로 받습니다.
+답하지 않은 항목은 None 이며 Mapping 에서는 없는 키로 보입니다.
+"""
+from collections.abc import MutableMapping
+
+from diagnosis import ANSWER_CODES, ANSWER_OTHER
+from questionnaire import FIELD_KEYS, NOT_SELECTED, TRI_STATE_KEYS, YES_NO_OPTIONS
+
+# 항목 목록은 문진 스키마(questionnaire.FIELDS)에서 가져옴
+# TRI_STATE_KEYS: 예/아니오/선택 안 함 으로 답하는 항목 (코드로 저장), VALUE_KEYS: 나머지 (값 그대로, 여러 개 고르는 답은 tuple)
+VALUE_KEYS = tuple(key for key in FIELD_KEYS if key not in TRI_STATE_KEYS)
+
+ANSWER_KEYS = TRI_STATE_KEYS + VALUE_KEYS
+_TRI_STATE = frozenset(TRI_STATE_KEYS)
+_VALUE = frozenset(VALUE_KEYS)
+
+# 답 문자열 ↔ 코드
+TRI_STATE_CODES = {**ANSWER_CODES, NOT_SELECTED: ANSWER_OTHER}
+TRI_STATE_ANSWERS = {code: answer for answer, code in TRI_STATE_CODES.items()}
+
+
+class AnswerRecord(MutableMapping):
+    """
+    한 세션의 문진 답 (ANSWER_KEYS 항목마다 슬롯 하나).
+
+    속성(answers.jaw_aggravation)은 저장된 값 그대로(예/아니오 항목은 코드),
+    answers["jaw_aggravation"] 은 답 문자열입니다. ANSWER_KEYS 에 없는 key 를 쓰면 KeyError 입니다.
+    list 로 넣은 답은 tuple 로 저장하므로, 고칠 때는 새 값을 다시 넣습니다.
+    """
+    __slots__ = ANSWER_KEYS
+
+    def __init__(self, answers=()):
+        for key in ANSWER_KEYS:
+            setattr(self, key, None)
+        self.update(answers)
+
+    def __getitem__(self, key):
+        if key in _TRI_STATE:
+            code = getattr(self, key)
+            if code is not None:
+                return TRI_STATE_ANSWERS[code]
+        elif key in _VALUE:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key in _TRI_STATE:
+            code = getattr(self, key)
+            return default if code is None else TRI_STATE_ANSWERS[code]
+        if key in _VALUE:
+            value = getattr(self, key)
+            return default if value is None else value
+        return default
+
+    def __setitem__(self, key, value):
+        if key in _TRI_STATE:
+            if value is not None:
+                if value not in TRI_STATE_CODES:
+                    raise ValueError(f"{key} 는 {', '.join(YES_NO_OPTIONS)} 중 하나여야 합니다: {value!r}")
+                value = TRI_STATE_CODES[value]
+        elif key in _VALUE:
+            if isinstance(value, list):
+                value = tuple(value)
+        else:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        setattr(self, key, None)
+
+    def __contains__(self, key):
+        return (key in _TRI_STATE or key in _VALUE) and getattr(self, key) is not None
+
+    def __iter__(self):
+        return (key for key in ANSWER_KEYS if getattr(self, key) is not None)
+
+    def __len__(self):
+        return sum(getattr(self, key) is not None for key in ANSWER_KEYS)
+
+    # pickle(세션 상태 직렬화)에는 슬롯 이름 없이 ANSWER_KEYS 순서의 값만 남김
+    def __getstate__(self):
+        return tuple(getattr(self, key) for key in ANSWER_KEYS)
+
+    def __setstate__(self, state):
+        for key, value in zip(ANSWER_KEYS, state):
+            setattr(self, key, value)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
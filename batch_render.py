@@ -0,0 +1,133 @@
+"""
+문진 기록(JSONL)을 여러 CPU 코어에서 한꺼번에 PDF로 만듭니다.
+
+    python batch_render.py records.jsonl -o reports/ [-j 4] [--font-mode builtin] [--backend reportlab]
+
+records.jsonl 의 한 줄은 세션 상태와 같은 키를 가진 JSON 객체 하나입니다.
+PDF는 앱의 다운로드 버튼과 같은 pdf_report.render_report 로 만듭니다.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from pdf_report import BACKENDS, FONT_MODES, REPORT_KEYS, TEMPLATE_NAME, render_report
+from pdf_templates import get_template
+
+
+def read_records(path):
+    """
+    JSONL 파일에서 (줄 번호, 기록 dict, 오류) 를 차례로 읽습니다.
+    읽을 수 없는 줄은 기록 대신 None 과 오류 문자열을 돌려주므로, 한 줄 때문에 일괄 작업이 멈추지 않습니다.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_no, None, f"{type(e).__name__}: {e}"
+                continue
+            if not isinstance(record, dict):
+                yield line_no, None, "JSON 객체가 아닙니다"
+                continue
+            yield line_no, record, None
+
+
+def output_name(line_no, record, id_key):
+    """기록의 id_key 값(없으면 줄 번호)으로 PDF 파일 이름을 정합니다."""
+    name = str(record.get(id_key) or f"{line_no:06d}") if id_key else f"{line_no:06d}"
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in name) + ".pdf"
+
+
+def _init_worker():
+    # 워커마다 템플릿/레이아웃을 미리 읽어 두어 첫 기록의 지연을 줄입니다.
+    get_template(TEMPLATE_NAME, REPORT_KEYS)
+
+
+def _render_one(job):
+    line_no, record, out_path, font_mode, backend = job
+    start = time.perf_counter()
+    try:
+        data = render_report(record, font_mode=font_mode, backend=backend)
+        with open(out_path, "wb") as f:
+            f.write(data)
+    except Exception as e:
+        return line_no, time.perf_counter() - start, None, f"{type(e).__name__}: {e}"
+    return line_no, time.perf_counter() - start, len(data), None
+
+
+def percentile(sorted_values, p):
+    """정렬된 값에서 p 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * p // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def positive_int(value):
+    """argparse 형식: 1 이상의 정수"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 합니다: {value}")
+    return number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="문진 기록(JSONL)을 PDF 보고서로 일괄 변환합니다.")
+    parser.add_argument("records", help="한 줄에 한 기록씩 담긴 JSONL 파일")
+    parser.add_argument("-o", "--out-dir", default="reports", help="PDF를 저장할 폴더 (기본: reports)")
+    parser.add_argument("-j", "--jobs", type=positive_int, default=os.cpu_count() or 1, help="워커 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--font-mode", choices=FONT_MODES, default=None,
+                        help="보고서 폰트 방식 (기본: TMJ_REPORT_FONT 또는 폰트 파일 유무)")
+    parser.add_argument("--backend", choices=BACKENDS, default=None,
+                        help="보고서 엔진 (기본: TMJ_REPORT_BACKEND 또는 pymupdf)")
+    parser.add_argument("--id-key", default="name",
+                        help="PDF 파일 이름으로 쓸 기록의 키 (값이 없으면 줄 번호, 기본: name)")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    jobs = []
+    failures = []
+    used_names = set()
+    for line_no, record, error in read_records(args.records):
+        if error:
+            failures.append((line_no, error))
+            continue
+        name = output_name(line_no, record, args.id_key)
+        if name in used_names:
+            name = f"{name[:-4]}_{line_no:06d}.pdf"
+        used_names.add(name)
+        jobs.append((line_no, record, os.path.join(args.out_dir, name), args.font_mode, args.backend))
+
+    latencies = []
+    total_bytes = 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_worker) as pool:
+        chunksize = max(1, len(jobs) // (args.jobs * 8))
+        for line_no, elapsed, size, error in pool.map(_render_one, jobs, chunksize=chunksize):
+            if error:
+                failures.append((line_no, error))
+                continue
+            latencies.append(elapsed)
+            total_bytes += size
+    wall = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"records: {len(latencies)} ok, {len(failures)} failed, workers: {args.jobs}")
+    print(f"wall: {wall:.2f} s, throughput: {len(latencies) / wall if wall else 0:.1f} records/s, "
+          f"output: {total_bytes / 1e6:.1f} MB")
+    print("latency ms: " + ", ".join(
+        f"p{p} {percentile(latencies, p) * 1000:.1f}" for p in (50, 90, 95, 99)
+    ) + f", max {latencies[-1] * 1000 if latencies else 0:.1f}")
+    for line_no, error in sorted(failures):
+        print(f"  line {line_no}: {error}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,45 @@
+"""
+보고서 엔진(PyMuPDF 템플릿 채우기 / reportlab 직접 조판)별 렌더링 시간과 출력 크기를 비교합니다.
+
+    python benchmarks/bench_backends.py [-n 반복횟수]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pdf_report import BACKENDS, FONT_MODES, render_report  # noqa: E402
+from sample_answers import ANSWER_SETS  # noqa: E402
+
+
+def measure(answers, backend, font_mode, repeat):
+    times = []
+    size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size = len(render_report(answers, font_mode=font_mode, backend=backend))
+        times.append(time.perf_counter() - start)
+    return times, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'backend':<10} {'font mode':<10} {'answers':<8} {'median ms':>10} {'min ms':>10} {'bytes':>12}")
+    for backend in BACKENDS:
+        for font_mode in FONT_MODES:
+            for answers_name, answers in ANSWER_SETS.items():
+                # 템플릿/폰트/스타일 준비는 측정에서 제외
+                render_report(answers, font_mode=font_mode, backend=backend)
+                times, size = measure(answers, backend, font_mode, args.repeat)
+                print(f"{backend:<10} {font_mode:<10} {answers_name:<8} {statistics.median(times) * 1000:>10.1f} "
+                      f"{min(times) * 1000:>10.1f} {size:>12,}")
+
+
+if __name__ == "__main__":
+    main()
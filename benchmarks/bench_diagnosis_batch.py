@@ -0,0 +1,93 @@
+"""
+NumPy 일괄 진단(diagnosis_batch)의 처리량과, 건별 진단(diagnosis.compute_diagnoses)과의 일치 여부를 확인합니다.
+
+    python benchmarks/bench_diagnosis_batch.py [-n 기록수]
+
+모든 입력 조합(3^12 × 4)에서 diagnosis_batch 결과가 건별 규칙 평가와 같은지 검사하고,
+무작위 답변 n 건으로 코드 변환과 진단 계산의 초당 처리 건수를 잽니다.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from diagnosis import (  # noqa: E402
+    DIAGNOSIS_INPUT_KEYS,
+    INPUT_CODE_TABLES,
+    INPUT_RADICES,
+    TABLE_SIZE,
+    compute_diagnoses,
+    diagnosis_labels,
+    evaluate,
+)
+from diagnosis_batch import diagnosis_masks, encode_records, table_indices  # noqa: E402
+from questionnaire import NOT_SELECTED  # noqa: E402
+
+
+def all_inputs():
+    """모든 입력 조합의 (TABLE_SIZE, 13) 코드 배열 (표 위치 순서)"""
+    return np.stack(np.unravel_index(np.arange(TABLE_SIZE), INPUT_RADICES), axis=1).astype(np.int8)
+
+
+def random_records(n, rng):
+    choices = {key: list(table) + [NOT_SELECTED] for key, table in INPUT_CODE_TABLES}
+    return [{key: rng.choice(choices[key]) for key in DIAGNOSIS_INPUT_KEYS} for _ in range(n)]
+
+
+def rate(n, seconds):
+    return f"{n / seconds / 1e6:.1f} M건/s"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="NumPy 일괄 진단 벤치마크")
+    parser.add_argument("-n", "--records", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    # 1. 모든 입력에서 건별 규칙 평가와 비교
+    inputs = all_inputs()
+    start = time.perf_counter()
+    masks = diagnosis_masks(inputs)
+    batch_time = time.perf_counter() - start
+    start = time.perf_counter()
+    expected = np.fromiter((evaluate(tuple(row)) for row in inputs.tolist()), dtype=np.uint16, count=TABLE_SIZE)
+    scalar_time = time.perf_counter() - start
+    mismatches = np.flatnonzero(masks != expected)
+    print(f"전체 입력 {TABLE_SIZE:,} 가지: 일괄 {batch_time * 1000:.0f} ms ({rate(TABLE_SIZE, batch_time)}), "
+          f"건별 {scalar_time:.1f} s, 불일치 {len(mismatches)}")
+    if not np.array_equal(table_indices(inputs), np.arange(TABLE_SIZE)):
+        print("table_indices 가 표 위치와 다릅니다", file=sys.stderr)
+        return 1
+
+    # 2. 답 문자열 기록 → 코드 변환 → 진단, compute_diagnoses 와 비교
+    rng = random.Random(0)
+    records = random_records(min(args.records, 100_000), rng)
+    start = time.perf_counter()
+    columns = encode_records(records)
+    encode_time = time.perf_counter() - start
+    record_masks = diagnosis_masks(columns)
+    bad = sum(diagnosis_labels(int(mask)) != compute_diagnoses(record)
+              for mask, record in zip(record_masks, records))
+    print(f"문자열 기록 {len(records):,} 건: 코드 변환 {rate(len(records), encode_time)}, "
+          f"compute_diagnoses 와 불일치 {bad}")
+
+    # 3. 코드 배열 처리량
+    codes = np.stack([np.random.default_rng(1).integers(0, radix, args.records, dtype=np.int8)
+                      for radix in INPUT_RADICES], axis=1)
+    diagnosis_masks(codes[:1000])
+    times = []
+    for _ in range(5):
+        start = time.perf_counter()
+        diagnosis_masks(codes)
+        times.append(time.perf_counter() - start)
+    best = min(times)
+    print(f"코드 배열 {args.records:,} 건: {best * 1000:.1f} ms ({rate(args.records, best)})")
+    return 1 if len(mismatches) or bad else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""
+보고서 폰트 방식(embedded / builtin)별 렌더링 시간과 출력 크기를 비교합니다.
+
+    python benchmarks/bench_font_modes.py [-n 반복횟수]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pdf_report import FONT_MODES, render_report  # noqa: E402
+from sample_answers import SHORT_ANSWERS  # noqa: E402
+
+
+def measure(font_mode, repeat):
+    times = []
+    size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size = len(render_report(SHORT_ANSWERS, font_mode=font_mode))
+        times.append(time.perf_counter() - start)
+    return times, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'font mode':<12} {'median ms':>10} {'min ms':>10} {'bytes':>12}")
+    for font_mode in FONT_MODES:
+        render_report(SHORT_ANSWERS, font_mode=font_mode)  # 템플릿/폰트 준비는 측정에서 제외
+        times, size = measure(font_mode, args.repeat)
+        print(f"{font_mode:<12} {statistics.median(times) * 1000:>10.1f} "
+              f"{min(times) * 1000:>10.1f} {size:>12,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+이전/다음 버튼 한 번에 드는 서버 CPU 시간과 스크립트 실행 횟수를 잽니다.
+
+    python benchmarks/bench_navigation.py [-n 반복횟수] [--app 다른/경로/app.py]
+
+--app 으로 이전 버전의 app.py 를 주면 같은 방법으로 비교할 수 있습니다.
+스크립트 전체 실행 횟수는 스크립트마다 한 번 부르는 st.set_page_config 호출 수로 셉니다.
+검사 없이 넘어가는 단계(8→9, 10→11, 16→17, 17→18)와 이전 단계 버튼만 잽니다.
+"""
+import argparse
+import logging
+import os
+import statistics
+import time
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+# (시작 단계, 누를 버튼 글자)
+NAVIGATIONS = [
+    (8, "다음 단계로 이동"),
+    (10, "다음 단계로 이동"),
+    (16, "다음 단계로 이동"),
+    (17, "다음 단계로 이동"),
+    (9, "이전 단계"),
+    (12, "이전 단계"),
+    (16, "이전 단계"),
+]
+
+full_runs = 0
+
+
+def counting(set_page_config):
+    def wrapper(*args, **kwargs):
+        global full_runs
+        full_runs += 1
+        return set_page_config(*args, **kwargs)
+    return wrapper
+
+
+def measure(app, step, label, repeat):
+    cpu = []
+    runs = []
+    target = None
+    for _ in range(repeat):
+        global full_runs
+        at = AppTest.from_file(app, default_timeout=120)
+        at.session_state["step"] = step
+        at.session_state["validation_errors"] = {}
+        at.run()
+        button = next(b for b in at.button if label in b.label)
+        full_runs = 0
+        start = time.process_time()
+        button.click()
+        at.run()
+        cpu.append(time.process_time() - start)
+        runs.append(full_runs)
+        target = at.session_state["step"]
+    return cpu, runs, target
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--repeat", type=int, default=5)
+    parser.add_argument("--app", default=APP)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)  # 앱의 빈 label 경고 등은 측정과 무관
+    st.set_page_config = counting(st.set_page_config)
+
+    print(f"{'이동':<22} {'CPU ms':>8} {'실행 횟수':>8}")
+    total = []
+    for step, label in NAVIGATIONS:
+        cpu, runs, target = measure(args.app, step, label, args.repeat)
+        total.append(statistics.median(cpu))
+        print(f"{f'{step} → {target} ({label})':<22} {statistics.median(cpu) * 1000:>8.1f} "
+              f"{statistics.median(runs):>8}")
+    print(f"{'평균':<22} {statistics.mean(total) * 1000:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+요청마다 redact 하던 방식과 미리 지워둔 템플릿 사본에 쓰는 방식을 비교합니다.
+
+    python benchmarks/bench_redaction.py [-n 반복횟수]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pdf_report import REPORT_KEYS, TEMPLATE_NAME, fill_pdf  # noqa: E402
+from pdf_templates import get_template  # noqa: E402
+from sample_answers import SHORT_ANSWERS  # noqa: E402
+
+
+def measure(redact_per_request, repeat):
+    times = []
+    size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size = len(fill_pdf(SHORT_ANSWERS, redact_per_request=redact_per_request).getvalue())
+        times.append(time.perf_counter() - start)
+    return times, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    # 템플릿/레이아웃/사본 준비는 프로세스당 한 번이므로 측정에서 제외
+    get_template(TEMPLATE_NAME, REPORT_KEYS)
+    fill_pdf(SHORT_ANSWERS)
+
+    rows = []
+    for label, redact in (("redact-per-request", True), ("pre-redacted", False)):
+        times, size = measure(redact, args.repeat)
+        rows.append((label, statistics.median(times), min(times), size))
+
+    print(f"{'path':<20} {'median ms':>10} {'min ms':>10} {'bytes':>12}")
+    for label, median, best, size in rows:
+        print(f"{label:<20} {median * 1000:>10.1f} {best * 1000:>10.1f} {size:>12,}")
+    print(f"speed-up: {rows[0][1] / rows[1][1]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+보고서 PDF 생성 벤치마크 모음.
+
+모든 템플릿 × 답변 세트(short/long) × 폰트 방식에 대해
+전체(end-to-end) 시간과 단계별(open / search / redaction / insert / save) 시간,
+Python 힙 최대 사용량(tracemalloc), 출력 크기를 재고 JSON 으로 저장합니다.
+
+    python benchmarks/bench_report.py [-n 반복횟수] [-o 결과.json] [--compare 이전결과.json]
+
+search / redaction 은 템플릿마다 한 번만 하고 캐시되는 단계라서
+요청당 비용이 아니라 첫 요청(콜드 스타트) 비용으로 따로 표시합니다.
+"""
+import argparse
+import datetime
+import glob
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import fitz  # noqa: E402
+
+from pdf_layout import build_layout  # noqa: E402
+from pdf_report import (  # noqa: E402
+    FONT_MODES,
+    REPORT_FULL,
+    REPORT_KEYS,
+    REPORT_VARIANTS,
+    normalize_report_values,
+    render_report,
+    report_pages,
+    save_report,
+    write_values,
+)
+from pdf_templates import CLEAN_SUFFIX, build_clean_template, get_template, open_template  # noqa: E402
+from sample_answers import ANSWER_SETS  # noqa: E402
+
+PER_REQUEST_PHASES = ("open", "insert", "save")
+
+
+def shipped_templates():
+    return sorted(
+        os.path.basename(path)
+        for path in glob.glob(os.path.join(ROOT, "template*.pdf"))
+        if not path.endswith(CLEAN_SUFFIX)
+    )
+
+
+def summarize(times):
+    return {
+        "median_ms": round(statistics.median(times) * 1000, 3),
+        "min_ms": round(min(times) * 1000, 3),
+    }
+
+
+def measure_cold_phases(template, repeat):
+    """템플릿당 한 번 하는 자리표시자 검색(레이아웃 인덱스)과 redaction(지운 사본) 비용"""
+    search, redaction = [], []
+    for _ in range(repeat):
+        with fitz.open(stream=template["data"], filetype="pdf") as doc:
+            start = time.perf_counter()
+            build_layout(doc, REPORT_KEYS)
+            search.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        build_clean_template(template["data"], template["pages"])
+        redaction.append(time.perf_counter() - start)
+    return {"search": summarize(search), "redaction": summarize(redaction)}
+
+
+def measure_request(template, answers, font_mode, repeat, variant=REPORT_FULL):
+    """요청 한 번의 단계별 시간, 전체 시간, 힙 최대 사용량, 출력 크기"""
+    values = normalize_report_values(answers)
+    page_numbers = report_pages(template, variant)
+    pages = template["pages"]
+    if page_numbers is not None:
+        pages = [pages[i] for i in page_numbers]
+    phases = {name: [] for name in PER_REQUEST_PHASES}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        doc = open_template(template, page_numbers=page_numbers)
+        opened = time.perf_counter()
+        write_values(doc, pages, values, font_mode)
+        written = time.perf_counter()
+        save_report(doc, font_mode)
+        saved = time.perf_counter()
+        phases["open"].append(opened - start)
+        phases["insert"].append(written - opened)
+        phases["save"].append(saved - written)
+
+    end_to_end = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render_report(answers, font_mode=font_mode, template_name=template["name"], variant=variant)
+        end_to_end.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    output = render_report(answers, font_mode=font_mode, template_name=template["name"], variant=variant)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "end_to_end": summarize(end_to_end),
+        "phases": {name: summarize(times) for name, times in phases.items()},
+        "python_peak_bytes": peak,
+        "output_bytes": len(output),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def result_key(row):
+    return (row["template"], row["answers"], row["font_mode"], row.get("variant", REPORT_FULL))
+
+
+def print_row(row, previous=None):
+    e2e = row["end_to_end"]["median_ms"]
+    line = (f"{row['template']:<16} {row['answers']:<7} {row['font_mode']:<9} "
+            f"{e2e:>9.1f} " + " ".join(f"{row['phases'][p]['median_ms']:>8.1f}" for p in PER_REQUEST_PHASES) +
+            f" {row['python_peak_bytes'] / 1024:>9.0f} {row['output_bytes']:>10,}")
+    if previous is not None:
+        line += f"  x{e2e / previous['end_to_end']['median_ms']:.2f} vs {previous['output_bytes']:,} B"
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="보고서 PDF 생성 벤치마크")
+    parser.add_argument("-n", "--repeat", type=int, default=10)
+    parser.add_argument("-o", "--output", default="bench_report.json", help="결과 JSON 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument("--template", action="append", help="특정 템플릿만 (여러 번 지정 가능)")
+    parser.add_argument("--font-mode", action="append", choices=FONT_MODES, help="특정 폰트 방식만")
+    parser.add_argument("--variant", choices=REPORT_VARIANTS, default=REPORT_FULL, help="보고서 종류 (기본: full)")
+    args = parser.parse_args()
+
+    previous = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = {result_key(row): row for row in json.load(f)["results"]}
+
+    templates = args.template or shipped_templates()
+    font_modes = args.font_mode or list(FONT_MODES)
+
+    results, cold = [], {}
+    print(f"{'template':<16} {'answers':<7} {'font':<9} {'e2e ms':>9} "
+          + " ".join(f"{p + ' ms':>8}" for p in PER_REQUEST_PHASES) + f" {'peak KiB':>9} {'bytes':>10}")
+    for name in templates:
+        template = get_template(name, REPORT_KEYS)
+        cold[name] = measure_cold_phases(template, max(1, args.repeat // 5))
+        for answers_name, answers in ANSWER_SETS.items():
+            for font_mode in font_modes:
+                render_report(answers, font_mode=font_mode, template_name=name, variant=args.variant)  # 워밍업
+                row = {"template": name, "answers": answers_name, "font_mode": font_mode, "variant": args.variant}
+                row.update(measure_request(template, answers, font_mode, args.repeat, args.variant))
+                results.append(row)
+                print_row(row, previous.get(result_key(row)))
+
+    print()
+    print(f"{'template':<16} {'search ms':>10} {'redaction ms':>13}  (템플릿당 1회, 캐시됨)")
+    for name, phases in cold.items():
+        print(f"{name:<16} {phases['search']['median_ms']:>10.1f} {phases['redaction']['median_ms']:>13.1f}")
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pymupdf": fitz.VersionBind,
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "variant": args.variant,
+        },
+        "results": results,
+        "cold_phases": cold,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+위젯 하나를 바꿀 때 다시 실행되는 범위를 단계별로 비교합니다.
+
+    python benchmarks/bench_reruns.py [-n 반복횟수] [--steps 3-10]
+
+전체: 스크립트 전체 실행 (단계 화면을 fragment 로 나누기 전의 위젯 변경 1회)
+단계: 그 단계의 fragment 함수만 실행 (지금의 위젯 변경 1회, 진단이 바뀌지 않은 경우)
+
+streamlit.testing 의 AppTest 는 fragment 만 따로 다시 실행하지 않으므로,
+전체 실행 안에서 단계 함수가 걸린 시간을 따로 재어 비교합니다.
+"""
+import argparse
+import logging
+import os
+import statistics
+import time
+from functools import wraps
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+step_times = []
+
+
+def timed_fragment(fragment):
+    """st.fragment 대신 써서 fragment 함수 한 번의 실행 시간을 step_times 에 기록합니다."""
+    def decorate(func):
+        @wraps(func)
+        def run():
+            start = time.perf_counter()
+            try:
+                return func()
+            finally:
+                step_times.append(time.perf_counter() - start)
+        return fragment(run)
+    return decorate
+
+
+def parse_steps(text):
+    first, _, last = text.partition("-")
+    return range(int(first), int(last or first) + 1)
+
+
+def measure(step, repeat):
+    at = AppTest.from_file(APP, default_timeout=120)
+    at.session_state["step"] = step
+    at.session_state["validation_errors"] = {}
+    at.run()  # 첫 실행(모듈 import, 템플릿 준비)은 측정에서 제외
+    if at.exception:
+        raise RuntimeError(f"STEP {step}: {at.exception[0].value}")
+    full = []
+    body = []
+    for _ in range(repeat):
+        step_times.clear()
+        start = time.perf_counter()
+        at.run()
+        full.append(time.perf_counter() - start)
+        body.append(sum(step_times))
+    return full, body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--repeat", type=int, default=10)
+    parser.add_argument("--steps", default="0-19", help="측정할 단계 (예: 3-10)")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)  # 앱의 빈 label 경고 등은 측정과 무관
+    st.fragment = timed_fragment(st.fragment)
+
+    print(f"{'step':>4} {'전체 ms':>10} {'단계 ms':>10} {'비율':>7}")
+    totals = [0.0, 0.0]
+    for step in parse_steps(args.steps):
+        full, body = measure(step, args.repeat)
+        full_ms = statistics.median(full) * 1000
+        body_ms = statistics.median(body) * 1000
+        totals[0] += full_ms
+        totals[1] += body_ms
+        print(f"{step:>4} {full_ms:>10.1f} {body_ms:>10.1f} {body_ms / full_ms:>7.1%}")
+    print(f"{'합계':>4} {totals[0]:>10.1f} {totals[1]:>10.1f} {totals[1] / totals[0]:>7.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""벤치마크용 예시 답변 (collect_report_values() 가 돌려주는 형태와 같은 문자열 값)"""
+from pdf_report import REPORT_KEYS
+
+SHORT_ANSWERS = {key: "" for key in REPORT_KEYS}
+SHORT_ANSWERS.update({
+    "name": "홍길동",
+    "birthdate": "1990-05-17",
+    "gender": "여성",
+    "email": "patient@example.com",
+    "phone": "01012345678",
+    "chief_complaint": "턱관절 소리/잠김",
+    "onset": "6개월 이내",
+    "tmj_sound_value": "딸깍소리",
+    "tmj_click_summary": "입 벌릴 때, 음식 씹을 때",
+    "frequency_choice": "주 3~4회",
+    "pain_level": "4",
+    "selected_times": "오전, 저녁",
+    "has_headache_now": "아니오",
+    "habit_summary": "이 악물기 (낮)",
+    "additional_habits": "껌 씹기, 턱 괴기",
+    "selected_ear_symptoms": "없음",
+    "neck_shoulder_symptoms": "목 통증",
+    "additional_symptoms": "없음",
+    "neck_trauma_radio": "아니오",
+    "stress_radio": "예",
+    "ortho_exp": "아니오",
+    "prosth_exp": "아니오",
+    "tmd_treatment_history": "아니오",
+    "impact_daily": "약간 불편함",
+    "impact_work": "전혀 영향 없음",
+    "impact_quality_of_life": "약간 영향을 미침",
+    "sleep_quality": "보통",
+    "sleep_tmd_relation": "잘 모르겠음",
+    "diagnosis_result": "정복성 관절원판 변위 (Disc Displacement with Reduction)",
+})
+
+# 최악의 경우: 모든 항목에 긴 자유 서술을 넣은 답변 (줄바꿈/글자 수가 가장 많음)
+_LONG_TEXT = (
+    "3년 전부터 아침에 일어나면 턱이 뻐근하고 입을 벌릴 때 왼쪽에서 딸깍 소리가 나며, "
+    "딱딱한 음식을 씹은 뒤에는 관자놀이까지 통증이 퍼집니다. 스트레스를 받으면 이를 악무는 "
+    "습관이 있고, 작년에 교정 치료와 물리 치료를 받았으나 증상이 반복되고 있습니다. "
+)
+LONG_ANSWERS = {key: _LONG_TEXT * 3 for key in REPORT_KEYS}
+
+# 기본 정보만 입력하고 나머지 단계는 건너뛴 답변 (값이 있는 페이지가 하나뿐)
+MINIMAL_ANSWERS = {key: "" for key in REPORT_KEYS}
+MINIMAL_ANSWERS.update({
+    "name": "홍길동",
+    "birthdate": "1990-05-17",
+    "gender": "여성",
+    "phone": "01012345678",
+    "chief_complaint": "턱관절 소리/잠김",
+})
+
+ANSWER_SETS = {
+    "minimal": MINIMAL_ANSWERS,
+    "short": SHORT_ANSWERS,
+    "long": LONG_ANSWERS,
+}
@@ -0,0 +1,370 @@
+"""
+DC/TMD 예비 진단 규칙.
+
+규칙은 데이터(DIAGNOSIS_RULES)로 적고, 프로세스당 한 번 (입력 위치, 답 코드) 비교 목록으로
+컴파일합니다. 진단 결과는 규칙 순서대로 비트를 세운 정수(bitmask)이며,
+이름/설명은 diagnosis_labels() 로 따로 붙입니다.
+
+가능한 모든 입력(3^12 × 4 가지)의 결과를 미리 계산한 표(diagnosis_table.bin,
+diagnosis_table.py 로 생성)가 있으면 진단은 표 한 번 조회로 끝납니다.
+"""
+import hashlib
+import json
+import logging
+import os
+import struct
+import sys
+import zlib
+from array import array
+
+from questionnaire import DIAGNOSIS_DEFAULTS
+
+logger = logging.getLogger(__name__)
+
+# 진단에 쓰이는 답변과 세션 기본값 (문진 스키마에서 diagnosis 위치가 있는 항목)
+diagnosis_keys = DIAGNOSIS_DEFAULTS
+
+# 규칙이 읽는 답변 (순서 = 코드 튜플의 위치, 스키마의 diagnosis 위치)
+DIAGNOSIS_INPUT_KEYS = tuple(diagnosis_keys)
+
+SOUND_KEY = "tmj_sound_value"
+
+# 예/아니오 답 코드 (그 밖의 답, "선택 안 함", 값 없음은 모두 0)
+ANSWER_OTHER = 0
+ANSWER_YES = 1
+ANSWER_NO = 2
+ANSWER_CODES = {"예": ANSWER_YES, "아니오": ANSWER_NO}
+
+# 턱 소리 답 코드
+SOUND_OTHER = 0
+SOUND_CLICK = 1
+SOUND_CREPITUS = 2
+SOUND_NONE = 3
+SOUND_CODES = {"딸깍소리": SOUND_CLICK, "사각사각소리(크레피투스)": SOUND_CREPITUS, "없음": SOUND_NONE}
+
+# 규칙 (순서대로 비트 0, 1, 2, ...)
+# when  : 조건 묶음 목록, 묶음 하나의 조건({답변 key: 코드})이 모두 맞으면 해당 (묶음끼리는 OR)
+# unless: 이 규칙보다 앞의 규칙 중 하나라도 해당하면 제외
+DIAGNOSIS_RULES = [
+    {
+        "name": "local_myalgia",
+        "label": "국소 근육통 (Local Myalgia)",
+        "when": [{"muscle_pressure_2s_value": ANSWER_YES, "muscle_referred_pain_value": ANSWER_YES,
+                  "muscle_referred_remote_pain_value": ANSWER_NO}],
+    },
+    {
+        "name": "myofascial_pain_with_referral",
+        "label": "방사성 근막통 (Myofascial Pain with Referral)",
+        "when": [{"muscle_pressure_2s_value": ANSWER_YES, "muscle_referred_pain_value": ANSWER_YES,
+                  "muscle_referred_remote_pain_value": ANSWER_YES}],
+    },
+    {
+        # 국소/방사성이 없을 때만
+        "name": "myalgia",
+        "label": "근육통 (Myalgia)",
+        "when": [{"muscle_pressure_2s_value": ANSWER_NO},
+                 {"muscle_pressure_2s_value": ANSWER_YES, "muscle_referred_pain_value": ANSWER_NO}],
+        "unless": ("local_myalgia", "myofascial_pain_with_referral"),
+    },
+    {
+        "name": "arthralgia",
+        "label": "관절통 (Arthralgia)",
+        "when": [{"tmj_press_pain_value": ANSWER_YES}],
+    },
+    {
+        "name": "headache_attributed_to_tmd",
+        "label": "TMD에 기인한 두통 (Headache attributed to TMD)",
+        "when": [{"headache_with_jaw_value": ANSWER_YES, "headache_temples_value": ANSWER_YES,
+                  "headache_reproduce_by_pressure_value": ANSWER_YES, "headache_not_elsewhere_value": ANSWER_YES},
+                 {"headache_with_jaw_value": ANSWER_NO, "headache_temples_value": ANSWER_YES,
+                  "headache_reproduce_by_pressure_value": ANSWER_YES}],
+    },
+    {
+        "name": "degenerative_joint_disease",
+        "label": "퇴행성 관절 질환 (Degenerative Joint Disease)",
+        "when": [{"crepitus_confirmed_value": ANSWER_YES}],
+    },
+    {
+        "name": "disc_displacement_without_reduction",
+        "label": "비정복성 관절원판 변위, 개구 제한 없음 (Disc Displacement without Reduction)",
+        "when": [{"mao_fits_3fingers_value": ANSWER_YES}],
+    },
+    {
+        "name": "disc_displacement_without_reduction_limited_opening",
+        "label": "비정복성 관절원판 변위, 개구 제한 동반 (Disc Displacement without Reduction with Limited opening)",
+        "when": [{"mao_fits_3fingers_value": ANSWER_NO}, {"jaw_unlock_possible_value": ANSWER_NO}],
+    },
+    {
+        "name": "disc_displacement_with_reduction_intermittent_locking",
+        "label": "정복성 관절원판 변위, 간헐적 개구 장애 동반 (Disc Displacement with reduction, with intermittent locking)",
+        "when": [{"jaw_locked_now_value": ANSWER_YES, "jaw_unlock_possible_value": ANSWER_YES}],
+    },
+    {
+        # 딸깍 소리가 있을 경우
+        "name": "disc_displacement_with_reduction",
+        "label": "정복성 관절원판 변위 (Disc Displacement with Reduction)",
+        "when": [{SOUND_KEY: SOUND_CLICK}],
+    },
+]
+
+DIAGNOSIS_LABELS = tuple(rule["label"] for rule in DIAGNOSIS_RULES)
+
+dc_tmd_explanations = {
+    "근육통 (Myalgia)": "턱 주변 근육에서 발생하는 통증으로, 움직임이나 압박 시 통증이 심해지는 증상입니다.",
+    "국소 근육통 (Local Myalgia)": "통증이 특정 근육 부위에만 국한되어 있고, 다른 부위로 퍼지지 않는 증상입니다.",
+    "방사성 근막통 (Myofascial Pain with Referral)": "특정 근육을 눌렀을 때 통증이 다른 부위로 방사되어 퍼지는 증상입니다.",
+    "관절통 (Arthralgia)": "턱관절 자체에 발생하는 통증으로, 움직이거나 누를 때 통증이 유발되는 상태입니다.",
+    "퇴행성 관절 질환 (Degenerative Joint Disease)": "턱관절의 연골이나 뼈가 마모되거나 손상되어 통증과 기능 제한이 동반되는 상태입니다.",
+    "비정복성 관절원판 변위, 개구 제한 없음 (Disc Displacement without Reduction)": "턱관절 디스크가 비정상 위치에 있으며, 입을 벌려도 제자리로 돌아오지 않는 상태입니다.",
+    "비정복성 관절원판 변위, 개구 제한 동반 (Disc Displacement without Reduction with Limited opening)": "디스크가 제자리로 돌아오지 않으며, 입 벌리기가 제한되는 상태입니다.",
+    "정복성 관절원판 변위, 간헐적 개구 장애 동반 (Disc Displacement with reduction, with intermittent locking)": "디스크가 움직일 때 딸깍소리가 나며, 일시적인 입 벌리기 장애가 간헐적으로 나타나는 상태입니다.",
+    "정복성 관절원판 변위 (Disc Displacement with Reduction)": "입을 벌릴 때 디스크가 제자리로 돌아오며 딸깍소리가 나는 상태이며, 기능 제한은 없는 경우입니다.",
+    "TMD에 기인한 두통 (Headache attributed to TMD)": "턱관절 또는 턱 주변 근육 문제로 인해 발생하는 두통으로, 턱을 움직이거나 근육을 누르면 증상이 악화되는 경우입니다."
+}
+
+
+def compile_rules(rules):
+    """
+    규칙을 (비트, unless 비트, ((입력 위치, 코드), ...) 묶음들) 목록으로 바꿉니다.
+    unless 는 앞선 규칙만 가리킬 수 있습니다 (규칙 순서대로 한 번에 평가하므로).
+    """
+    positions = {key: i for i, key in enumerate(DIAGNOSIS_INPUT_KEYS)}
+    bits = {}
+    compiled = []
+    for i, rule in enumerate(rules):
+        unless = 0
+        for name in rule.get("unless", ()):
+            if name not in bits:
+                raise ValueError(f"{rule['name']}: unless 는 앞선 규칙만 가리킬 수 있습니다: {name!r}")
+            unless |= bits[name]
+        when = tuple(
+            tuple((positions[key], code) for key, code in conditions.items())
+            for conditions in rule["when"]
+        )
+        bits[rule["name"]] = 1 << i
+        compiled.append((1 << i, unless, when))
+    return compiled
+
+
+COMPILED_RULES = compile_rules(DIAGNOSIS_RULES)
+
+# 규칙 이름 → 비트
+DIAGNOSIS_BITS = {rule["name"]: 1 << i for i, rule in enumerate(DIAGNOSIS_RULES)}
+
+# 규칙 이름 → 그 규칙이 읽는 답변 key
+RULE_INPUT_KEYS = {
+    rule["name"]: tuple(dict.fromkeys(key for conditions in rule["when"] for key in conditions))
+    for rule in DIAGNOSIS_RULES
+}
+
+
+def dependent_rules(rules):
+    """
+    입력 위치마다, 그 답이 바뀌면 다시 평가해야 하는 규칙의 비트 묶음.
+    답을 읽는 규칙과, unless 로 그 규칙을 참조하는 뒤 규칙까지 포함합니다.
+    """
+    positions = {key: i for i, key in enumerate(DIAGNOSIS_INPUT_KEYS)}
+    compiled = compile_rules(rules)
+    affected = [0] * len(DIAGNOSIS_INPUT_KEYS)
+    for rule, (bit, _, _) in zip(rules, compiled):
+        for key in RULE_INPUT_KEYS[rule["name"]]:
+            affected[positions[key]] |= bit
+    for position in range(len(affected)):
+        # 규칙 순서대로 훑으면 unless 가 앞 규칙만 가리키므로 한 번에 전이됨
+        for bit, unless, _ in compiled:
+            if affected[position] & unless:
+                affected[position] |= bit
+    return tuple(affected)
+
+
+POSITION_RULES = dependent_rules(DIAGNOSIS_RULES)
+
+
+# 입력 위치마다 (key, 답 → 코드 표), 표에 없는 답은 0 (ANSWER_OTHER / SOUND_OTHER)
+INPUT_CODE_TABLES = tuple(
+    (key, SOUND_CODES if key == SOUND_KEY else ANSWER_CODES) for key in DIAGNOSIS_INPUT_KEYS
+)
+
+
+def encode_answers(state):
+    """세션 상태(또는 dict)에서 진단 입력을 코드 튜플로 만듭니다 (DIAGNOSIS_INPUT_KEYS 순서)."""
+    get = state.get
+    return tuple([table.get(get(key), 0) for key, table in INPUT_CODE_TABLES])
+
+
+# 입력 위치마다 가능한 코드 수 (예/아니오는 3, 턱 소리는 4)
+INPUT_RADICES = tuple(len(table) + 1 for _, table in INPUT_CODE_TABLES)
+
+
+def _strides(radices):
+    # 혼합 진법 자리값: 마지막 입력이 가장 빨리 바뀜 (itertools.product 순서와 같음)
+    strides = []
+    stride = 1
+    for radix in reversed(radices):
+        strides.append(stride)
+        stride *= radix
+    return tuple(reversed(strides)), stride
+
+
+INPUT_STRIDES, TABLE_SIZE = _strides(INPUT_RADICES)
+
+# 입력 위치마다 (key, 답 → 자리값을 곱한 코드 표)
+INPUT_INDEX_TABLES = tuple(
+    (key, {answer: code * stride for answer, code in table.items()})
+    for (key, table), stride in zip(INPUT_CODE_TABLES, INPUT_STRIDES)
+)
+
+
+def answer_index(codes):
+    """코드 튜플의 표 위치 (0 ~ TABLE_SIZE-1)"""
+    return sum(code * stride for code, stride in zip(codes, INPUT_STRIDES))
+
+
+def state_index(state):
+    """세션 상태(또는 dict)의 표 위치 (코드 튜플을 만들지 않고 바로 계산)"""
+    get = state.get
+    index = 0
+    for key, table in INPUT_INDEX_TABLES:
+        index += table.get(get(key), 0)
+    return index
+
+
+# --- 미리 계산한 진단 표 ---
+# 파일 형식: 헤더(매직, 형식 버전, 규칙 지문, 항목 수) + zlib 으로 압축한 little-endian uint16 배열
+TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "diagnosis_table.bin")
+TABLE_MAGIC = b"TMJD"
+TABLE_VERSION = 1
+TABLE_HEADER = struct.Struct("<4sB16sI")
+
+_table = None
+_table_loaded = False
+
+
+def rules_fingerprint():
+    """규칙, 입력 순서, 답 코드의 지문 (하나라도 바뀌면 표를 다시 만들어야 함)"""
+    payload = json.dumps(
+        [DIAGNOSIS_RULES, DIAGNOSIS_INPUT_KEYS, [table for _, table in INPUT_CODE_TABLES]],
+        sort_keys=True, ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def pack_table(table):
+    data = table
+    if sys.byteorder == "big":
+        data = array("H", table)
+        data.byteswap()
+    header = TABLE_HEADER.pack(TABLE_MAGIC, TABLE_VERSION, rules_fingerprint().encode("ascii"), len(table))
+    return header + zlib.compress(data.tobytes(), 9)
+
+
+def unpack_table(blob):
+    """
+    표 파일 bytes 를 array('H') 로 풉니다.
+    형식이나 규칙 지문이 현재 코드와 다르면 ValueError.
+    """
+    magic, version, fingerprint, count = TABLE_HEADER.unpack_from(blob)
+    if magic != TABLE_MAGIC or version != TABLE_VERSION:
+        raise ValueError("진단 표 파일 형식이 다릅니다")
+    if fingerprint.decode("ascii") != rules_fingerprint():
+        raise ValueError("진단 규칙이 바뀌었습니다 (python diagnosis_table.py 로 표를 다시 만드세요)")
+    if count != TABLE_SIZE:
+        raise ValueError(f"진단 표 크기가 다릅니다: {count} != {TABLE_SIZE}")
+    table = array("H")
+    table.frombytes(zlib.decompress(blob[TABLE_HEADER.size:]))
+    if sys.byteorder == "big":
+        table.byteswap()
+    if len(table) != TABLE_SIZE:
+        raise ValueError("진단 표 데이터가 손상되었습니다")
+    return table
+
+
+def load_table(path=TABLE_FILE):
+    """
+    진단 표를 프로세스당 한 번만 읽습니다.
+    파일이 없거나 현재 규칙과 맞지 않으면 None (규칙을 직접 평가).
+    """
+    global _table, _table_loaded
+    if not _table_loaded:
+        try:
+            with open(path, "rb") as f:
+                _table = unpack_table(f.read())
+        except OSError:
+            _table = None
+        except (ValueError, struct.error, zlib.error) as e:
+            logger.warning("%s 를 쓰지 않고 규칙을 직접 평가합니다: %s", path, e)
+            _table = None
+        _table_loaded = True
+    return _table
+
+
+def evaluate(codes):
+    """코드 튜플에 대한 진단 bitmask"""
+    mask = 0
+    for bit, unless, when in COMPILED_RULES:
+        if mask & unless:
+            continue
+        for conditions in when:
+            for position, code in conditions:
+                if codes[position] != code:
+                    break
+            else:
+                mask |= bit
+                break
+    return mask
+
+
+def reevaluate(codes, mask, rule_bits):
+    """mask 중 rule_bits 규칙만 codes 로 다시 평가한 bitmask (나머지 비트는 그대로)"""
+    for bit, unless, when in COMPILED_RULES:
+        if not bit & rule_bits:
+            continue
+        mask &= ~bit
+        if mask & unless:
+            continue
+        for conditions in when:
+            for position, code in conditions:
+                if codes[position] != code:
+                    break
+            else:
+                mask |= bit
+                break
+    return mask
+
+
+def update_diagnosis(memo, state):
+    """
+    실시간 진단: 이전 결과(memo)에서 답이 바뀐 입력에 걸린 규칙만 다시 평가합니다.
+
+    memo 는 {"codes": 코드 튜플, "mask": bitmask} 이며, 처음(None)에는 전체를 평가합니다.
+    바뀐 답이 없으면 memo 를 그대로 돌려줍니다.
+    """
+    codes = encode_answers(state)
+    if memo is None:
+        return {"codes": codes, "mask": evaluate(codes)}
+    previous = memo["codes"]
+    if codes == previous:
+        return memo
+    rule_bits = 0
+    for position, (old, new) in enumerate(zip(previous, codes)):
+        if old != new:
+            rule_bits |= POSITION_RULES[position]
+    return {"codes": codes, "mask": reevaluate(codes, memo["mask"], rule_bits)}
+
+
+def diagnose(state):
+    """세션 상태(또는 dict)의 진단 bitmask (표가 있으면 표 조회, 없으면 규칙 평가)"""
+    table = load_table()
+    if table is not None:
+        return table[state_index(state)]
+    return evaluate(encode_answers(state))
+
+
+def diagnosis_labels(mask):
+    """bitmask 에 해당하는 진단 이름 목록 (규칙 순서)"""
+    return [label for i, label in enumerate(DIAGNOSIS_LABELS) if mask >> i & 1]
+
+
+def compute_diagnoses(state):
+    """세션 상태(또는 dict)의 진단 이름 목록"""
+    return diagnosis_labels(diagnose(state))
@@ -0,0 +1,77 @@
+"""
+저장된 문진 기록 여러 건의 진단을 NumPy 배열 연산으로 한꺼번에 계산합니다.
+
+답은 열(column) 단위 int8 코드 배열로 다룹니다 (diagnosis.py 의 ANSWER_* / SOUND_* 코드).
+규칙은 diagnosis.COMPILED_RULES 를 그대로 열 비교로 평가하므로
+결과는 diagnosis.compute_diagnoses 와 모든 입력에서 같습니다.
+
+    columns = encode_columns({"muscle_pressure_2s_value": ["예", "아니오", ...], ...})
+    results = diagnose_columns(columns)   # 규칙 이름 → bool 배열
+"""
+import numpy as np
+
+from diagnosis import (
+    COMPILED_RULES,
+    DIAGNOSIS_INPUT_KEYS,
+    DIAGNOSIS_RULES,
+    INPUT_CODE_TABLES,
+    INPUT_STRIDES,
+)
+
+CODE_TABLES = dict(INPUT_CODE_TABLES)
+
+
+def encode_column(key, values):
+    """한 답변 열(문자열 목록)을 int8 코드 배열로 바꿉니다 (표에 없는 답은 0)."""
+    get = CODE_TABLES[key].get
+    return np.fromiter((get(answer, 0) for answer in values), dtype=np.int8, count=len(values))
+
+
+def encode_columns(columns):
+    """key → 답 문자열 목록 dict 를 key → int8 코드 배열 dict 로 바꿉니다 (없는 열은 모두 0)."""
+    n = len(next(iter(columns.values()))) if columns else 0
+    return {
+        key: encode_column(key, columns[key]) if key in columns else np.zeros(n, dtype=np.int8)
+        for key in DIAGNOSIS_INPUT_KEYS
+    }
+
+
+def encode_records(records):
+    """세션 상태 같은 dict 기록 목록을 key → int8 코드 배열 dict 로 바꿉니다."""
+    return encode_columns({key: [record.get(key) for record in records] for key in DIAGNOSIS_INPUT_KEYS})
+
+
+def as_code_matrix(codes):
+    """key → 코드 배열 dict 또는 (n, 13) 배열을 (n, 13) int8 배열로 맞춥니다."""
+    if isinstance(codes, np.ndarray):
+        return codes.astype(np.int8, copy=False)
+    return np.stack([np.asarray(codes[key], dtype=np.int8) for key in DIAGNOSIS_INPUT_KEYS], axis=1)
+
+
+def diagnosis_masks(codes):
+    """각 기록의 진단 bitmask (uint16 배열, diagnosis.diagnose 와 같은 값)"""
+    matrix = as_code_matrix(codes)
+    masks = np.zeros(len(matrix), dtype=np.uint16)
+    columns = [matrix[:, i] for i in range(matrix.shape[1])]
+    for bit, unless, when in COMPILED_RULES:
+        hit = np.zeros(len(matrix), dtype=bool)
+        for conditions in when:
+            group = np.ones(len(matrix), dtype=bool)
+            for position, code in conditions:
+                group &= columns[position] == code
+            hit |= group
+        if unless:
+            hit &= (masks & unless) == 0
+        masks |= hit * np.uint16(bit)
+    return masks
+
+
+def diagnose_columns(codes):
+    """각 규칙의 진단 여부를 규칙 이름 → bool 배열 dict 로 돌려줍니다."""
+    masks = diagnosis_masks(codes)
+    return {rule["name"]: (masks & (1 << i)) != 0 for i, rule in enumerate(DIAGNOSIS_RULES)}
+
+
+def table_indices(codes):
+    """각 기록의 진단 표(diagnosis_table.bin) 위치"""
+    return as_code_matrix(codes).astype(np.int64) @ np.array(INPUT_STRIDES, dtype=np.int64)
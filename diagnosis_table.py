@@ -0,0 +1,101 @@
+"""
+진단 표(diagnosis_table.bin) 생성과 회귀 검사.
+
+    python diagnosis_table.py          # 현재 규칙으로 모든 입력을 평가해 표를 다시 만듦
+    python diagnosis_table.py --check  # 현재 규칙이 저장된 표와 모든 입력에서 같은지 검사
+
+표는 12개 예/아니오 답(각 3가지: 그 밖/예/아니오)과 턱 소리(4가지)의
+모든 조합 3^12 × 4 = 2,125,764 가지의 진단 bitmask 입니다.
+답 하나를 2비트로 채우면 2^26 칸이 필요하므로, 혼합 진법 위치(diagnosis.answer_index)를 씁니다.
+
+--check 는 규칙 지문과 상관없이 저장된 표의 값만 비교하므로,
+규칙을 다시 쓴 뒤 동작이 그대로인지 확인하는 기준(oracle)으로 쓸 수 있습니다.
+"""
+import argparse
+import itertools
+import struct
+import sys
+import time
+import zlib
+from array import array
+
+from diagnosis import (
+    DIAGNOSIS_INPUT_KEYS,
+    INPUT_RADICES,
+    TABLE_FILE,
+    TABLE_HEADER,
+    TABLE_SIZE,
+    diagnosis_labels,
+    evaluate,
+    pack_table,
+)
+
+
+def build_table():
+    """현재 규칙으로 모든 입력 조합을 평가한 array('H')"""
+    table = array("H", bytes(2 * TABLE_SIZE))
+    for index, codes in enumerate(itertools.product(*(range(radix) for radix in INPUT_RADICES))):
+        table[index] = evaluate(codes)
+    return table
+
+
+def read_stored_values(path):
+    """저장된 표의 값만 읽습니다 (규칙 지문은 확인하지 않음)."""
+    with open(path, "rb") as f:
+        blob = f.read()
+    count = TABLE_HEADER.unpack_from(blob)[3]
+    table = array("H")
+    table.frombytes(zlib.decompress(blob[TABLE_HEADER.size:]))
+    if sys.byteorder == "big":
+        table.byteswap()
+    if count != len(table):
+        raise ValueError(f"{path}: 항목 수가 헤더와 다릅니다")
+    return table
+
+
+def describe(index):
+    """표 위치를 답 코드로 풀어 보여줍니다."""
+    codes = []
+    for radix in reversed(INPUT_RADICES):
+        index, code = divmod(index, radix)
+        codes.append(code)
+    return ", ".join(f"{key}={code}" for key, code in zip(DIAGNOSIS_INPUT_KEYS, reversed(codes)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="진단 표 생성/검사")
+    parser.add_argument("--check", action="store_true", help="저장된 표와 현재 규칙을 모든 입력에서 비교")
+    parser.add_argument("--path", default=TABLE_FILE)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    table = build_table()
+    elapsed = time.perf_counter() - start
+
+    if args.check:
+        try:
+            stored = read_stored_values(args.path)
+        except (OSError, ValueError, struct.error, zlib.error) as e:
+            print(f"{args.path}: 읽을 수 없습니다 ({e})", file=sys.stderr)
+            return 1
+        if len(stored) != len(table):
+            print(f"항목 수가 다릅니다: 저장 {len(stored)} / 현재 {len(table)}", file=sys.stderr)
+            return 1
+        mismatches = [i for i in range(len(table)) if stored[i] != table[i]]
+        print(f"{len(table):,} 가지 입력 평가 {elapsed:.1f} s, 불일치 {len(mismatches):,} 가지")
+        for index in mismatches[:10]:
+            print(f"  [{describe(index)}]", file=sys.stderr)
+            print(f"    저장: {diagnosis_labels(stored[index])}", file=sys.stderr)
+            print(f"    현재: {diagnosis_labels(table[index])}", file=sys.stderr)
+        return 1 if mismatches else 0
+
+    blob = pack_table(table)
+    with open(args.path, "wb") as f:
+        f.write(blob)
+    print(f"{len(table):,} 가지 입력 평가 {elapsed:.1f} s → {args.path} ({len(blob):,} B, "
+          f"압축 전 {2 * len(table):,} B, 진단 조합 {len(set(table))} 가지)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
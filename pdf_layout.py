@@ -0,0 +1,131 @@
+import glob
+import hashlib
+import json
+import logging
+import os
+import re
+
+import fitz  # PyMuPDF
+
+logger = logging.getLogger(__name__)
+
+# 템플릿 안의 {key} 형태 자리표시자
+PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+# sidecar 파일 형식이 바뀌면 올려서 기존 캐시를 무효화합니다.
+LAYOUT_VERSION = 1
+
+# 프로세스 안에서 한 번 읽은 레이아웃 (sidecar 경로 → layout)
+_layout_cache = {}
+
+
+def template_hash(data):
+    """템플릿 PDF 바이트의 SHA-256 해시 (sidecar 이름에 사용)"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def sidecar_path(template_path, digest, suffix=".layout.json"):
+    """템플릿 옆에 저장되는 파생 파일(레이아웃 인덱스 등) 경로"""
+    return f"{template_path}.{digest[:16]}{suffix}"
+
+
+def build_layout(doc, keys):
+    """
+    템플릿의 모든 페이지에서 각 key 의 {key} 위치를 한 번만 검색해
+    key → [[page, x0, y0, x1, y1], ...] 인덱스를 만듭니다.
+
+    템플릿에는 있지만 keys 에 없는 자리표시자(unknown)와
+    keys 에는 있지만 템플릿에 없는 자리표시자(missing)도 함께 기록합니다.
+    """
+    placeholders = {}
+    found = set()
+    for page in doc:
+        found.update(PLACEHOLDER_RE.findall(page.get_text()))
+        for key in keys:
+            for rect in page.search_for(f"{{{key}}}"):
+                placeholders.setdefault(key, []).append(
+                    [page.number, rect.x0, rect.y0, rect.x1, rect.y1]
+                )
+
+    return {
+        "version": LAYOUT_VERSION,
+        "page_count": doc.page_count,
+        "placeholders": placeholders,
+        "unknown": sorted(found - set(keys)),
+        "missing": [k for k in keys if k not in placeholders],
+    }
+
+
+def report_layout_problems(template_path, layout):
+    """인덱스를 만들 때 발견된 자리표시자 불일치를 로그로 남깁니다."""
+    if layout["unknown"]:
+        logger.warning("%s: 값이 채워지지 않는 자리표시자 %s",
+                       template_path, ", ".join(layout["unknown"]))
+    if layout["missing"]:
+        logger.warning("%s: 템플릿에 없는 항목 %s",
+                       template_path, ", ".join(layout["missing"]))
+
+
+def remove_stale_sidecars(template_path, keep, suffix=".layout.json"):
+    """템플릿 내용이 바뀌어 더 이상 쓰이지 않는 같은 종류의 sidecar 를 지웁니다."""
+    for path in glob.glob(glob.escape(template_path) + ".*" + suffix):
+        if path != keep:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def load_layout(template_path, keys, data=None):
+    """
+    템플릿의 레이아웃 인덱스를 돌려줍니다.
+
+    템플릿 내용 해시로 이름 붙인 sidecar 가 있으면 그대로 읽고,
+    없거나 keys 가 달라졌으면 새로 만들어 저장합니다.
+    """
+    if data is None:
+        with open(template_path, "rb") as f:
+            data = f.read()
+    path = sidecar_path(template_path, template_hash(data))
+    keys = list(keys)
+
+    layout = _layout_cache.get(path)
+    if layout is not None and layout["keys"] == keys:
+        return layout
+
+    layout = None
+    try:
+        with open(path, encoding="utf-8") as f:
+            layout = json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    if layout is None or layout.get("version") != LAYOUT_VERSION or layout.get("keys") != keys:
+        with fitz.open(stream=data, filetype="pdf") as doc:
+            layout = build_layout(doc, keys)
+        layout["keys"] = keys
+        report_layout_problems(template_path, layout)
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(layout, f, ensure_ascii=False)
+            remove_stale_sidecars(template_path, path)
+        except OSError:
+            # 읽기 전용 배포 환경에서는 프로세스 메모리에만 보관합니다.
+            pass
+
+    _layout_cache[path] = layout
+    return layout
+
+
+def placeholders_by_page(layout):
+    """page 번호 → [(key, fitz.Rect), ...] (keys 순서 유지)"""
+    pages = [[] for _ in range(layout["page_count"])]
+    for key in layout["keys"]:
+        for page_no, x0, y0, x1, y1 in layout["placeholders"].get(key, []):
+            pages[page_no].append((key, fitz.Rect(x0, y0, x1, y1)))
+    return pages
+
+
+def pages_for_keys(layout, keys):
+    """keys 의 자리표시자가 놓인 페이지 번호 목록 (오름차순)"""
+    return sorted({pos[0] for key in keys for pos in layout["placeholders"].get(key, [])})
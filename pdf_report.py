@@ -0,0 +1,325 @@
+import logging
+import os
+import threading
+from collections.abc import Mapping
+from functools import cache
+from io import BytesIO
+
+from questionnaire import CHECKBOX_GROUP_KEYS, NOT_SELECTED, REPORT_KEYS
+
+# PyMuPDF(fitz)와 템플릿 모듈(pdf_layout, pdf_templates)은 PDF를 만들 때 함수 안에서 import 합니다.
+# (앱 화면은 이 모듈의 상수와 normalize_report_values 만 쓰므로 새 워커는 PyMuPDF 없이 시작)
+
+# 현재 스크립트 파일의 디렉토리를 얻습니다.
+# 이렇게 하면 앱이 어디에 있든 올바른 경로를 찾을 수 있습니다.
+script_dir = os.path.dirname(os.path.abspath(__file__))
+
+# 폰트 파일의 상대 경로를 지정합니다.
+# 예를 들어, NanumGothic.ttf가 app.py와 같은 폴더에 있을 경우:
+FONT_FILE = os.path.join(script_dir, "NanumGothic.ttf")
+
+# 폰트 파일이 fonts 폴더 안에 있을 경우:
+# FONT_FILE = os.path.join(script_dir, "fonts", "NanumGothic.ttf")
+
+TEMPLATE_NAME = "template5.pdf"
+
+logger = logging.getLogger(__name__)
+
+# 보고서 폰트 방식
+# - embedded: NanumGothic.ttf 를 (사용한 글자만) PDF 안에 포함
+# - builtin : PyMuPDF 내장 한국어 CJK 폰트 참조만 넣고 글꼴 데이터는 포함하지 않음
+#             (보는 쪽 뷰어의 한글 글꼴로 표시되며, 파일이 가장 작음)
+FONT_EMBEDDED = "embedded"
+FONT_BUILTIN = "builtin"
+FONT_MODES = (FONT_EMBEDDED, FONT_BUILTIN)
+BUILTIN_FONT_NAME = "korea"
+
+# 보고서 엔진
+# - pymupdf  : 템플릿 PDF(template5.pdf)의 자리표시자 위치에 값을 덮어씀
+# - reportlab: template2.txt 서식으로 PDF를 새로 조판 (pdf_reportlab.py)
+BACKEND_PYMUPDF = "pymupdf"
+BACKEND_REPORTLAB = "reportlab"
+BACKENDS = (BACKEND_PYMUPDF, BACKEND_REPORTLAB)
+
+# 보고서 종류
+# - full   : 템플릿 전체 페이지 (값이 하나도 없는 페이지는 손대지 않고 그대로 복사)
+# - summary: 환자용 요약, SUMMARY_KEYS 가 있는 페이지(기본 정보가 있는 첫 페이지와 진단 결과 페이지)만
+REPORT_FULL = "full"
+REPORT_SUMMARY = "summary"
+REPORT_VARIANTS = (REPORT_FULL, REPORT_SUMMARY)
+SUMMARY_KEYS = ("name", "diagnosis_result")
+
+# 값 글자 크기와 줄 간격 (pt), 글자가 페이지 오른쪽 끝에 닿지 않도록 두는 여백
+FONT_SIZE = 10
+LINE_HEIGHT = 12
+PAGE_MARGIN = 36
+
+_font_buffer = None
+_font_lock = threading.Lock()
+
+# 폰트 방식 → (fitz.Font 또는 None, GlyphWidths), 프로세스 전체에서 공유
+_writer_fonts = {}
+_writer_font_lock = threading.Lock()
+
+
+def get_font_buffer():
+    """한글 폰트 파일을 프로세스당 한 번만 읽어 bytes 로 돌려줍니다."""
+    global _font_buffer
+    if _font_buffer is None:
+        with _font_lock:
+            if _font_buffer is None:
+                with open(FONT_FILE, "rb") as f:
+                    _font_buffer = f.read()
+    return _font_buffer
+
+
+@cache
+def default_font_mode():
+    """
+    배포 환경에서 TMJ_REPORT_FONT 로 고른 폰트 방식.
+
+    지정하지 않았으면 폰트 파일이 있을 때 embedded, 없으면 builtin 을 씁니다.
+    프로세스당 한 번만 정하므로 (앱은 실행마다 부름) 폰트 파일이 없다는 경고도 한 번만 남습니다.
+    """
+    mode = os.environ.get("TMJ_REPORT_FONT")
+    if mode:
+        if mode not in FONT_MODES:
+            raise ValueError(f"TMJ_REPORT_FONT 는 {', '.join(FONT_MODES)} 중 하나여야 합니다: {mode!r}")
+        return mode
+    if os.path.exists(FONT_FILE):
+        return FONT_EMBEDDED
+    logger.warning("%s 가 없어 내장 CJK 폰트(builtin)로 보고서를 만듭니다.", FONT_FILE)
+    return FONT_BUILTIN
+
+
+def default_backend():
+    """배포 환경에서 TMJ_REPORT_BACKEND 로 고른 보고서 엔진 (기본: pymupdf)."""
+    backend = os.environ.get("TMJ_REPORT_BACKEND") or BACKEND_PYMUPDF
+    if backend not in BACKENDS:
+        raise ValueError(f"TMJ_REPORT_BACKEND 는 {', '.join(BACKENDS)} 중 하나여야 합니다: {backend!r}")
+    return backend
+
+
+# PDF 템플릿에 채워 넣는 항목(REPORT_KEYS, {key} 자리표시자)과
+# 체크박스 묶음({항목: 선택 여부}) 으로 저장되는 항목(CHECKBOX_GROUP_KEYS, 답이 없으면 "없음")은
+# 문진 스키마(questionnaire.FIELDS)의 report 항목입니다.
+
+
+def normalize_report_values(answers):
+    """
+    답변(answers, answers.AnswerRecord 같은 Mapping)에서 REPORT_KEYS 값을 꺼내
+    PDF에 쓸 문자열 dict 로 정리합니다. answers 는 바꾸지 않습니다.
+
+    - 체크박스 묶음 dict → 선택된 항목 이름을 ", " 로 연결 (없으면 "없음")
+    - 여러 개 선택한 list → ", " 로 연결
+    - "선택 안 함" → 빈 문자열
+    """
+    values = {}
+    for key in REPORT_KEYS:
+        value = answers.get(key, {} if key in CHECKBOX_GROUP_KEYS else "")
+        if isinstance(value, dict):
+            selected = [k for k, v in value.items() if v]
+            value = ", ".join(selected) if selected else "없음"
+        elif isinstance(value, (list, tuple)):
+            value = ", ".join(map(str, value))
+        value = str(value)
+        values[key] = "" if value == NOT_SELECTED else value
+    return values
+
+
+class GlyphWidths(dict):
+    """
+    글자 → 글자 폭(1pt 기준) 캐시.
+
+    처음 보는 글자만 폰트에서 읽고, 이후에는 dict 조회로 끝납니다.
+    font 가 None 이면 내장 CJK 참조 폰트로 보고, PyMuPDF 가 이런 폰트를
+    모든 글자 1em 폭으로 배치하는 것과 같게 1.0 을 씁니다.
+    """
+
+    def __init__(self, font=None):
+        super().__init__()
+        self.font = font
+
+    def __missing__(self, char):
+        width = self.font.glyph_advance(ord(char)) if self.font is not None else 1.0
+        self[char] = width
+        return width
+
+
+def get_writer_font(font_mode):
+    """폰트 방식별 fitz.Font 와 글자 폭 캐시를 프로세스당 한 번만 만듭니다."""
+    writer_font = _writer_fonts.get(font_mode)
+    if writer_font is None:
+        with _writer_font_lock:
+            writer_font = _writer_fonts.get(font_mode)
+            if writer_font is None:
+                import fitz  # PyMuPDF
+                font = fitz.Font(fontbuffer=get_font_buffer()) if font_mode == FONT_EMBEDDED else None
+                writer_font = (font, GlyphWidths(font))
+                _writer_fonts[font_mode] = writer_font
+    return writer_font
+
+
+def wrap_text(text, max_width, widths, fontsize=FONT_SIZE):
+    """
+    text 를 max_width(pt) 안에 들어가도록 줄바꿈한 줄 목록을 돌려줍니다.
+
+    사용자가 넣은 줄바꿈은 유지하고, 가능하면 공백에서 자르며
+    공백 없이 긴 단어는 글자 단위로 자릅니다.
+    """
+    lines = []
+    limit = max_width / fontsize
+    for paragraph in text.split("\n"):
+        start = 0
+        width = 0.0
+        last_space = -1
+        for i, char in enumerate(paragraph):
+            char_width = widths[char]
+            if width + char_width > limit and i > start:
+                if last_space > start:
+                    lines.append(paragraph[start:last_space])
+                    start = last_space + 1
+                else:
+                    lines.append(paragraph[start:i])
+                    start = i
+                width = sum(widths[c] for c in paragraph[start:i])
+                last_space = -1
+            if char == " ":
+                last_space = i
+            width += char_width
+        lines.append(paragraph[start:])
+    return lines
+
+
+def write_lines(page, lines, font_mode, font):
+    """
+    한 페이지에 쓸 모든 줄을 모아 content stream 에 한 번만 추가합니다.
+
+    embedded 는 TextWriter 로, builtin 은 참조 폰트를 쓰는 Shape 로 씁니다.
+    """
+    if not lines:
+        return
+    if font_mode == FONT_EMBEDDED:
+        import fitz  # PyMuPDF
+        writer = fitz.TextWriter(page.rect)
+        for point, line in lines:
+            writer.append(point, line, font=font, fontsize=FONT_SIZE)
+        writer.write_text(page)
+    else:
+        page.insert_font(fontname=BUILTIN_FONT_NAME)
+        shape = page.new_shape()
+        for point, line in lines:
+            shape.insert_text(point, line, fontname=BUILTIN_FONT_NAME, fontsize=FONT_SIZE)
+        shape.commit()
+
+
+def check_font_mode(font_mode):
+    """None 이면 기본 폰트 방식을, 아니면 검사한 font_mode 를 돌려줍니다."""
+    if font_mode is None:
+        return default_font_mode()
+    if font_mode not in FONT_MODES:
+        raise ValueError(f"알 수 없는 font_mode: {font_mode!r}")
+    return font_mode
+
+
+def redact_placeholders(doc, pages):
+    """원본 템플릿 문서에서 자리표시자를 지웁니다 (요청마다 redact 하던 이전 방식)."""
+    for page, placements in zip(doc, pages):
+        if not placements:
+            continue
+        for key, rect in placements:
+            page.add_redact_annot(rect)
+        page.apply_redactions()
+
+
+def write_values(doc, pages, values, font_mode):
+    """
+    각 페이지의 자리표시자 위치에 값을 씁니다 (페이지마다 한 번에 추가).
+    채울 값이 없는 페이지는 content stream 을 건드리지 않습니다.
+    """
+    font, widths = get_writer_font(font_mode)
+    for page, placements in zip(doc, pages):
+        if not placements:
+            continue
+        # 값은 페이지 오른쪽 여백 안에서 실제 글자 폭으로 줄바꿈
+        right = page.rect.x1 - PAGE_MARGIN
+        lines = []
+        for key, rect in placements:
+            if not values[key]:
+                continue
+            x, y = rect.tl
+            for i, line in enumerate(wrap_text(values[key], right - x, widths)):
+                if line:
+                    lines.append(((x, y + 8 + i*LINE_HEIGHT), line))
+        write_lines(page, lines, font_mode, font)
+
+
+def save_report(doc, font_mode):
+    """실제로 쓰인 글자만 남기고 폰트를 줄인 뒤, 압축해서 bytes 로 저장합니다."""
+    if font_mode == FONT_EMBEDDED:
+        doc.subset_fonts()
+    pdf_buffer = BytesIO()
+    doc.save(pdf_buffer, garbage=3, deflate=True)
+    doc.close()
+    return pdf_buffer.getvalue()
+
+
+def report_pages(template, variant):
+    """보고서 종류(variant)에 들어갈 템플릿 페이지 번호 목록, 전체이면 None"""
+    if variant == REPORT_FULL:
+        return None
+    if variant == REPORT_SUMMARY:
+        from pdf_layout import pages_for_keys
+        return pages_for_keys(template["layout"], SUMMARY_KEYS) or [0]
+    raise ValueError(f"알 수 없는 variant: {variant!r}")
+
+
+def fill_pdf(values, redact_per_request=False, font_mode=None, template_name=TEMPLATE_NAME,
+             variant=REPORT_FULL):
+    """
+    정리된 값(values)을 템플릿에 채워 PDF BytesIO 로 돌려줍니다.
+
+    기본적으로 자리표시자가 미리 지워진 사본 위에 글자만 씁니다.
+    redact_per_request=True 는 요청마다 원본을 redact 하던 이전 방식으로,
+    벤치마크 비교용입니다.
+    font_mode 는 FONT_EMBEDDED / FONT_BUILTIN 중 하나이며,
+    None 이면 default_font_mode() 를 따릅니다.
+    variant 가 REPORT_SUMMARY 이면 요약 페이지만 열어서 채웁니다.
+    """
+    from pdf_templates import get_template, open_template
+
+    font_mode = check_font_mode(font_mode)
+    template = get_template(template_name, REPORT_KEYS)
+    page_numbers = report_pages(template, variant)
+    doc = open_template(template, clean=not redact_per_request, page_numbers=page_numbers)
+    pages = template["pages"]
+    if page_numbers is not None:
+        pages = [pages[i] for i in page_numbers]
+    if redact_per_request:
+        redact_placeholders(doc, pages)
+    write_values(doc, pages, values, font_mode)
+    return BytesIO(save_report(doc, font_mode))
+
+
+def render_report(values: Mapping, font_mode=None, template_name=TEMPLATE_NAME, backend=None,
+                  variant=REPORT_FULL) -> bytes:
+    """
+    답변(values)만으로 보고서 PDF bytes 를 만듭니다.
+
+    Streamlit 세션에 의존하지 않으므로 캐시, 다른 스레드/프로세스,
+    벤치마크에서 그대로 호출할 수 있습니다.
+    backend 는 BACKENDS 중 하나이며,
+    None 이면 default_backend() 를 따릅니다 (reportlab 은 template_name 을 쓰지 않음).
+    variant 는 REPORT_VARIANTS 중 하나이며, 요약(REPORT_SUMMARY)은 템플릿 PDF를 쓰는 엔진만 지원합니다.
+    """
+    values = normalize_report_values(values)
+    if backend is None:
+        backend = default_backend()
+    if backend == BACKEND_REPORTLAB:
+        if variant != REPORT_FULL:
+            raise ValueError(f"reportlab 엔진은 {variant!r} 보고서를 지원하지 않습니다")
+        from pdf_reportlab import render_report_reportlab
+        return render_report_reportlab(values, font_mode=font_mode)
+    if backend != BACKEND_PYMUPDF:
+        raise ValueError(f"알 수 없는 backend: {backend!r}")
+    return fill_pdf(values, font_mode=font_mode, template_name=template_name, variant=variant).getvalue()
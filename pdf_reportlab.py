@@ -0,0 +1,155 @@
+"""
+reportlab 으로 보고서를 바로 만드는 엔진.
+
+PyMuPDF 경로처럼 템플릿 PDF를 열어 자리표시자를 지우고 덮어쓰지 않고,
+template2.txt 의 서식(제목/섹션/항목)을 그대로 따라 reportlab flowable 로 새 PDF를 만듭니다.
+서식 파일, 폰트, 문단 스타일은 프로세스당 한 번만 준비합니다.
+"""
+import html
+import re
+import threading
+from io import BytesIO
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import mm
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
+from pdf_report import FONT_BUILTIN, FONT_EMBEDDED, FONT_FILE, check_font_mode
+from report_summary import load_layout_text, split_placeholders
+
+# 폰트 방식 → reportlab 폰트 이름
+# builtin 은 PDF 표준 한국어 CID 폰트로, 글꼴 데이터를 포함하지 않습니다.
+REPORTLAB_FONTS = {
+    FONT_EMBEDDED: "NanumGothic",
+    FONT_BUILTIN: "HYGothic-Medium",
+}
+
+SECTION_RE = re.compile(r"^[ⅠⅡⅢⅣⅤⅥⅦⅧⅨⅩⅪⅫ]\.")
+SUBSECTION_RE = re.compile(r"^([■□]|[ⅰⅱⅲⅳⅴ]\))")
+# 같은 줄에 두 항목을 나란히 적으려고 넣은 긴 공백
+COLUMN_GAP_RE = re.compile(r" {3,}")
+
+VALUE_COLOR = "#1f3a93"
+
+_layout = None
+_styles = {}
+_lock = threading.Lock()
+
+
+def compile_line(line):
+    """
+    서식 한 줄을 [글자 조각 또는 (key,)] 목록으로 바꿉니다.
+
+    글자 조각은 reportlab 문단 마크업으로 미리 escape 해 두므로
+    렌더링할 때는 값만 escape 해서 이어 붙이면 됩니다.
+    """
+    return [escape_text(part) if isinstance(part, str) else part for part in split_placeholders(line)]
+
+
+def escape_text(text):
+    text = html.escape(text, quote=False)
+    return COLUMN_GAP_RE.sub("&nbsp;" * 6, text).replace("\n", "<br/>")
+
+
+def line_style(index, line):
+    if index == 0:
+        return "title"
+    if SECTION_RE.match(line):
+        return "section"
+    if SUBSECTION_RE.match(line):
+        return "subsection"
+    if line.startswith("•"):
+        return "bullet"
+    return "body"
+
+
+def load_report_layout():
+    """
+    template2.txt 서식을 한 번만 (스타일 이름, 조각 목록) 블록 목록으로 만듭니다.
+    연속된 빈 줄은 간격(None) 하나로 합칩니다.
+    """
+    global _layout
+    if _layout is None:
+        with _lock:
+            if _layout is None:
+                blocks = []
+                for index, line in enumerate(load_layout_text().splitlines()):
+                    line = line.rstrip()
+                    if not line.strip():
+                        if blocks and blocks[-1] is not None:
+                            blocks.append(None)
+                        continue
+                    blocks.append((line_style(index, line), compile_line(line.lstrip())))
+                _layout = blocks
+    return _layout
+
+
+def get_styles(font_mode):
+    """폰트를 등록하고 문단 스타일을 폰트 방식마다 한 번만 만듭니다."""
+    styles = _styles.get(font_mode)
+    if styles is not None:
+        return styles
+
+    with _lock:
+        styles = _styles.get(font_mode)
+        if styles is None:
+            font_name = REPORTLAB_FONTS[font_mode]
+            if font_name not in pdfmetrics.getRegisteredFontNames():
+                if font_mode == FONT_EMBEDDED:
+                    pdfmetrics.registerFont(TTFont(font_name, FONT_FILE))
+                else:
+                    pdfmetrics.registerFont(UnicodeCIDFont(font_name))
+            base = ParagraphStyle("body", fontName=font_name, fontSize=9, leading=13,
+                                  wordWrap="CJK")
+            styles = {
+                "body": base,
+                "bullet": ParagraphStyle("bullet", parent=base, leftIndent=10, firstLineIndent=-6),
+                "subsection": ParagraphStyle("subsection", parent=base, fontSize=10, leading=15,
+                                             spaceBefore=4),
+                "section": ParagraphStyle("section", parent=base, fontSize=12, leading=17,
+                                          spaceBefore=10, spaceAfter=4,
+                                          textColor=colors.HexColor("#333333")),
+                "title": ParagraphStyle("title", parent=base, fontSize=16, leading=22,
+                                        alignment=1, spaceAfter=8),
+            }
+            _styles[font_mode] = styles
+    return styles
+
+
+def build_story(values, styles):
+    value_open = f'<font color="{VALUE_COLOR}">'
+    story = []
+    for block in load_report_layout():
+        if block is None:
+            story.append(Spacer(1, 4))
+            continue
+        style, parts = block
+        markup = "".join(
+            part if isinstance(part, str)
+            else value_open + escape_text(values.get(part[0], "")) + "</font>"
+            for part in parts
+        )
+        story.append(Paragraph(markup, styles[style]))
+    return story
+
+
+def render_report_reportlab(values, font_mode=None):
+    """
+    정리된 값(values)으로 template2.txt 서식의 보고서 PDF bytes 를 만듭니다.
+    font_mode 는 PyMuPDF 경로와 같은 FONT_EMBEDDED / FONT_BUILTIN 입니다.
+    """
+    font_mode = check_font_mode(font_mode)
+    styles = get_styles(font_mode)
+    pdf_buffer = BytesIO()
+    doc = SimpleDocTemplate(
+        pdf_buffer, pagesize=A4,
+        leftMargin=18 * mm, rightMargin=18 * mm, topMargin=16 * mm, bottomMargin=16 * mm,
+        title="Temporomandibular Disorder Chart", pageCompression=1,
+    )
+    doc.build(build_story(values, styles))
+    return pdf_buffer.getvalue()
@@ -0,0 +1,144 @@
+import json
+import os
+import threading
+
+import fitz  # PyMuPDF
+
+from pdf_layout import (
+    load_layout,
+    placeholders_by_page,
+    remove_stale_sidecars,
+    sidecar_path,
+    template_hash,
+)
+
+# 템플릿 PDF 들이 있는 폴더 (앱 실행 위치와 무관하게 이 파일 기준)
+TEMPLATE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+CLEAN_SUFFIX = ".clean.pdf"
+
+# 프로세스 전체에서 공유하는 템플릿 저장소 ((name, keys) → template)
+_templates = {}
+_lock = threading.Lock()
+
+
+def build_clean_template(data, pages):
+    """
+    모든 {placeholder} 를 미리 지운(redact) 템플릿 사본을 bytes 로 만듭니다.
+
+    채우기 단계에서는 이 사본 위에 글자만 쓰면 되므로
+    요청마다 apply_redactions 를 돌릴 필요가 없습니다.
+    """
+    with fitz.open(stream=data, filetype="pdf") as doc:
+        for page, placements in zip(doc, pages):
+            if not placements:
+                continue
+            for key, rect in placements:
+                page.add_redact_annot(rect)
+            page.apply_redactions()
+        return doc.tobytes(garbage=3, deflate=True)
+
+
+def load_clean_template(path, data, layout, pages):
+    """
+    지워진 템플릿 사본을 sidecar 에서 읽거나, 없으면 만들어 저장합니다.
+
+    sidecar 이름은 템플릿 내용과 자리표시자 위치를 함께 해시해 정하므로
+    둘 중 하나라도 바뀌면 새로 만들어집니다.
+    """
+    positions = json.dumps(layout["placeholders"], sort_keys=True).encode("utf-8")
+    clean_path = sidecar_path(path, template_hash(data + positions), CLEAN_SUFFIX)
+    try:
+        with open(clean_path, "rb") as f:
+            return f.read()
+    except OSError:
+        pass
+
+    clean = build_clean_template(data, pages)
+    try:
+        with open(clean_path, "wb") as f:
+            f.write(clean)
+        remove_stale_sidecars(path, clean_path, CLEAN_SUFFIX)
+    except OSError:
+        # 읽기 전용 배포 환경에서는 프로세스 메모리에만 보관합니다.
+        pass
+    return clean
+
+
+def get_template(name, keys):
+    """
+    템플릿 bytes, 레이아웃 인덱스, 자리표시자를 지운 사본을
+    프로세스당 한 번만 준비해 돌려줍니다.
+
+    반환값은 모든 세션이 함께 쓰는 dict 이므로 수정하지 마세요.
+    """
+    cache_key = (name, tuple(keys))
+    template = _templates.get(cache_key)
+    if template is not None:
+        return template
+
+    with _lock:
+        template = _templates.get(cache_key)
+        if template is None:
+            path = os.path.join(TEMPLATE_DIR, name)
+            with open(path, "rb") as f:
+                data = f.read()
+            layout = load_layout(path, keys, data=data)
+            pages = placeholders_by_page(layout)
+            template = {
+                "name": name,
+                "path": path,
+                "data": data,
+                "clean": load_clean_template(path, data, layout, pages),
+                "layout": layout,
+                "pages": pages,
+            }
+            _templates[cache_key] = template
+    return template
+
+
+def build_page_subset(data, page_numbers):
+    """템플릿에서 page_numbers 페이지만 남긴 사본 bytes"""
+    with fitz.open(stream=data, filetype="pdf") as doc:
+        doc.select(list(page_numbers))
+        return doc.tobytes(garbage=3, deflate=True)
+
+
+def open_template(template, clean=True, page_numbers=None):
+    """
+    메모리에 있는 템플릿으로 새 문서를 엽니다 (요청마다 독립된 사본).
+
+    clean=True 이면 자리표시자가 이미 지워진 사본을,
+    False 이면 원본 템플릿을 엽니다.
+    page_numbers 를 주면 그 페이지만 남긴 사본을 엽니다 (페이지 조합마다 한 번만 만들어 보관).
+    """
+    data = template["clean"] if clean else template["data"]
+    if page_numbers is not None:
+        subsets = template.setdefault("subsets", {})
+        subset_key = (clean, tuple(page_numbers))
+        subset = subsets.get(subset_key)
+        if subset is None:
+            subset = subsets.setdefault(subset_key, build_page_subset(data, page_numbers))
+        data = subset
+    return fitz.open(stream=data, filetype="pdf")
+
+
+if __name__ == "__main__":
+    # 배포 전 빌드 단계: 모든 템플릿의 레이아웃 인덱스와 지워진 사본을 미리 만듭니다.
+    import glob
+    import logging
+
+    from pdf_report import REPORT_KEYS
+
+    logging.basicConfig(format="%(levelname)s %(message)s")
+    for path in sorted(glob.glob(os.path.join(TEMPLATE_DIR, "template*.pdf"))):
+        if path.endswith(CLEAN_SUFFIX):
+            continue
+        template = get_template(os.path.basename(path), REPORT_KEYS)
+        placed = sum(len(p) for p in template["pages"])
+        print(f"{template['name']}: 자리표시자 {placed}개, "
+              f"원본 {len(template['data']):,} B → 사본 {len(template['clean']):,} B")
+        if template["layout"]["unknown"]:
+            print("  값이 채워지지 않는 자리표시자:", ", ".join(template["layout"]["unknown"]))
+        if template["layout"]["missing"]:
+            print("  템플릿에 없는 항목:", ", ".join(template["layout"]["missing"]))
@@ -0,0 +1,350 @@
+"""
+문진 스키마: 답 항목마다 단계, 종류, 선택지, 기본값, 필수 여부(경고 문구), 보고서 자리표시자를 한 곳에 적습니다.
+
+- 답 기록(answers.AnswerRecord)의 슬롯, 보고서 항목(pdf_report.REPORT_KEYS), 진단 입력(diagnosis.DIAGNOSIS_INPUT_KEYS)은
+  import 할 때 이 목록에서 뽑은 key 튜플을 씁니다.
+- 앱 화면은 compile_schema() 가 만든 조회표(항목별 선택지, 선택지 위치, 기본값, 단계별 필수 항목)를
+  프로세스당 한 번 만들어 (steps.common.questionnaire_schema, st.cache_resource) 모든 세션이 함께 씁니다.
+
+이 모듈은 streamlit 없이 import 되므로 (PDF 일괄 생성, 진단 표 생성) 다른 앱 모듈을 import 하지 않습니다.
+"""
+import datetime
+
+NOT_SELECTED = "선택 안 함"
+
+# 선택지 (choice: 하나 고르기, multi: 체크박스로 여러 개 고르기)
+YES_NO_OPTIONS = ("예", "아니오", NOT_SELECTED)
+GENDER_OPTIONS = ("남성", "여성", "기타", NOT_SELECTED)
+CHIEF_COMPLAINT_OPTIONS = (
+    "턱 주변의 통증(턱 근육, 관자놀이, 귀 앞쪽)",
+    "턱관절 소리/잠김",
+    "턱 움직임 관련 두통",
+    "기타 불편한 증상",
+    NOT_SELECTED,
+)
+ONSET_OPTIONS = ("일주일 이내", "1개월 이내", "6개월 이내", "1년 이내", "1년 이상 전", NOT_SELECTED)
+PAIN_QUALITY_OPTIONS = ("둔함", "날카로움", "욱신거림", "간헐적", NOT_SELECTED)
+PAIN_TYPE_OPTIONS = (NOT_SELECTED, "넓은 부위의 통증", "근육 통증", "턱관절 통증", "두통")
+JOINT_SOUND_OPTIONS = ("딸깍소리", "사각사각소리(크레피투스)", "없음", NOT_SELECTED)
+CLICK_OPTIONS = ("입 벌릴 때", "입 다물 때", "음식 씹을 때")
+FREQUENCY_OPTIONS = ("주 1~2회", "주 3~4회", "주 5~6회", "매일", NOT_SELECTED)
+HEADACHE_AREA_OPTIONS = ("이마", "측두부(관자놀이)", "뒤통수", "정수리")
+TRIGGER_OPTIONS = ("스트레스", "수면 부족", "음식 섭취", "소음", "밝은 빛")
+RELIEF_OPTIONS = ("휴식", "약물", "안마", "수면")
+HABIT_OPTIONS = (
+    "옆으로 자는 습관", "코골이", "껌 씹기",
+    "단단한 음식 선호(예: 견과류, 딱딱한 사탕 등)", "한쪽으로만 씹기",
+    "혀 내밀기 및 밀기(이를 밀거나 입술 사이로 내미는 습관)", "손톱/입술/볼 물기",
+    "손가락 빨기", "턱 괴기", "거북목/머리 앞으로 빼기",
+    "음주", "흡연", "카페인",
+)
+SHIFT_OPTIONS = ("오른쪽", "왼쪽", NOT_SELECTED)
+NOISE_OPTIONS = ("딸깍/소리", "없음", NOT_SELECTED)
+EAR_SYMPTOM_OPTIONS = ("이명 (귀울림)", "귀가 먹먹한 느낌", "귀 통증", "청력 저하")
+PAIN_TEST_OPTIONS = ("통증 있음", "통증 없음", NOT_SELECTED)
+ATTRITION_OPTIONS = ("경미", "중간", "심함", NOT_SELECTED)
+IMPACT_DAILY_OPTIONS = ("전혀 불편하지 않음", "약간 불편함", "자주 불편함", "매우 불편함", NOT_SELECTED)
+IMPACT_WORK_OPTIONS = (
+    "전혀 영향 없음",
+    "약간 집중에 어려움 있음",
+    "자주 집중이 힘들고 성과 저하 경험",
+    "매우 큰 영향으로 일/학업 중단 고려한 적 있음",
+    NOT_SELECTED,
+)
+IMPACT_QUALITY_OF_LIFE_OPTIONS = (
+    "전혀 영향을 미치지 않음",
+    "약간 영향을 미침",
+    "영향을 많이 받음",
+    "심각하게 삶의 질 저하",
+    NOT_SELECTED,
+)
+SLEEP_QUALITY_OPTIONS = ("좋음", "보통", "나쁨", "매우 나쁨", NOT_SELECTED)
+SLEEP_TMD_RELATION_OPTIONS = ("영향을 미침", "영향을 미치지 않음", "잘 모르겠음", NOT_SELECTED)
+
+# 항목 종류 → 기본값 (date 는 항목마다 default 를 적고, summary/group 은 단계에서 계산해 넣으므로 기본값 없음)
+# summary: 다른 답으로 만드는 요약 문자열, group: 체크박스 묶음 {항목 이름: 선택 여부}
+KIND_DEFAULTS = {
+    "text": "",
+    "choice": NOT_SELECTED,
+    "multi": (),
+    "check": False,
+    "number": 0,
+}
+KINDS = (*KIND_DEFAULTS, "date", "summary", "group")
+
+# 필수 조건 (when: {답 key: 이 항목을 물어보는 답들}, 모두 맞을 때만 필수)
+MUSCLE_PAIN = {"pain_types_value": ("넓은 부위의 통증", "근육 통증")}
+CREPITUS_UNSURE = {"tmj_sound_value": ("사각사각소리(크레피투스)",), "crepitus_confirmed_value": ("아니오",)}
+HAS_HEADACHE = {"has_headache_now": ("예",)}
+
+# 답 항목 (순서 = 보고서 항목 순서, 단계 안에서는 경고 순서)
+# key      : 답 기록 항목 이름 = 위젯 key = 보고서 템플릿의 {key} 자리표시자
+# step     : 답하는 단계 (summary/group 은 만드는 단계)
+# kind     : KINDS 중 하나, options: choice/multi 의 선택지, default: 종류 기본값 대신 쓸 기본값
+# required : 답하지 않았을 때 다음 단계로 가지 못하게 하는 경고 (when 이 있으면 조건이 맞을 때만)
+# report   : False 면 보고서에 넣지 않음, summary_placeholder: template2.txt 의 자리표시자 이름이 key 와 다를 때
+# diagnosis: 진단 입력 위치 (diagnosis.DIAGNOSIS_INPUT_KEYS 순서, 진단 표 파일과 맞아야 함)
+FIELDS = [
+    # STEP 1
+    {"key": "name", "step": 1, "kind": "text", "required": "이름은 필수 입력 항목입니다."},
+    {"key": "birthdate", "step": 1, "kind": "date", "default": datetime.date(2000, 1, 1)},
+    {"key": "gender", "step": 1, "kind": "choice", "options": GENDER_OPTIONS, "required": "성별은 필수 선택 항목입니다."},
+    {"key": "email", "step": 1, "kind": "text", "required": "이메일은 필수 입력 항목입니다."},
+    {"key": "address", "step": 1, "kind": "text"},
+    {"key": "phone", "step": 1, "kind": "text", "required": "연락처는 필수 입력 항목입니다."},
+    {"key": "occupation", "step": 1, "kind": "text"},
+    {"key": "visit_reason", "step": 1, "kind": "text"},
+    # STEP 2
+    {"key": "chief_complaint", "step": 2, "kind": "choice", "options": CHIEF_COMPLAINT_OPTIONS,
+     "required": "주 호소 항목을 선택해주세요."},
+    {"key": "chief_complaint_other", "step": 2, "kind": "text", "required": "기타 증상을 입력해주세요.",
+     "when": {"chief_complaint": ("기타 불편한 증상",)}},
+    {"key": "onset", "step": 2, "kind": "choice", "options": ONSET_OPTIONS, "required": "문제 발생 시기를 선택해주세요."},
+    # STEP 3
+    {"key": "jaw_aggravation", "step": 3, "kind": "choice", "options": YES_NO_OPTIONS,
+     "required": "악화 여부는 필수 항목입니다. 선택해주세요."},
+    {"key": "pain_quality", "step": 3, "kind": "choice", "options": PAIN_QUALITY_OPTIONS,
+     "required": "통증 양상 항목을 선택해주세요."},
+    {"key": "pain_quality_other", "step": 3, "kind": "text"},
+    # STEP 4
+    {"key": "pain_types_value", "step": 4, "kind": "choice", "options": PAIN_TYPE_OPTIONS, "report": False,
+     "required": "통증 유형을 선택해주세요."},
+    {"key": "muscle_movement_pain_value", "step": 4, "kind": "choice", "options": YES_NO_OPTIONS,
+     "required": "근육: 입 벌릴 때 통증 여부를 선택해주세요.", "when": MUSCLE_PAIN},
+    {"key": "muscle_pressure_2s_value", "step": 4, "kind": "choice", "options": YES_NO_OPTIONS, "diagnosis": 0,
+     "required": "근육: 2초간 압통 여부를 선택해주세요.", "when": MUSCLE_PAIN},
+    {"key": "muscle_referred_pain_value", "step": 4, "kind": "choice", "options": YES_NO_OPTIONS, "diagnosis": 1,
+     "required": "근육: 5초간 통증 전이 여부를 선택해주세요.",
+     "when": {**MUSCLE_PAIN, "muscle_pressure_2s_value": ("예",)}},
+    {"key": "muscle_referred_remote_pain_value", "step": 4, "kind": "choice", "options": YES_NO_OPTIONS, "diagnosis": 2,
+     "required": "근육: 통증이 다른 부위까지 퍼지는지 여부를 선택해주세요.",
+     "when": {**MUSCLE_PAIN, "muscle_pressure_2s_value": ("예",), "muscle_referred_pain_value": ("예",)}},
+    {"key": "tmj_movement_pain_value", "step": 4, "kind": "choice", "options": YES_NO_OPTIONS,
+     "required": "턱관절: 움직일 때 통증 여부를 선택해주세요.", "when": {"pain_types_value": ("턱관절 통증",)}},
+    {"key": "tmj_press_pain_value", "step": 4, "kind": "choice", "options": YES_NO_OPTIONS, "diagnosis": 3,
+     "required": "턱관절: 눌렀을 때 통증 여부를 선택해주세요.", "when": {"pain_types_value": ("턱관절 통증",)}},
+    {"key": "headache_temples_value", "step": 4, "kind": "choice", "options": YES_NO_OPTIONS, "diagnosis": 4,
+     "required": "두통: 관자놀이 여부를 선택해주세요.", "when": {"pain_types_value": ("두통",)}},
+    {"key": "headache_reproduce_by_pressure_value", "step": 4, "kind": "choice", "options": YES_NO_OPTIONS, "diagnosis": 6,
+     "required": "두통: 관자놀이 압통 시 두통 재현 여부를 선택해주세요.", "when": {"pain_types_value": ("두통",)}},
+    {"key": "headache_with_jaw_value", "step": 4, "kind": "choice", "options": YES_NO_OPTIONS, "diagnosis": 5,
+     "required": "두통: 턱 움직임 시 두통 악화 여부를 선택해주세요.", "when": {"pain_types_value": ("두통",)}},
+    {"key": "headache_not_elsewhere_value", "step": 4, "kind": "choice", "options": YES_NO_OPTIONS, "diagnosis": 7,
+     "required": "두통: 다른 진단 여부를 선택해주세요.",
+     "when": {"pain_types_value": ("두통",), "headache_with_jaw_value": ("예",)}},
+    # STEP 5
+    {"key": "tmj_sound_value", "step": 5, "kind": "choice", "options": JOINT_SOUND_OPTIONS, "diagnosis": 11,
+     "required": "턱관절 소리 여부를 선택해주세요."},
+    {"key": "tmj_click_context", "step": 5, "kind": "multi", "options": CLICK_OPTIONS, "report": False,
+     "required": "딸깍소리가 언제 나는지 최소 1개 이상 선택해주세요.", "when": {"tmj_sound_value": ("딸깍소리",)}},
+    {"key": "tmj_click_summary", "step": 5, "kind": "summary"},
+    {"key": "crepitus_confirmed_value", "step": 5, "kind": "choice", "options": YES_NO_OPTIONS, "diagnosis": 8,
+     "required": "사각사각소리가 확실한지 여부를 선택해주세요.",
+     "when": {"tmj_sound_value": ("사각사각소리(크레피투스)",)}},
+    {"key": "jaw_locked_now_value", "step": 5, "kind": "choice", "options": YES_NO_OPTIONS, "diagnosis": 10,
+     "required": "현재 턱 잠김 여부를 선택해주세요.", "when": CREPITUS_UNSURE},
+    {"key": "jaw_unlock_possible_value", "step": 5, "kind": "choice", "options": YES_NO_OPTIONS, "diagnosis": 12,
+     "required": "현재 턱 잠김이 조작으로 풀리는지 여부를 선택해주세요.",
+     "when": {**CREPITUS_UNSURE, "jaw_locked_now_value": ("예",)}},
+    {"key": "jaw_locked_past_value", "step": 5, "kind": "choice", "options": YES_NO_OPTIONS,
+     "required": "과거 턱 잠김 경험 여부를 선택해주세요.",
+     "when": {**CREPITUS_UNSURE, "jaw_locked_now_value": ("아니오",)}},
+    {"key": "mao_fits_3fingers_value", "step": 5, "kind": "choice", "options": YES_NO_OPTIONS, "diagnosis": 9,
+     "required": "MAO 시 손가락 3개가 들어가는지 여부를 선택해주세요.",
+     "when": {**CREPITUS_UNSURE, "jaw_locked_now_value": ("아니오",), "jaw_locked_past_value": ("예",)}},
+    # STEP 6
+    {"key": "frequency_choice", "step": 6, "kind": "choice", "options": FREQUENCY_OPTIONS,
+     "required": "빈도 항목을 입력하거나 선택해주세요."},
+    {"key": "pain_level", "step": 6, "kind": "number"},
+    {"key": "time_morning", "step": 6, "kind": "check", "report": False},
+    {"key": "time_afternoon", "step": 6, "kind": "check", "report": False},
+    {"key": "time_evening", "step": 6, "kind": "check", "report": False},
+    {"key": "selected_times", "step": 6, "kind": "summary", "summary_placeholder": "selected times"},
+    {"key": "has_headache_now", "step": 6, "kind": "choice", "options": YES_NO_OPTIONS},
+    {"key": "headache_areas", "step": 6, "kind": "multi", "options": HEADACHE_AREA_OPTIONS,
+     "required": "두통 부위를 최소 1개 이상 선택해주세요.", "when": HAS_HEADACHE},
+    {"key": "headache_severity", "step": 6, "kind": "number", "required": "두통 강도를 선택해주세요.", "when": HAS_HEADACHE},
+    {"key": "headache_frequency", "step": 6, "kind": "choice", "options": FREQUENCY_OPTIONS,
+     "required": "두통 빈도를 선택해주세요.", "when": HAS_HEADACHE},
+    {"key": "headache_triggers", "step": 6, "kind": "multi", "options": TRIGGER_OPTIONS},
+    {"key": "headache_reliefs", "step": 6, "kind": "multi", "options": RELIEF_OPTIONS},
+    # STEP 7
+    {"key": "habit_none", "step": 7, "kind": "check", "report": False},
+    {"key": "habit_bruxism_night", "step": 7, "kind": "check", "report": False},
+    {"key": "habit_clenching_day", "step": 7, "kind": "check", "report": False},
+    {"key": "habit_clenching_night", "step": 7, "kind": "check", "report": False},
+    {"key": "selected_habits", "step": 7, "kind": "multi", "options": HABIT_OPTIONS, "report": False},
+    {"key": "habit_summary", "step": 7, "kind": "summary"},
+    {"key": "additional_habits", "step": 7, "kind": "summary"},
+    {"key": "full_habit_summary", "step": 7, "kind": "summary", "report": False},
+    # STEP 8
+    {"key": "active_opening", "step": 8, "kind": "text"},
+    {"key": "active_pain", "step": 8, "kind": "choice", "options": YES_NO_OPTIONS},
+    {"key": "passive_opening", "step": 8, "kind": "text"},
+    {"key": "passive_pain", "step": 8, "kind": "choice", "options": YES_NO_OPTIONS},
+    # STEP 9
+    {"key": "deviation", "step": 9, "kind": "choice", "options": YES_NO_OPTIONS},
+    {"key": "deviation2", "step": 9, "kind": "choice", "options": YES_NO_OPTIONS, "summary_placeholder": "devivation2"},
+    {"key": "deflection", "step": 9, "kind": "choice", "options": YES_NO_OPTIONS},
+    {"key": "protrusion", "step": 9, "kind": "text"},
+    {"key": "protrusion_pain", "step": 9, "kind": "choice", "options": YES_NO_OPTIONS},
+    {"key": "latero_right", "step": 9, "kind": "text"},
+    {"key": "latero_right_pain", "step": 9, "kind": "choice", "options": YES_NO_OPTIONS},
+    {"key": "latero_left", "step": 9, "kind": "text"},
+    {"key": "latero_left_pain", "step": 9, "kind": "choice", "options": YES_NO_OPTIONS},
+    {"key": "occlusion", "step": 9, "kind": "choice", "options": YES_NO_OPTIONS},
+    {"key": "occlusion_shift", "step": 9, "kind": "choice", "options": SHIFT_OPTIONS},
+    # STEP 10
+    {"key": "tmj_noise_right_open", "step": 10, "kind": "choice", "options": NOISE_OPTIONS},
+    {"key": "tmj_noise_left_open", "step": 10, "kind": "choice", "options": NOISE_OPTIONS},
+    {"key": "tmj_noise_right_close", "step": 10, "kind": "choice", "options": NOISE_OPTIONS},
+    {"key": "tmj_noise_left_close", "step": 10, "kind": "choice", "options": NOISE_OPTIONS},
+    # STEP 11
+    {"key": "palpation_temporalis", "step": 11, "kind": "text"},
+    {"key": "palpation_medial_pterygoid", "step": 11, "kind": "text"},
+    {"key": "palpation_lateral_pterygoid", "step": 11, "kind": "text"},
+    {"key": "pain_mapping", "step": 11, "kind": "text"},
+    # STEP 12
+    {"key": "selected_ear_symptoms", "step": 12, "kind": "multi", "options": EAR_SYMPTOM_OPTIONS,
+     "summary_placeholder": "ear_symptoms"},
+    # STEP 13
+    {"key": "neck_none", "step": 13, "kind": "check", "report": False},
+    {"key": "neck_pain", "step": 13, "kind": "check", "report": False},
+    {"key": "shoulder_pain", "step": 13, "kind": "check", "report": False},
+    {"key": "stiffness", "step": 13, "kind": "check", "report": False},
+    {"key": "neck_shoulder_symptoms", "step": 13, "kind": "group"},
+    {"key": "additional_none", "step": 13, "kind": "check", "report": False},
+    {"key": "eye_pain", "step": 13, "kind": "check", "report": False},
+    {"key": "nose_pain", "step": 13, "kind": "check", "report": False},
+    {"key": "throat_pain", "step": 13, "kind": "check", "report": False},
+    {"key": "additional_symptoms", "step": 13, "kind": "group"},
+    {"key": "neck_trauma_radio", "step": 13, "kind": "choice", "options": YES_NO_OPTIONS,
+     "required": "목 외상 여부를 선택해주세요."},
+    # STEP 14
+    {"key": "stress_radio", "step": 14, "kind": "choice", "options": YES_NO_OPTIONS, "required": "스트레스 여부를 선택해주세요."},
+    {"key": "stress_detail", "step": 14, "kind": "text"},
+    # STEP 15
+    {"key": "ortho_exp", "step": 15, "kind": "choice", "options": YES_NO_OPTIONS,
+     "required": "교정치료 경험 여부를 선택해주세요."},
+    {"key": "ortho_detail", "step": 15, "kind": "text"},
+    {"key": "prosth_exp", "step": 15, "kind": "choice", "options": YES_NO_OPTIONS,
+     "required": "보철치료 경험 여부를 선택해주세요."},
+    {"key": "prosth_detail", "step": 15, "kind": "text"},
+    {"key": "other_dental", "step": 15, "kind": "text"},
+    {"key": "tmd_treatment_history", "step": 15, "kind": "choice", "options": YES_NO_OPTIONS,
+     "required": "턱관절 치료 경험 여부를 선택해주세요."},
+    {"key": "tmd_treatment_detail", "step": 15, "kind": "text"},
+    {"key": "tmd_treatment_response", "step": 15, "kind": "text"},
+    {"key": "tmd_current_medications", "step": 15, "kind": "text"},
+    # STEP 16
+    {"key": "past_history", "step": 16, "kind": "text"},
+    {"key": "current_medications", "step": 16, "kind": "text"},
+    # STEP 17
+    {"key": "bite_right", "step": 17, "kind": "choice", "options": PAIN_TEST_OPTIONS},
+    {"key": "bite_left", "step": 17, "kind": "choice", "options": PAIN_TEST_OPTIONS},
+    {"key": "loading_test", "step": 17, "kind": "choice", "options": PAIN_TEST_OPTIONS},
+    {"key": "resistance_test", "step": 17, "kind": "choice", "options": PAIN_TEST_OPTIONS},
+    {"key": "attrition", "step": 17, "kind": "choice", "options": ATTRITION_OPTIONS},
+    # STEP 18
+    {"key": "impact_daily", "step": 18, "kind": "choice", "options": IMPACT_DAILY_OPTIONS,
+     "required": "일상생활 영향 여부를 선택해주세요."},
+    {"key": "impact_work", "step": 18, "kind": "choice", "options": IMPACT_WORK_OPTIONS,
+     "required": "직장/학교 영향 여부를 선택해주세요."},
+    {"key": "impact_quality_of_life", "step": 18, "kind": "choice", "options": IMPACT_QUALITY_OF_LIFE_OPTIONS,
+     "required": "삶의 질 영향 여부를 선택해주세요."},
+    {"key": "sleep_quality", "step": 18, "kind": "choice", "options": SLEEP_QUALITY_OPTIONS,
+     "required": "수면의 질을 선택해주세요."},
+    {"key": "sleep_tmd_relation", "step": 18, "kind": "choice", "options": SLEEP_TMD_RELATION_OPTIONS,
+     "required": "수면과 턱관절 연관성 여부를 선택해주세요."},
+    # STEP 19
+    {"key": "diagnosis_result", "step": 19, "kind": "summary"},
+]
+
+
+def field_default(field):
+    """항목의 기본값 (summary/group 은 None)"""
+    return field.get("default", KIND_DEFAULTS.get(field["kind"]))
+
+
+# --- import 할 때 뽑아 두는 key 튜플 (streamlit 없이 쓰는 모듈용) ---
+FIELD_KEYS = tuple(field["key"] for field in FIELDS)
+# 예/아니오/선택 안 함 으로 답하는 항목 (답 기록에 답 코드로 저장)
+TRI_STATE_KEYS = tuple(field["key"] for field in FIELDS if field.get("options") == YES_NO_OPTIONS)
+# PDF 템플릿의 {key} 자리표시자에 채우는 항목
+REPORT_KEYS = tuple(field["key"] for field in FIELDS if field.get("report", True))
+# 체크박스 묶음 ({항목: 선택 여부}) 으로 저장되는 보고서 항목
+CHECKBOX_GROUP_KEYS = tuple(field["key"] for field in FIELDS if field["kind"] == "group" and field.get("report", True))
+# template2.txt 자리표시자 이름 → key (이름이 key 와 다른 항목만)
+SUMMARY_PLACEHOLDERS = {field["summary_placeholder"]: field["key"] for field in FIELDS if "summary_placeholder" in field}
+# 진단 입력 (diagnosis 위치 순서)과 세션 기본값
+DIAGNOSIS_FIELDS = sorted((field for field in FIELDS if "diagnosis" in field), key=lambda field: field["diagnosis"])
+DIAGNOSIS_DEFAULTS = {field["key"]: field_default(field) for field in DIAGNOSIS_FIELDS}
+
+
+def is_answered(value):
+    """답이 있는지 (None, 빈 글자, "선택 안 함", 빈 선택, 0, 체크 안 함은 답이 없는 것으로 봄)"""
+    if isinstance(value, str):
+        value = value.strip()
+        return value != "" and value != NOT_SELECTED
+    return bool(value)
+
+
+def compile_schema(fields=FIELDS):
+    """
+    FIELDS 를 앱 화면이 실행마다 쓰는 조회표(dict)로 바꿉니다.
+
+    - options / option_index: 항목 → 선택지, 항목 → {선택지: 위치}
+    - defaults: 항목 → 기본값 (summary/group 제외)
+    - step_defaults: 단계 → ((그 단계에서 답하는 항목, 기본값), ...) (summary/group 제외)
+    - required: 단계 → ((key, 경고, ((조건 key, 답 frozenset), ...)), ...)
+
+    항목 이름이 겹치거나, 기본값이 선택지에 없거나, when 이 없는 항목을 가리키면 ValueError.
+    """
+    keys = [field["key"] for field in fields]
+    duplicates = sorted({key for key in keys if keys.count(key) > 1})
+    if duplicates:
+        raise ValueError(f"답 항목 이름이 겹칩니다: {', '.join(duplicates)}")
+
+    options = {}
+    option_index = {}
+    defaults = {}
+    step_defaults = {}
+    required = {}
+    for field in fields:
+        key, kind = field["key"], field["kind"]
+        if kind not in KINDS:
+            raise ValueError(f"{key}: 알 수 없는 항목 종류입니다: {kind!r}")
+        if "options" in field:
+            options[key] = field["options"]
+            option_index[key] = {option: i for i, option in enumerate(field["options"])}
+        if kind in ("summary", "group"):
+            continue
+        defaults[key] = field_default(field)
+        if kind == "choice" and defaults[key] not in option_index[key]:
+            raise ValueError(f"{key}: 기본값이 선택지에 없습니다: {defaults[key]!r}")
+        step_defaults.setdefault(field["step"], []).append((key, defaults[key]))
+        if "required" in field:
+            for condition in field.get("when", {}):
+                if condition not in keys:
+                    raise ValueError(f"{key}: when 이 없는 항목을 가리킵니다: {condition!r}")
+            conditions = tuple((condition, frozenset(answers)) for condition, answers in field.get("when", {}).items())
+            required.setdefault(field["step"], []).append((key, field["required"], conditions))
+
+    return {
+        "fields": {field["key"]: field for field in fields},
+        "options": options,
+        "option_index": option_index,
+        "defaults": defaults,
+        "step_defaults": {step: tuple(step_defaults[step]) for step in step_defaults},
+        "required": {step: tuple(required[step]) for step in required},
+    }
+
+
+def missing_answers(schema, step, answers):
+    """step 의 필수 항목 중 아직 답하지 않은 항목 [(key, 경고), ...] (FIELDS 순서, when 조건이 맞는 항목만)"""
+    get = answers.get
+    return [
+        (key, message)
+        for key, message, conditions in schema["required"].get(step, ())
+        if all(get(condition) in values for condition, values in conditions) and not is_answered(get(key))
+    ]
@@ -0,0 +1,119 @@
+"""
+template2.txt 로 만드는 문진 요약 (plain text / HTML).
+
+서식 파일은 프로세스당 한 번만 CP949 로 읽어 글자 조각과 {key} 자리로 나눠 두고,
+요약을 만들 때는 값만 끼워 이어 붙이므로 PDF를 만들지 않고도 바로 보여줄 수 있습니다.
+"""
+import html
+import os
+import re
+import threading
+
+from questionnaire import SUMMARY_PLACEHOLDERS
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+
+LAYOUT_FILE = os.path.join(script_dir, "template2.txt")
+LAYOUT_ENCODING = "cp949"
+
+# template2.txt 의 자리표시자 이름이 REPORT_KEYS 와 다른 경우 (문진 스키마의 summary_placeholder)
+LAYOUT_KEY_ALIASES = SUMMARY_PLACEHOLDERS
+
+PLACEHOLDER_RE = re.compile(r"\{([^{}]+)\}")
+
+SUMMARY_CSS = (
+    "white-space: pre-wrap; font-family: 'NanumGothic', 'Malgun Gothic', sans-serif; "
+    "font-size: 0.9rem; line-height: 1.5;"
+)
+VALUE_CSS = "color: #1f3a93; font-weight: 600;"
+
+_layout_text = None
+_compiled = {}
+_lock = threading.Lock()
+
+
+def load_layout_text():
+    """template2.txt 를 한 번만 읽어 (&#8226; 같은 문자 참조를 풀고, 줄 끝을 \\n 으로) 돌려줍니다."""
+    global _layout_text
+    if _layout_text is None:
+        with _lock:
+            if _layout_text is None:
+                with open(LAYOUT_FILE, encoding=LAYOUT_ENCODING) as f:
+                    text = html.unescape(f.read())
+                lines = [line.rstrip() for line in text.splitlines()]
+                while lines and not lines[-1]:
+                    lines.pop()
+                _layout_text = "\n".join(lines) + "\n"
+    return _layout_text
+
+
+def split_placeholders(text):
+    """text 를 [글자 조각(str) 또는 (key,)] 목록으로 나눕니다 (key 는 REPORT_KEYS 이름)."""
+    parts = []
+    pos = 0
+    for m in PLACEHOLDER_RE.finditer(text):
+        if m.start() > pos:
+            parts.append(text[pos:m.start()])
+        key = m.group(1)
+        parts.append((LAYOUT_KEY_ALIASES.get(key, key),))
+        pos = m.end()
+    if pos < len(text):
+        parts.append(text[pos:])
+    return parts
+
+
+def compile_summary(fmt):
+    """
+    형식(fmt)별 요약 템플릿을 한 번만 만듭니다.
+
+    반환값은 (글자 조각 목록, [(조각 위치, key), ...]) 이며,
+    HTML 은 글자 조각을 미리 escape 해 둡니다.
+    """
+    compiled = _compiled.get(fmt)
+    if compiled is not None:
+        return compiled
+
+    text = load_layout_text()
+    with _lock:
+        compiled = _compiled.get(fmt)
+        if compiled is None:
+            pieces = []
+            slots = []
+            for part in split_placeholders(text):
+                if isinstance(part, str):
+                    pieces.append(html.escape(part, quote=False) if fmt == "html" else part)
+                else:
+                    slots.append((len(pieces), part[0]))
+                    pieces.append("")
+            compiled = (pieces, slots)
+            _compiled[fmt] = compiled
+    return compiled
+
+
+def render_summary_text(values):
+    """정리된 값(values)으로 template2.txt 서식의 plain text 요약을 만듭니다."""
+    pieces, slots = compile_summary("text")
+    pieces = pieces.copy()
+    for index, key in slots:
+        pieces[index] = values.get(key, "")
+    return "".join(pieces)
+
+
+def render_summary_html(values):
+    """render_summary_text 와 같은 내용을 화면에 바로 넣을 수 있는 HTML 조각으로 만듭니다."""
+    pieces, slots = compile_summary("html")
+    pieces = pieces.copy()
+    for index, key in slots:
+        value = values.get(key, "")
+        if value:
+            pieces[index] = f'<span style="{VALUE_CSS}">{html.escape(value, quote=False)}</span>'
+    return f'<div style="{SUMMARY_CSS}">{"".join(pieces)}</div>'
+
+
+def summary_document(values):
+    """다운로드용 독립 HTML 문서"""
+    return (
+        '<!DOCTYPE html>\n<html lang="ko">\n<head>\n<meta charset="utf-8">\n'
+        "<title>Temporomandibular Disorder Chart</title>\n</head>\n<body>\n"
+        f"{render_summary_html(values)}\n</body>\n</html>\n"
+    )
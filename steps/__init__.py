@@ -0,0 +1,20 @@
+"""
+문진 단계 화면.
+
+단계마다 steps/step_NN.py 모듈 하나가 render() 를 가지며, 모듈은 그 단계가 처음 필요할 때
+한 번만 import 됩니다 (이후 실행은 sys.modules 의 모듈을 그대로 씀).
+선택지 목록처럼 실행마다 같은 값은 단계 모듈의 모듈 변수로 두어 import 할 때 한 번만 만듭니다.
+모든 단계가 함께 쓰는 콜백과 이동 도우미는 steps.common 에 있습니다.
+"""
+import importlib
+
+STEP_COUNT = 20
+STEP_MODULES = {step: f"{__name__}.step_{step:02d}" for step in range(STEP_COUNT)}
+
+
+def load_step(step):
+    """step 번째 단계 모듈 (없는 단계면 None)"""
+    name = STEP_MODULES.get(step)
+    if name is None:
+        return None
+    return importlib.import_module(name)
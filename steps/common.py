@@ -0,0 +1,300 @@
+"""
+모든 단계 화면이 함께 쓰는 위젯 콜백, 답 입력 방식, 단계 이동 도우미.
+
+프로세스당 한 번만 import 되므로, 실행(세션)마다 달라지는 값은 모듈 변수가 아니라
+st.session_state 에 둡니다.
+"""
+import os
+
+import streamlit as st
+
+from questionnaire import compile_schema, missing_answers
+
+
+# 단계 이동 그래프: 단계 → (이전 단계, 다음 단계)
+# 다음 단계가 답에 따라 갈리는 단계는 다음 단계 자리에 STEP_BRANCHES 의 함수(답 기록 → 단계)를 씁니다.
+CHIEF_COMPLAINT_STEPS = {
+    "턱 주변의 통증(턱 근육, 관자놀이, 귀 앞쪽)": 3,
+    "턱 움직임 관련 두통": 3,
+    "턱관절 소리/잠김": 5,
+    "기타 불편한 증상": 6,
+}
+STEP_BRANCHES = {
+    # STEP 2: 주 호소에 따라 통증 양상(3) / 턱관절 소리(5) / 기타(6)
+    2: lambda answers: CHIEF_COMPLAINT_STEPS.get(answers.get("chief_complaint")),
+}
+STEP_GRAPH = {
+    0: (None, 1),
+    1: (0, 2),
+    2: (1, STEP_BRANCHES[2]),
+    3: (2, 4),
+    4: (3, 6),
+    5: (4, 6),
+    6: (2, 7),
+    7: (6, 8),
+    8: (7, 9),
+    9: (8, 10),
+    10: (9, 11),
+    11: (10, 12),
+    12: (11, 13),
+    13: (12, 14),
+    14: (13, 15),
+    15: (14, 16),
+    16: (15, 17),
+    17: (16, 18),
+    18: (17, 19),
+    19: (None, None),
+}
+
+
+def next_step(step):
+    """그래프에서 step 다음 단계 (갈림길이면 현재 답으로 고름, 갈 곳이 없으면 None)"""
+    following = STEP_GRAPH[step][1]
+    return following(st.session_state.answers) if callable(following) else following
+
+
+def go_to_step(step):
+    """
+    버튼 콜백에서 단계를 바꿉니다.
+    콜백 안에서는 st.rerun() 을 부르지 않습니다 (streamlit 1.63 미만에서는 콜백 안의 st.rerun() 이 무시됨).
+    버튼이 있던 단계 fragment 가 다시 실행되면서 단계가 바뀐 것을 보고 앱 전체를 다시 실행합니다
+    (app.step_fragment).
+    """
+    st.session_state.step = step
+    st.session_state.validation_errors = {} # 단계를 옮길 때 에러 초기화
+
+
+def leave_step(step, on_back=None):
+    """이전 단계 버튼 콜백 (on_back 은 돌아가기 전에 이 단계의 답을 지우는 함수)"""
+    if on_back is not None:
+        on_back()
+    go_to_step(STEP_GRAPH[step][0])
+
+
+def submit_step(step, validate=None):
+    """
+    다음 단계 버튼 콜백. validate() 가 돌려준 경고가 없으면 그래프의 다음 단계로 이동하고,
+    있으면 단계 화면에 보여줄 수 있게 step_warnings 에 남깁니다.
+    validate 가 없으면 문진 스키마의 필수 항목만 확인합니다 (required_warnings).
+    validate() 가 validation_errors 에 항목별 오류를 남긴 경우에도 이동하지 않습니다.
+    """
+    warnings = validate() if validate is not None else required_warnings(step)
+    if warnings or st.session_state.get("validation_errors"):
+        st.session_state.step_warnings = warnings
+        return
+    target = next_step(step)
+    if target is not None:
+        go_to_step(target)
+
+
+def restart_questionnaire():
+    """
+    처음으로 돌아가기: 세션의 모든 답을 지우고 STEP 0 부터 다시 시작합니다.
+    (go_to_step 처럼 단계 fragment 가 앱 전체를 다시 실행하고, 앱이 STEP 0 으로 세션을 새로 만듦)
+    """
+    for key in list(st.session_state.keys()):
+        del st.session_state[key]
+
+
+# --- 문진 스키마 ---
+@st.cache_resource(show_spinner=False)
+def questionnaire_schema():
+    """
+    문진 스키마(questionnaire.FIELDS)의 조회표 (questionnaire.compile_schema).
+    프로세스당 한 번 만들어 모든 세션이 함께 쓰므로 고치지 않고 읽기만 합니다.
+    """
+    return compile_schema()
+
+
+def required_warnings(step):
+    """step 의 필수 항목 중 아직 답하지 않은 항목의 경고 (스키마 순서)"""
+    return [message for _, message in missing_answers(questionnaire_schema(), step, st.session_state.answers)]
+
+
+def init_step_answers(step):
+    """아직 답하지 않은 step 의 항목에 스키마의 기본값을 넣습니다 (답에 따라 숨는 질문도 답을 갖도록)."""
+    answers = st.session_state.answers
+    for key, default in questionnaire_schema()["step_defaults"][step]:
+        answers.setdefault(key, default)
+
+
+def clear_step_answers(step):
+    """이전 단계 버튼의 on_back: step 에서 답하는 항목을 답 기록에서 지웁니다."""
+    answers = st.session_state.answers
+    for key, _ in questionnaire_schema()["step_defaults"][step]:
+        answers.pop(key, None)
+
+
+# --- 답 위젯 ---
+# 답 위젯의 key 는 답 기록(st.session_state.answers, answers.AnswerRecord)의 항목 이름과 같습니다.
+# 위젯을 그릴 때의 값은 답 기록에서 가져오고, 값이 바뀌면 on_change 콜백이 답 기록에 씁니다.
+# 위젯 값(st.session_state[key])은 그 단계 화면이 떠 있는 동안만 있고, 답은 답 기록에만 남습니다.
+# 기본값과 선택지는 문진 스키마에서 가져옵니다.
+def store_answer(key):
+    """답 위젯의 기본 on_change: 위젯 값을 답 기록에 씁니다."""
+    st.session_state.answers[key] = st.session_state[key]
+
+
+def bind_value(key, on_change=store_answer):
+    """
+    text_input / text_area / checkbox / slider / date_input 을 답 기록의 key 항목에 묶는 인자
+    (**bind_value(...) 로 넘김). 아직 답이 없으면 스키마의 기본값을 답으로 저장하므로, 화면에 보이는 값이 곧 답입니다.
+    """
+    value = st.session_state.answers.setdefault(key, questionnaire_schema()["defaults"][key])
+    return {"key": key, "value": value, **answer_callback(on_change, (key,))}
+
+
+def bind_choice(key, on_change=store_answer):
+    """
+    radio / selectbox 용 bind_value (options 도 함께 넘김).
+    저장된 답이 선택지에 없으면 스키마의 기본값을 고릅니다.
+    """
+    schema = questionnaire_schema()
+    answers = st.session_state.answers
+    positions = schema["option_index"][key]
+    index = positions.get(answers.setdefault(key, schema["defaults"][key]))
+    if index is None:
+        default = answers[key] = schema["defaults"][key]
+        index = positions[default]
+    return {"key": key, "options": schema["options"][key], "index": index, **answer_callback(on_change, (key,))}
+
+
+def store_option(key, option, widget_key):
+    """여러 개 고르는 답(key)의 체크박스 콜백: 체크하면 option 을 넣고 풀면 뺍니다 (선택지 순서로 저장)."""
+    answers = st.session_state.answers
+    selected = set(answers.get(key, ()))
+    if st.session_state[widget_key]:
+        selected.add(option)
+    else:
+        selected.discard(option)
+    answers[key] = [choice for choice in questionnaire_schema()["options"][key] if choice in selected]
+
+
+def bind_option(key, option, widget_key):
+    """
+    여러 개 고르는 답(key)의 선택지 option 하나를 checkbox 에 묶는 인자 (**bind_option(...) 으로 넘김).
+    답은 콜백(store_option)에서 고치므로, batched 모드에서도 단계 버튼의 validate() 가 새 답을 봅니다.
+    """
+    return {
+        "key": widget_key,
+        "value": option in st.session_state.answers.get(key, ()),
+        **answer_callback(store_option, (key, option, widget_key)),
+    }
+
+
+HEADACHE_DETAIL_KEYS = ("headache_areas", "headache_severity", "headache_frequency", "headache_triggers", "headache_reliefs")
+
+
+def update_has_headache(key):
+    store_answer(key)
+    if st.session_state[key] != "예":
+        # 두통이 '예'가 아니면 모든 관련 답을 초기화
+        for detail in HEADACHE_DETAIL_KEYS:
+            st.session_state.answers.pop(detail, None)
+
+
+# '목/어깨 증상': '없음'과 개별 증상은 함께 고를 수 없음
+NECK_SYMPTOM_KEYS = ("neck_pain", "shoulder_pain", "stiffness")
+
+
+def update_neck_none(key):
+    store_answer(key)
+    if st.session_state[key]:
+        for symptom in NECK_SYMPTOM_KEYS:
+            st.session_state[symptom] = st.session_state.answers[symptom] = False
+
+
+def update_neck_symptom(key):
+    store_answer(key)
+    if st.session_state[key]:
+        st.session_state["neck_none"] = st.session_state.answers["neck_none"] = False
+
+
+# 추가 증상: '없음' 체크 시 나머지 선택 해제, 개별 항목 체크 시 '없음' 해제
+ADDITIONAL_SYMPTOM_KEYS = ("eye_pain", "nose_pain", "throat_pain")
+
+
+def update_additional_none(key):
+    store_answer(key)
+    if st.session_state[key]:
+        for symptom in ADDITIONAL_SYMPTOM_KEYS:
+            st.session_state[symptom] = st.session_state.answers[symptom] = False
+
+
+def update_additional_symptom(key):
+    store_answer(key)
+    if st.session_state[key]:
+        st.session_state["additional_none"] = st.session_state.answers["additional_none"] = False
+
+
+# 답 입력 방식 (TMJ_INPUT_MODE)
+# live: 답을 바꿀 때마다 바로 반영 (위젯마다 서버 왕복 1회)
+# batched: 단계마다 st.form 으로 묶어 이전/다음 버튼을 누를 때 한 번에 반영 (단계마다 서버 왕복 1회)
+INPUT_LIVE = "live"
+INPUT_BATCHED = "batched"
+INPUT_MODES = (INPUT_LIVE, INPUT_BATCHED)
+
+
+def default_input_mode():
+    """배포 환경에서 TMJ_INPUT_MODE 로 고른 답 입력 방식 (기본: live)."""
+    mode = os.environ.get("TMJ_INPUT_MODE") or INPUT_LIVE
+    if mode not in INPUT_MODES:
+        raise ValueError(f"TMJ_INPUT_MODE 는 {', '.join(INPUT_MODES)} 중 하나여야 합니다: {mode!r}")
+    return mode
+
+
+batched_input = default_input_mode() == INPUT_BATCHED
+# batched 모드에서 현재 단계 화면이 미뤄 둔 위젯 콜백 [(callback, args), ...] 을 두는 세션 키
+DEFERRED_CALLBACKS_KEY = "_deferred_callbacks"
+
+
+def reset_deferred_callbacks():
+    """단계 화면을 그리기 전에 부릅니다 (콜백은 그 화면의 단계 버튼에만 걸림)."""
+    st.session_state[DEFERRED_CALLBACKS_KEY] = []
+
+
+def answer_callback(callback, args=()):
+    """
+    답 위젯의 on_change 인자 (**answer_callback(...) 으로 넘김).
+    form 안의 위젯은 콜백을 가질 수 없으므로 batched 모드에서는 미뤄 두었다가
+    단계 버튼(step_button)을 누를 때 같은 순서로 실행합니다.
+    """
+    if not batched_input:
+        return {"on_change": callback, "args": args}
+    st.session_state[DEFERRED_CALLBACKS_KEY].append((callback, args))
+    return {}
+
+
+def run_deferred_callbacks(callbacks, on_click=None, args=()):
+    for callback, callback_args in callbacks:
+        callback(*callback_args)
+    if on_click is not None:
+        on_click(*args)
+
+
+def step_button(label, on_click=None, args=()):
+    """
+    이전/다음 단계 버튼. batched 모드에서는 단계 form 의 제출 버튼이며,
+    미뤄 둔 콜백을 버튼의 on_click 보다 먼저 실행하므로 (다음 실행 전, 위젯이 만들어지기 전)
+    버튼 콜백에서는 live 모드와 같은 세션 상태를 봅니다.
+    """
+    if not batched_input:
+        return st.button(label, on_click=on_click, args=args)
+    return st.form_submit_button(
+        label, on_click=run_deferred_callbacks, args=(tuple(st.session_state[DEFERRED_CALLBACKS_KEY]), on_click, args)
+    )
+
+
+def step_navigation(step, validate=None, on_back=None, back_label="이전 단계", next_label="다음 단계로 이동 👉"):
+    """
+    단계 화면 아래의 이전/다음 버튼.
+    이동은 버튼 콜백(leave_step / submit_step)에서 STEP_GRAPH 를 따라 하며,
+    다음 단계로 가지 못한 이유(validate() 의 경고)는 다음 버튼 아래에 한 번 보여줍니다.
+    """
+    col1, col2 = st.columns(2)
+    with col1:
+        step_button(back_label, on_click=leave_step, args=(step, on_back))
+    with col2:
+        step_button(next_label, on_click=submit_step, args=(step, validate))
+        for warning in st.session_state.pop("step_warnings", []):
+            st.warning(warning)
@@ -0,0 +1,56 @@
+"""STEP 0: Welcome Page (새로 추가된 단계)"""
+import os
+
+import streamlit as st
+
+from steps.common import go_to_step, next_step
+
+# 답 위젯이 없는 단계 (batched 모드에서도 form 으로 묶지 않음)
+INPUTS = False
+
+
+def render():
+    st.header("✨ 당신의 턱관절 건강, 지금 바로 확인하세요!")
+    st.write("""
+    이 시스템은 턱관절 건강 상태를 스스로 점검하고, 잠재적인 문제를 조기에 파악할 수 있도록 설계되었습니다.
+    간단한 몇 단계의 설문을 통해, 맞춤형 예비 진단 결과를 받아보세요.
+    """)
+
+    st.markdown("---")
+
+    col_intro1, col_intro2, col_intro3 = st.columns(3)
+    with col_intro1:
+        st.info("**🚀 신속한 검사:** 짧은 시간 안에 주요 증상 확인")
+    with col_intro2:
+        st.info("**📊 직관적인 결과:** 시각적으로 이해하기 쉬운 진단 요약")
+    with col_intro3:
+        st.info("**📝 보고서 생성:** 개인 맞춤형 PDF 보고서 제공")
+    st.markdown("---")
+    with st.expander("시작하기 전에 꼭 읽어주세요!"):
+        st.markdown("""
+        * 본 시스템은 **의료 진단을 대체하지 않습니다.** 정확한 진단과 치료는 반드시 전문 의료기관을 방문하시기 바랍니다.
+        * 제공된 모든 정보는 **익명으로 처리**되며, 개인 정보 보호를 최우선으로 합니다.
+        * 솔직하게 답변해주시면 더욱 정확한 예비 진단 결과를 얻을 수 있습니다.
+        """)
+
+    if 'show_exercise' not in st.session_state:
+       st.session_state.show_exercise = False
+
+    if not st.session_state.show_exercise:
+        # 버튼 key 이름을 'btn_show_exercise' 같이 다르게 설정
+        if st.button("턱관절 운동 안내 보기", key="btn_show_exercise"):
+            st.session_state.show_exercise = True
+    else:
+        exercise_img_path = "tmj_exercise.png"
+        if os.path.exists(exercise_img_path):
+            st.image(exercise_img_path, use_container_width=True)
+        else:
+            st.warning(f"운동 안내 이미지({exercise_img_path})를 찾을 수 없습니다.")
+
+        # 닫기 버튼도 key 이름 변경
+        if st.button("운동 안내 닫기", key="btn_hide_exercise"):
+            st.session_state.show_exercise = False
+
+
+    st.markdown("---")
+    st.button("문진 시작하기 🚀", use_container_width=True, on_click=go_to_step, args=(next_step(0),))
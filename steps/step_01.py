@@ -0,0 +1,52 @@
+"""STEP 1: 환자 정보 입력"""
+import datetime
+
+import streamlit as st
+
+from questionnaire import missing_answers
+from steps.common import bind_choice, bind_value, questionnaire_schema, step_navigation
+
+
+def render():
+    st.header("📝 환자 기본 정보 입력")
+    st.write("정확한 문진을 위해 필수 정보를 입력해주세요. (*표시는 필수 항목입니다.)")
+
+    with st.container(border=True):
+        col_name, col_birthdate = st.columns(2)
+        with col_name:
+            st.text_input("이름*", placeholder="이름을 입력하세요", **bind_value("name"))
+            if 'name' in st.session_state.get("validation_errors", {}):
+                st.error(st.session_state.validation_errors['name'])
+
+        with col_birthdate:
+            st.date_input("생년월일*", min_value=datetime.date(1900, 1, 1),
+                          **bind_value("birthdate"))
+
+        st.radio("성별*", horizontal=True, **bind_choice("gender"))
+        if 'gender' in st.session_state.get("validation_errors", {}):
+            st.error(st.session_state.validation_errors['gender'])
+
+        col_email, col_phone = st.columns(2)
+        with col_email:
+            st.text_input("이메일*", placeholder="예: user@example.com", **bind_value("email"))
+            if 'email' in st.session_state.get("validation_errors", {}):
+                st.error(st.session_state.validation_errors['email'])
+
+        with col_phone:
+            st.text_input("연락처*", placeholder="예: 01012345678 (숫자만 입력)", **bind_value("phone"))
+            if 'phone' in st.session_state.get("validation_errors", {}):
+                st.error(st.session_state.validation_errors['phone'])
+
+        st.markdown("---")
+        st.text_input("주소 (선택 사항)", placeholder="도로명 주소 또는 지번 주소", **bind_value("address"))
+        st.text_input("직업 (선택 사항)", placeholder="직업을 입력하세요", **bind_value("occupation"))
+        st.text_area("내원 목적 (선택 사항)", placeholder="예: 턱에서 소리가 나고 통증이 있어서 진료를 받고 싶습니다.",
+                     **bind_value("visit_reason"))
+
+    def validate():
+        # 유효성 검사 (오류는 각 입력칸 아래에 표시)
+        st.session_state.validation_errors = dict(missing_answers(questionnaire_schema(), 1, st.session_state.answers))
+        return []
+
+    st.markdown("---")
+    step_navigation(1, validate=validate)
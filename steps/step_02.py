@@ -0,0 +1,34 @@
+"""STEP 2: 주호소"""
+import streamlit as st
+
+from steps.common import bind_choice, bind_value, step_navigation
+
+
+def render():
+    st.title("주 호소 (Chief Complaint)")
+    st.markdown("---")
+    answers = st.session_state.answers
+
+    with st.container(border=True):
+        st.markdown("**이번에 병원을 방문한 주된 이유는 무엇인가요?**")
+        st.radio(
+            label="",
+            label_visibility="collapsed",
+            **bind_choice("chief_complaint")
+        )
+
+        if answers.get("chief_complaint") == "기타 불편한 증상":
+            st.text_input("기타 사유를 적어주세요:", **bind_value("chief_complaint_other"))
+        else:
+            answers["chief_complaint_other"] = ""
+
+        st.markdown("---")
+        st.markdown("**문제가 처음 발생한 시기가 어떻게 되나요?**")
+        st.radio(
+            label="",
+            label_visibility="collapsed",
+            **bind_choice("onset")
+        )
+
+    st.markdown("---")
+    step_navigation(2)
@@ -0,0 +1,31 @@
+"""STEP 3: 통증 양상"""
+from functools import partial
+
+import streamlit as st
+
+from steps.common import bind_choice, clear_step_answers, step_navigation
+
+
+def render():
+    st.title("현재 증상 (통증 양상)")
+    st.markdown("---")
+
+    with st.container(border=True):
+        st.markdown("**턱을 움직이거나 씹기, 말하기 등의 기능 또는 악습관(이갈이, 턱 괴기 등)으로 인해 통증이 악화되나요?**")
+        st.radio(
+            label="악화 여부",
+            label_visibility="collapsed",
+            **bind_choice("jaw_aggravation")
+        )
+
+        st.markdown("---")
+        st.markdown("**통증을 어떻게 표현하시겠습니까? (예: 둔함, 날카로움, 욱신거림 등)**")
+        st.radio(
+            label="통증 양상",
+            label_visibility="collapsed",
+            **bind_choice("pain_quality")
+        )
+
+
+    st.markdown("---")
+    step_navigation(3, on_back=partial(clear_step_answers, 3))
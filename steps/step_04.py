@@ -0,0 +1,73 @@
+"""STEP 4: 통증 부위"""
+from functools import partial
+
+import streamlit as st
+
+from questionnaire import NOT_SELECTED
+from steps.common import bind_choice, clear_step_answers, init_step_answers, step_navigation
+
+
+def render():
+    st.title("현재 증상 (통증 분류 및 검사)")
+    st.markdown("---")
+    answers = st.session_state.answers
+
+    # 답 초기화
+    init_step_answers(4)
+
+    # UI
+    with st.container(border=True):
+        st.markdown("**아래 중 해당되는 통증 유형을 선택해주세요.**")
+        st.selectbox("", **bind_choice("pain_types_value"))
+
+        st.markdown("---")
+        pain_type = answers["pain_types_value"]
+
+        if pain_type in ["넓은 부위의 통증", "근육 통증"]:
+            st.markdown("#### 💬 근육/넓은 부위 관련")
+            st.markdown("**입을 벌릴 때나 턱을 움직일 때 통증이 있나요?**")
+            st.radio("", **bind_choice("muscle_movement_pain_value"))
+
+            st.markdown("**근육을 2초간 눌렀을 때 통증이 느껴지나요?**")
+            st.radio("", **bind_choice("muscle_pressure_2s_value"))
+
+            if answers["muscle_pressure_2s_value"] == "예":
+                st.markdown("**근육을 5초간 눌렀을 때, 통증이 눌린 부위 넘어서 퍼지나요?**")
+                st.radio("", **bind_choice("muscle_referred_pain_value"))
+
+                if answers["muscle_referred_pain_value"] == "예":
+                    st.markdown("**통증이 눌린 부위 외 다른 곳(눈, 귀 등)까지 퍼지나요?**")
+                    st.radio("", **bind_choice("muscle_referred_remote_pain_value"))
+                else:
+                    answers["muscle_referred_remote_pain_value"] = NOT_SELECTED
+            else:
+                answers["muscle_referred_pain_value"] = NOT_SELECTED
+                answers["muscle_referred_remote_pain_value"] = NOT_SELECTED
+
+        elif pain_type == "턱관절 통증":
+            st.markdown("#### 💬 턱관절 관련")
+            st.markdown("**입을 벌릴 때나 움직일 때 통증이 있나요?**")
+            st.radio("", **bind_choice("tmj_movement_pain_value"))
+
+            st.markdown("**턱관절 부위를 눌렀을 때 기존 통증이 재현되나요?**")
+            st.radio("", **bind_choice("tmj_press_pain_value"))
+
+        elif pain_type == "두통":
+            st.markdown("#### 💬 두통 관련")
+            st.markdown("**두통이 관자놀이 부위에서 발생하나요?**")
+            st.radio("", **bind_choice("headache_temples_value"))
+
+            st.markdown("**관자놀이 근육을 눌렀을 때 기존 두통이 재현되나요?**")
+            st.radio("", **bind_choice("headache_reproduce_by_pressure_value"))
+
+            st.markdown("**턱을 움직일 때 두통이 심해지나요?**")
+            st.radio("", **bind_choice("headache_with_jaw_value"))
+
+            if answers["headache_with_jaw_value"] == "예":
+                st.markdown("**해당 두통이 다른 의학적 진단으로 설명되지 않나요?**")
+                st.radio("", **bind_choice("headache_not_elsewhere_value"))
+            else:
+                answers["headache_not_elsewhere_value"] = NOT_SELECTED
+
+    st.markdown("---")
+    step_navigation(4, on_back=partial(clear_step_answers, 4))
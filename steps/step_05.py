@@ -0,0 +1,89 @@
+"""STEP 5: 턱관절 소리 및 잠김"""
+from functools import partial
+
+import streamlit as st
+
+from questionnaire import NOT_SELECTED
+from steps.common import bind_choice, bind_option, clear_step_answers, init_step_answers, questionnaire_schema, required_warnings, step_navigation
+
+
+def render():
+    st.title("현재 증상 (턱관절 소리 및 잠김 증상)")
+    st.markdown("---")
+    answers = st.session_state.answers
+
+    init_step_answers(5)
+
+    st.markdown("**턱에서 나는 소리가 있나요?**")
+    st.radio(
+        "턱에서 나는 소리를 선택하세요.",
+        **bind_choice("tmj_sound_value")
+    )
+
+    if answers["tmj_sound_value"] == "딸깍소리":
+        st.markdown("**딸깍 소리가 나는 상황을 모두 선택하세요.**")
+        for option in questionnaire_schema()["options"]["tmj_click_context"]:
+            st.checkbox(f"- {option}", **bind_option("tmj_click_context", option, f"click_{option}"))
+
+    elif answers["tmj_sound_value"] == "사각사각소리(크레피투스)":
+        st.radio(
+            "**사각사각소리가 확실하게 느껴지나요?**",
+            **bind_choice("crepitus_confirmed_value")
+        )
+
+    show_lock_questions = (
+        answers["tmj_sound_value"] == "사각사각소리(크레피투스)" and
+        answers["crepitus_confirmed_value"] == "아니오"
+    )
+
+    if show_lock_questions:
+        st.markdown("---")
+        st.radio(
+            "**현재 턱이 걸려서 입이 잘 안 벌어지는 증상이 있나요?**",
+            **bind_choice("jaw_locked_now_value")
+        )
+
+        if answers["jaw_locked_now_value"] == "예":
+            st.radio(
+                "**해당 증상은 조작해야 풀리나요?**",
+                **bind_choice("jaw_unlock_possible_value")
+            )
+        elif answers["jaw_locked_now_value"] == "아니오":
+            st.radio(
+                "**과거에 턱 잠김 또는 개방성 잠김을 경험한 적이 있나요?**",
+                **bind_choice("jaw_locked_past_value")
+            )
+            if answers["jaw_locked_past_value"] == "예":
+                st.radio(
+                    "**입을 최대한 벌렸을 때 (MAO), 손가락 3개가 들어가나요?**",
+                    **bind_choice("mao_fits_3fingers_value")
+                )
+            else:
+                answers["mao_fits_3fingers_value"] = NOT_SELECTED
+        else:
+            answers["jaw_unlock_possible_value"] = NOT_SELECTED
+            answers["jaw_locked_past_value"] = NOT_SELECTED
+            answers["mao_fits_3fingers_value"] = NOT_SELECTED
+    else:
+        answers["jaw_locked_now_value"] = NOT_SELECTED
+        answers["jaw_unlock_possible_value"] = NOT_SELECTED
+        answers["jaw_locked_past_value"] = NOT_SELECTED
+        answers["mao_fits_3fingers_value"] = NOT_SELECTED
+
+    if answers["tmj_sound_value"] != "딸깍소리":
+        answers["tmj_click_context"] = []
+
+    def validate():
+        answers = st.session_state.answers
+        if answers["tmj_sound_value"] != "딸깍소리":
+            answers["tmj_click_context"] = []
+
+        # 딸깍소리 문맥 요약 정리 (PDF용, batched 모드에서는 화면을 다시 그리기 전이므로 여기서 만듦)
+        answers["tmj_click_summary"] = (
+            ", ".join(answers["tmj_click_context"])
+            if answers["tmj_click_context"] else "해당 없음"
+        )
+        return required_warnings(5)
+
+    st.markdown("---")
+    step_navigation(5, validate=validate, on_back=partial(clear_step_answers, 5))
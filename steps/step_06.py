@@ -0,0 +1,81 @@
+"""STEP 6: 빈도 및 시기, 강도"""
+import streamlit as st
+
+from questionnaire import FIELD_KEYS
+from steps.common import bind_choice, bind_option, bind_value, questionnaire_schema, required_warnings, step_navigation, update_has_headache
+
+TIME_OPTIONS = [
+    {"key": "morning", "label": "오전"},
+    {"key": "afternoon", "label": "오후"},
+    {"key": "evening", "label": "저녁"},
+]
+# 주호소 질문으로 돌아갈 때 지우는 답 (통증/두통/빈도/시간대 관련 항목)
+CLEARED_ON_BACK = tuple(
+    key for key in FIELD_KEYS if any(part in key for part in ("jaw_", "pain_", "frequency", "time_", "headache"))
+)
+
+
+def render():
+    st.title("현재 증상 (빈도 및 시기)")
+    st.markdown("---")
+    answers = st.session_state.answers
+    options = questionnaire_schema()["options"]
+
+    with st.container(border=True):
+        st.markdown("**통증 또는 다른 증상이 얼마나 자주 발생하나요?**")
+        st.radio("", **bind_choice("frequency_choice"))
+
+
+        st.markdown("---")
+        st.markdown("**(통증이 있을 시) 현재 통증 정도는 어느 정도인가요? (0=없음, 10=극심한 통증)**")
+        st.slider("통증 정도 선택", 0, 10, **bind_value("pain_level"))
+
+        st.markdown("---")
+        st.markdown("**주로 어느 시간대에 발생하나요?**")
+        for opt in TIME_OPTIONS:
+            st.checkbox(label=opt["label"], **bind_value(f"time_{opt['key']}"))
+
+        st.markdown("---")
+        st.markdown("**두통이 있나요?**")
+        st.radio("", **bind_choice("has_headache_now", on_change=update_has_headache))
+
+        if answers.get("has_headache_now") == "예":
+            st.markdown("---")
+            st.markdown("**두통 부위를 모두 선택해주세요.**")
+            for area in options["headache_areas"]:
+                st.checkbox(area, **bind_option("headache_areas", area, f"headache_area_{area}"))
+
+
+            st.markdown("**현재 두통 강도는 얼마나 되나요? (0=없음, 10=극심한 통증)**")
+            st.slider("두통 강도", 0, 10, **bind_value("headache_severity"))
+
+
+            st.markdown("**두통 빈도는 얼마나 자주 발생하나요?**")
+            st.radio("", **bind_choice("headache_frequency"))
+
+            st.markdown("**두통을 유발하거나 악화시키는 요인이 있나요? (복수 선택 가능)**")
+            for trig in options["headache_triggers"]:
+                st.checkbox(trig, **bind_option("headache_triggers", trig, f"trigger_{trig}"))
+
+
+            st.markdown("**두통을 완화시키는 요인이 있나요? (복수 선택 가능)**")
+            for rel in options["headache_reliefs"]:
+                st.checkbox(rel, **bind_option("headache_reliefs", rel, f"relief_{rel}"))
+
+
+    def clear_answers():
+        answers = st.session_state.answers
+        for key in CLEARED_ON_BACK:
+            answers.pop(key, None)
+
+    def validate():
+        answers = st.session_state.answers
+        errors = required_warnings(6)
+        if not any(answers.get(f"time_{opt['key']}", False) for opt in TIME_OPTIONS):
+            errors.append("시간대 항목을 입력하거나 선택해주세요.")
+        selected_times = [opt['label'] for opt in TIME_OPTIONS if answers.get(f"time_{opt['key']}", False)]
+        answers["selected_times"] = ", ".join(selected_times)
+        return errors
+
+    st.markdown("---")
+    step_navigation(6, validate=validate, on_back=clear_answers, back_label="이전 단계(주호소 질문으로)")
@@ -0,0 +1,75 @@
+"""STEP 7: 습관"""
+import streamlit as st
+
+from steps.common import bind_option, bind_value, questionnaire_schema, step_navigation
+
+FIRST_HABITS = {
+    "이갈이 - 밤(수면 중)": "habit_bruxism_night",
+    "이 악물기 - 낮": "habit_clenching_day",
+    "이 악물기 - 밤(수면 중)": "habit_clenching_night"
+}
+
+
+def render():
+    st.title("습관 (Habits)")
+    st.markdown("---")
+    answers = st.session_state.answers
+
+    with st.container(border=True):
+        st.markdown("**다음 중 해당되는 습관이 있나요?**")
+
+        # 없음 체크박스
+        st.checkbox("없음", **bind_value("habit_none"))
+
+        none_checked = answers["habit_none"]
+
+        for label, key in FIRST_HABITS.items():
+            st.checkbox(label, disabled=none_checked, **bind_value(key))
+
+        st.markdown("---")
+        st.markdown("**다음 중 해당되는 습관이 있다면 모두 선택해주세요.**")
+
+        for habit in questionnaire_schema()["options"]["selected_habits"]:
+            widget_key = f"habit_{habit.replace(' ', '_').replace('(', '').replace(')', '').replace('/', '_').replace('-', '_').replace('.', '').replace(':', '')}_widget"
+            st.checkbox(habit, **bind_option("selected_habits", habit, widget_key))
+
+    def validate():
+        answers = st.session_state.answers
+
+        # 습관 요약 생성
+        first_habit_labels = {
+            "habit_bruxism_night": "이갈이 (밤)",
+            "habit_clenching_day": "이 악물기 (낮)",
+            "habit_clenching_night": "이 악물기 (밤)",
+        }
+
+        first_selected = []
+
+        if answers.get("habit_none"):
+            first_selected.append("없음")
+        else:
+            for key, label in first_habit_labels.items():
+                if answers.get(key):
+                    first_selected.append(label)
+
+        habit_summary = ", ".join(first_selected) if first_selected else "없음"
+        selected_habits = answers.get("selected_habits", ())
+        additional_summary = ", ".join(selected_habits) if selected_habits else "없음"
+
+        answers["habit_summary"] = habit_summary
+        answers["additional_habits"] = additional_summary
+        answers["full_habit_summary"] = f"주요 습관: {habit_summary}\n기타 습관: {additional_summary}"
+
+        has_first = any([
+            answers.get("habit_bruxism_night", False),
+            answers.get("habit_clenching_day", False),
+            answers.get("habit_clenching_night", False),
+            answers.get("habit_none", False)
+        ])
+
+        if not has_first:
+            return ["‘이갈이/이 악물기/없음’ 중에서 최소 한 가지를 선택해주세요."]
+        return []
+
+    st.markdown("---")
+    step_navigation(7, validate=validate)
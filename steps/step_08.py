@@ -0,0 +1,37 @@
+"""STEP 8: 턱 운동 범위 및 관찰1 (Range of Motion & Observations)"""
+import streamlit as st
+
+from steps.common import bind_choice, bind_value, step_navigation
+
+
+def render():
+    st.title("턱 운동 범위 및 관찰 (Range of Motion & Observations)")
+    st.markdown("---")
+    st.markdown(
+        "<span style='color:red;'>아래 항목은 실제 측정 및 검사가 필요할 수 있으며, 가능하신 부분만 기입해 주시면 됩니다. 나머지는 진료 중 확인할 수 있습니다.</span>",
+        unsafe_allow_html=True
+    )
+
+    with st.container(border=True):
+        # ⬛ 자발적 개구
+        st.markdown("---")
+        st.subheader("자발적 개구 (Active Opening)")
+
+        st.markdown("**스스로 입을 크게 벌렸을 때 어느 정도까지 벌릴 수 있나요? (의료진이 측정 후 기록)**")
+        st.text_input(label="", label_visibility="collapsed", **bind_value("active_opening"))
+
+        st.markdown("**통증이 있나요?**")
+        st.radio(label="", label_visibility="collapsed", **bind_choice("active_pain"))
+
+        # ⬛ 수동적 개구
+        st.markdown("---")
+        st.subheader("수동적 개구 (Passive Opening)")
+
+        st.markdown("**타인이 도와서 벌렸을 때 어느 정도까지 벌릴 수 있나요? (의료진이 측정 후 기록)**")
+        st.text_input(label="", label_visibility="collapsed", **bind_value("passive_opening"))
+
+        st.markdown("**통증이 있나요?**")
+        st.radio(label="", label_visibility="collapsed", **bind_choice("passive_pain"))
+
+    st.markdown("---")
+    step_navigation(8)
@@ -0,0 +1,55 @@
+"""STEP 9: 턱 운동 범위 및 관찰2 (Range of Motion & Observations)"""
+import streamlit as st
+
+from steps.common import bind_choice, bind_value, step_navigation
+
+
+def render():
+    st.title("턱 운동 범위 및 관찰 (Range of Motion & Observations)")
+    st.markdown("---")
+    st.markdown(
+        "<span style='color:red;'>아래 항목은 실제 측정 및 검사가 필요할 수 있으며, 가능하신 부분만 기입해 주시면 됩니다. 나머지는 진료 중 확인할 수 있습니다.</span>",
+        unsafe_allow_html=True
+    )
+    answers = st.session_state.answers
+
+    with st.container(border=True):
+        st.markdown("---")
+        st.subheader("턱 움직임 패턴 (Mandibular Movement Pattern)")
+        st.markdown("**입을 벌리고 닫을 때 턱이 한쪽으로 치우치는 것 같나요?**")
+        st.radio(label=" ", label_visibility="collapsed", **bind_choice("deviation"))
+        st.markdown("**편위(Deviation, 치우치지만 마지막에는 중앙으로 돌아옴)**")
+        st.radio(label=" ", label_visibility="collapsed", **bind_choice("deviation2"))
+        st.markdown("**편향(Deflection, 치우친 채 돌아오지 않음)**")
+        st.radio(label="편향(Deflection): 치우치고 돌아오지 않음", label_visibility="collapsed", **bind_choice("deflection"))
+
+        st.markdown("---")
+        st.markdown("**앞으로 내밀기(Protrusion) ______ mm (의료진이 측정 후 기록)**")
+        st.text_input(label="", label_visibility="collapsed", **bind_value("protrusion"))
+
+        st.radio("**Protrusion 시 통증 여부**", **bind_choice("protrusion_pain"))
+
+        st.markdown("---")
+        st.markdown("**측방운동(Laterotrusion) 오른쪽: ______ mm (의료진이 측정 후 기록)**")
+        st.text_input(label="", label_visibility="collapsed", **bind_value("latero_right"))
+
+        st.radio("**Laterotrusion 오른쪽 통증 여부**", **bind_choice("latero_right_pain"))
+
+        st.markdown("---")
+        st.markdown("**측방운동(Laterotrusion) 왼쪽: ______ mm (의료진이 측정 후 기록)**")
+        st.text_input(label="", label_visibility="collapsed", **bind_value("latero_left"))
+
+        st.radio("**Laterotrusion 왼쪽 통증 여부**", **bind_choice("latero_left_pain"))
+
+        st.markdown("---")
+        st.markdown("**교합(Occlusion): 앞니(위, 아래)가 정중앙에서 잘 맞물리나요?**")
+        st.radio(label="", label_visibility="collapsed", **bind_choice("occlusion"))
+
+        if answers.get("occlusion") == "아니오":
+            st.markdown("**정중앙이 어느 쪽으로 어긋나는지:**")
+            st.radio(label="", label_visibility="collapsed", **bind_choice("occlusion_shift"))
+        else:
+            answers["occlusion_shift"] = ""
+
+    st.markdown("---")
+    step_navigation(9)
@@ -0,0 +1,43 @@
+"""STEP 10: 턱 운동 범위 및 관찰3 (Range of Motion & Observations)"""
+import streamlit as st
+
+from steps.common import bind_choice, step_navigation
+
+
+def render():
+    st.title("턱 운동 범위 및 관찰 (Range of Motion & Observations)")
+    st.markdown("---")
+    st.markdown(
+        "<span style='color:red;'>아래 항목은 실제 측정 및 검사가 필요할 수 있으며, 가능하신 부분만 기입해 주시면 됩니다. 나머지는 진료 중 확인할 수 있습니다.</span>",
+        unsafe_allow_html=True
+    )
+
+    with st.container(border=True):
+        st.markdown("---")
+        st.subheader("턱관절 소리 (TMJ Noise)")
+
+        # 오른쪽 - 입 벌릴 때
+        st.markdown("**오른쪽 - 입 벌릴 때**")
+        st.radio(label="", label_visibility="collapsed", **bind_choice("tmj_noise_right_open"))
+
+
+        # 왼쪽 - 입 벌릴 때
+        st.markdown("---")
+        st.markdown("**왼쪽 - 입 벌릴 때**")
+        st.radio(label="", label_visibility="collapsed", **bind_choice("tmj_noise_left_open"))
+
+
+        # 오른쪽 - 입 다물 때
+        st.markdown("---")
+        st.markdown("**오른쪽 - 입 다물 때**")
+        st.radio(label="", label_visibility="collapsed", **bind_choice("tmj_noise_right_close"))
+
+
+        # 왼쪽 - 입 다물 때
+        st.markdown("---")
+        st.markdown("**왼쪽 - 입 다물 때**")
+        st.radio(label="", label_visibility="collapsed", **bind_choice("tmj_noise_left_close"))
+
+
+    st.markdown("---")
+    step_navigation(10)
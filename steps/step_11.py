@@ -0,0 +1,62 @@
+"""STEP 11: 근육 촉진 평가"""
+import os
+
+import streamlit as st
+
+from steps.common import bind_value, step_navigation
+
+# 이미지가 있는 앱(app.py) 디렉토리
+script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def render():
+    st.title("근육 촉진 평가")
+    st.markdown("---")
+
+    with st.container(border=True):
+        st.markdown(
+            "<span style='color:red;'>아래 항목은 검사가 필요한 항목으로, 진료 중 확인할 수 있습니다.</span>",
+            unsafe_allow_html=True
+        )
+        st.markdown("### 의료진 촉진 소견")
+
+        palpation_fields = [
+            ("측두근 촉진 소견", "palpation_temporalis"),
+            ("내측 익돌근 촉진 소견", "palpation_medial_pterygoid"),
+            ("외측 익돌근 촉진 소견", "palpation_lateral_pterygoid"),
+            ("통증 위치 매핑 (지도 또는 상세 설명)", "pain_mapping"),
+        ]
+
+        image_files_in_order = ["temporalis.jpg", "medial.jpg", "lateral.jpg"]
+
+        for idx, (label, key) in enumerate(palpation_fields):
+            st.markdown(f"**{label}**")
+
+            if idx < len(image_files_in_order):
+                # 1~3번째: 사진 + 가로 배치
+                col1, col2 = st.columns([1, 2])
+
+                with col1:
+                    img_path = os.path.join(script_dir, image_files_in_order[idx])
+                    if os.path.exists(img_path):
+                        st.image(img_path, width=300)
+
+                with col2:
+                    st.text_area(
+                        label=label,
+                        placeholder="검사가 필요한 항목입니다.",
+                        label_visibility="collapsed",
+                        height=300,  # 사진과 높이 맞춤
+                        **bind_value(key)
+                    )
+            else:
+                # 마지막: 기본 입력창만
+                st.text_area(
+                    label=label,
+                    placeholder="검사가 필요한 항목입니다.",
+                    label_visibility="collapsed",
+                    **bind_value(key)
+                )
+
+    st.markdown("---")
+    step_navigation(11)
@@ -0,0 +1,68 @@
+"""STEP 12: 귀 관련 증상"""
+import streamlit as st
+
+from steps.common import answer_callback, questionnaire_schema, step_navigation
+
+
+# 없음 체크 박스
+def toggle_ear_symptom_none():
+    answers = st.session_state.answers
+    if st.session_state.ear_symptom_none:
+        answers["selected_ear_symptoms"] = ["없음"]
+    else:
+        answers["selected_ear_symptoms"] = [s for s in answers["selected_ear_symptoms"] if s != "없음"]
+
+
+def toggle_ear_symptom(symptom):
+    answers = st.session_state.answers
+    selected = list(answers["selected_ear_symptoms"])
+    if st.session_state.get(f"ear_symptom_{symptom}"):
+        if symptom not in selected:
+            selected.append(symptom)
+    elif symptom in selected:
+        selected.remove(symptom)
+    answers["selected_ear_symptoms"] = selected
+
+
+def render():
+    st.title("귀 관련 증상")
+    st.markdown("---")
+    answers = st.session_state.answers
+
+    with st.container(border=True):
+        st.markdown("**다음 중 귀와 관련된 증상이 있으신가요?**")
+
+        # 상태 초기화
+        answers.setdefault("selected_ear_symptoms", [])
+
+        st.checkbox(
+            "없음",
+            key="ear_symptom_none",
+            value="없음" in answers["selected_ear_symptoms"],
+            **answer_callback(toggle_ear_symptom_none)
+        )
+
+        disabled = "없음" in answers["selected_ear_symptoms"]
+
+        # 체크박스 렌더링
+        for symptom in questionnaire_schema()["options"]["selected_ear_symptoms"]:
+            st.checkbox(
+                symptom,
+                key=f"ear_symptom_{symptom}",
+                value=symptom in answers["selected_ear_symptoms"],
+                disabled=disabled,
+                **answer_callback(toggle_ear_symptom, (symptom,))
+            )
+
+
+    # 이전/다음 버튼
+    def validate():
+        symptoms = st.session_state.answers.get("selected_ear_symptoms", [])
+        if not symptoms:
+            return ["귀 관련 증상을 한 가지 이상 선택하거나 '없음'을 선택해주세요."]
+        if "없음" in symptoms and len(symptoms) > 1:
+            return ["'없음'과 다른 증상을 동시에 선택할 수 없습니다. 다시 확인해주세요."]
+        return []
+
+    st.markdown("---")
+    step_navigation(12, validate=validate)
@@ -0,0 +1,80 @@
+"""STEP 13: 경추/목/어깨 관련 증상"""
+import streamlit as st
+
+from steps.common import bind_choice, bind_value, required_warnings, step_navigation, update_additional_none, update_additional_symptom, update_neck_none, update_neck_symptom
+
+
+def render():
+    st.title("경추/목/어깨 관련 증상")
+    st.markdown("---")
+    answers = st.session_state.answers
+
+    with st.container(border=True):
+        st.markdown("**다음 중의 증상이 있으신가요?**")
+
+        # '없음' 체크박스
+        st.checkbox("없음", **bind_value("neck_none", on_change=update_neck_none))
+
+        # 개별 증상 체크박스 (없음이 체크된 경우 disabled 처리)
+        disabled_neck = answers["neck_none"]
+        st.checkbox("목 통증", disabled=disabled_neck, **bind_value("neck_pain", on_change=update_neck_symptom))
+        st.checkbox("어깨 통증", disabled=disabled_neck, **bind_value("shoulder_pain", on_change=update_neck_symptom))
+        st.checkbox("뻣뻣함(강직감)", disabled=disabled_neck, **bind_value("stiffness", on_change=update_neck_symptom))
+
+
+    st.markdown("---")
+    with st.container(border=True):
+        st.markdown("**다음 중 해당되는 증상이 있다면 모두 선택해주세요. (복수 선택 가능)**")
+
+        # '없음' 체크박스
+        st.checkbox("없음", **bind_value("additional_none", on_change=update_additional_none))
+
+        # '없음'이 체크되면 나머지 항목 disabled
+        disabled_additional = answers["additional_none"]
+        st.checkbox("눈 통증", disabled=disabled_additional, **bind_value("eye_pain", on_change=update_additional_symptom))
+        st.checkbox("코 통증", disabled=disabled_additional, **bind_value("nose_pain", on_change=update_additional_symptom))
+        st.checkbox("목구멍 통증", disabled=disabled_additional, **bind_value("throat_pain", on_change=update_additional_symptom))
+
+
+    st.markdown("---")
+    with st.container(border=True):
+        st.markdown("**목 외상 관련 이력이 있으신가요?**")
+
+        st.radio(
+            label="",
+            **bind_choice("neck_trauma_radio"),
+            label_visibility="collapsed"
+        )
+
+
+    def validate():
+        answers = st.session_state.answers
+
+        # 요약 저장 (batched 모드에서는 화면을 다시 그리기 전이므로 여기서 만듦)
+        answers["neck_shoulder_symptoms"] = {
+            "목 통증": answers["neck_pain"],
+            "어깨 통증": answers["shoulder_pain"],
+            "뻣뻣함(강직감)": answers["stiffness"],
+        }
+        answers["additional_symptoms"] = {
+            "없음": answers["additional_none"],
+            "눈 통증": answers["eye_pain"],
+            "코 통증": answers["nose_pain"],
+            "목구멍 통증": answers["throat_pain"],
+        }
+        symptoms_selected = answers.get('neck_none', False) or \
+                             answers.get('neck_pain', False) or \
+                             answers.get('shoulder_pain', False) or \
+                             answers.get('stiffness', False)
+
+        if answers.get('neck_none', False) and (
+            answers.get('neck_pain', False) or
+            answers.get('shoulder_pain', False) or
+            answers.get('stiffness', False)
+        ):
+            return ["'없음'과 다른 증상을 동시에 선택할 수 없습니다. 다시 확인해주세요."]
+        if not symptoms_selected:
+            return ["증상에서 최소 하나를 선택하거나 '없음'을 체크해주세요."]
+        return required_warnings(13)
+
+    step_navigation(13, validate=validate)
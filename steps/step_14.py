@@ -0,0 +1,31 @@
+"""STEP 14: 정서적 스트레스 이력"""
+import streamlit as st
+
+from steps.common import bind_choice, bind_value, step_navigation
+
+
+def render():
+    st.title("정서적 스트레스 이력")
+    st.markdown("---")
+
+    with st.container(border=True):
+        st.markdown("**스트레스, 불안, 우울감 등을 많이 느끼시나요?**")
+
+        st.radio(
+            label="",
+            **bind_choice("stress_radio"),
+            label_visibility="collapsed"
+        )
+
+        st.markdown("---")
+        st.markdown("**있다면 간단히 기재해 주세요:**")
+
+        st.text_area(
+            label="",
+            **bind_value("stress_detail"),
+            placeholder="예: 최근 업무 스트레스, 가족 문제 등",
+            label_visibility="collapsed"
+        )
+
+    st.markdown("---")
+    step_navigation(14)
@@ -0,0 +1,65 @@
+"""STEP 15: 과거 치과적 이력 (Past Dental History)"""
+import streamlit as st
+
+from steps.common import bind_choice, bind_value, step_navigation
+
+
+def render():
+    st.title("과거 치과적 이력 (Past Dental History)")
+    st.markdown("---")
+    answers = st.session_state.answers
+
+    with st.container(border=True):
+        # 교정치료 경험
+        st.markdown("**교정치료(치아 교정) 경험**")
+        st.radio(
+            "",
+            **bind_choice("ortho_exp"),
+            label_visibility="collapsed"
+        )
+
+        st.text_input("예라면 언제, 얼마나 받았는지 적어주세요:", **bind_value("ortho_detail"))
+
+
+        st.markdown("---")
+
+        # 보철치료 경험
+        st.markdown("**보철치료(의치, 브리지, 임플란트 등) 경험**")
+        st.radio(
+            "",
+            **bind_choice("prosth_exp"),
+            label_visibility="collapsed"
+        )
+
+
+        st.text_input("예라면 어떤 치료였는지 적어주세요:", **bind_value("prosth_detail"))
+        st.markdown("---")
+
+        # 기타 치과 치료
+        st.markdown("**기타 치과 치료 이력 (주요 치과 시술, 수술 등)**")
+        st.text_area(
+            "",
+            **bind_value("other_dental"),
+            label_visibility="collapsed"
+        )
+
+        st.markdown("---")
+
+        # 턱관절 치료 이력
+        st.markdown("**이전에 턱관절 질환 치료를 받은 적 있나요?**")
+        st.radio(
+            "",
+            **bind_choice("tmd_treatment_history"),
+            label_visibility="collapsed"
+        )
+        if answers["tmd_treatment_history"] == "예":
+            st.text_input("어떤 치료를 받으셨나요?", **bind_value("tmd_treatment_detail"))
+            st.text_input("해당 치료에 대한 반응(효과나 문제점 등):", **bind_value("tmd_treatment_response"))
+            st.text_input("현재 복용 중인 턱관절 관련 약물이 있다면 입력해주세요:", **bind_value("tmd_current_medications"))
+        else:
+            answers["tmd_treatment_detail"] = ""
+            answers["tmd_treatment_response"] = ""
+            answers["tmd_current_medications"] = ""
+
+    st.markdown("---")
+    step_navigation(15)
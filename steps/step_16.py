@@ -0,0 +1,30 @@
+"""STEP 16: 과거 의과적 이력 (Past Medical History)"""
+import streamlit as st
+
+from steps.common import bind_value, step_navigation
+
+
+def render():
+    st.title("과거 의과적 이력 (Past Medical History)")
+    st.markdown("---")
+
+    with st.container(border=True):
+
+        st.markdown("**과거에 앓았던 질환, 입원 등 주요 의학적 이력이 있다면 적어주세요:**")
+        st.text_area(
+            label="",
+            **bind_value("past_history"),
+            label_visibility="collapsed"
+        )
+
+
+        st.markdown("---")
+        st.markdown("**현재 복용 중인 약이 있다면 적어주세요:**")
+        st.text_area(
+            label="",
+            **bind_value("current_medications"),
+            label_visibility="collapsed"
+        )
+
+    st.markdown("---")
+    step_navigation(16)
@@ -0,0 +1,57 @@
+"""STEP 17: 자극 검사"""
+import streamlit as st
+
+from steps.common import bind_choice, step_navigation
+
+
+def render():
+    st.title("자극 검사 (Provocation Tests)")
+    st.markdown("---")
+
+    st.markdown(
+        "<span style='color:red;'>아래 항목은 실제 측정 및 검사가 필요할 수 있으며, 가능하신 부분만 기입해 주시면 됩니다.</span>",
+        unsafe_allow_html=True
+    )
+
+    with st.container(border=True):
+        st.markdown("**오른쪽으로 어금니를 강하게 물 때:**")
+        st.radio(
+            label="",
+            **bind_choice("bite_right"),
+            label_visibility="collapsed"
+        )
+
+        st.markdown("---")
+        st.markdown("**왼쪽으로 어금니를 강하게 물 때:**")
+        st.radio(
+            label="",
+            **bind_choice("bite_left"),
+            label_visibility="collapsed"
+        )
+
+        st.markdown("---")
+        st.markdown("**압력 가하기 (Loading Test):**")
+        st.radio(
+            label="",
+            **bind_choice("loading_test"),
+            label_visibility="collapsed"
+        )
+
+        st.markdown("---")
+        st.markdown("**저항 검사 (Resistance Test, 턱 움직임 막기):**")
+        st.radio(
+            label="",
+            **bind_choice("resistance_test"),
+            label_visibility="collapsed"
+        )
+
+        st.markdown("---")
+        st.markdown("**치아 마모 (Attrition)**")
+        st.radio(
+            label="",
+            **bind_choice("attrition"),
+            label_visibility="collapsed"
+        )
+
+    st.markdown("---")
+    step_navigation(17)
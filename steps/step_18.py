@@ -0,0 +1,51 @@
+"""STEP 18: 기능 평가"""
+import streamlit as st
+
+from steps.common import bind_choice, step_navigation
+
+
+def render():
+    st.title("기능 평가 (Functional Impact)")
+    st.markdown("---")
+
+    with st.container(border=True):
+        st.markdown("**턱관절 증상으로 인해 일상생활(음식 섭취, 말하기, 하품 등)에 불편함을 느끼시나요?**")
+        st.radio(
+            label="일상생활 영향",
+            **bind_choice("impact_daily"),
+            label_visibility="collapsed"
+        )
+
+        st.markdown("---")
+        st.markdown("**턱관절 증상으로 인해 직장 업무나 학업 성과에 영향을 받은 적이 있나요?**")
+        st.radio(
+            label="직장/학교 영향",
+            **bind_choice("impact_work"),
+            label_visibility="collapsed"
+        )
+
+        st.markdown("---")
+        st.markdown("**턱관절 증상이 귀하의 전반적인 삶의 질에 얼마나 영향을 미치고 있다고 느끼시나요?**")
+        st.radio(
+            label="삶의 질 영향",
+            **bind_choice("impact_quality_of_life"),
+            label_visibility="collapsed"
+        )
+
+        st.markdown("---")
+        st.markdown("**최근 2주간 수면의 질은 어떠셨나요?**")
+        st.radio(
+            label="수면 질",
+            **bind_choice("sleep_quality"),
+            label_visibility="collapsed"
+        )
+
+        st.markdown("**수면의 질이 턱관절 증상(통증, 근육 경직 등)에 영향을 준다고 느끼시나요?**")
+        st.radio(
+            label="수면과 턱관절 질환 연관성",
+            **bind_choice("sleep_tmd_relation"),
+            label_visibility="collapsed"
+        )
+
+    st.markdown("---")
+    step_navigation(18, next_label="제출 👉")
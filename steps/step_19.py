@@ -0,0 +1,31 @@
+"""STEP 19: 결과"""
+import streamlit as st
+
+from diagnosis import compute_diagnoses, dc_tmd_explanations
+from steps.common import restart_questionnaire
+
+# 답 위젯이 없는 단계 (batched 모드에서도 form 으로 묶지 않음)
+INPUTS = False
+
+
+def render():
+    st.title("📊 턱관절 질환 예비 진단 결과")
+    st.markdown("---")
+    answers = st.session_state.answers
+    results = compute_diagnoses(answers)
+    answers["diagnosis_result"] = ", ".join(results) if results else "진단 없음"
+    if not results:
+        st.success("✅ DC/TMD 기준상 명확한 진단 근거는 확인되지 않았습니다.\n\n다른 질환 가능성에 대한 조사가 필요합니다.")
+    else:
+        answers["diagnosis_result"] = ", ".join(results)
+        if len(results) == 1:
+            st.error(f"**{results[0]}**이(가) 의심됩니다.")
+        else:
+            st.error(f"**{', '.join(results)}**이(가) 의심됩니다.")
+        st.markdown("---")
+        for diagnosis in results:
+            st.markdown(f"### 🔹 {diagnosis}")
+            st.info(dc_tmd_explanations.get(diagnosis, "설명 없음"))
+            st.markdown("---")
+    st.info("※ 본 결과는 예비 진단이며, 전문의 상담을 반드시 권장합니다.")
+    st.button("처음으로 돌아가기", use_container_width=True, on_click=restart_questionnaire)
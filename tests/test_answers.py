@@ -0,0 +1,86 @@
+"""answers.AnswerRecord: 예/아니오 항목의 코드 저장, MutableMapping 동작, pickle 왕복을 확인합니다."""
+import os
+import pickle
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from answers import ANSWER_KEYS, TRI_STATE_KEYS, VALUE_KEYS, AnswerRecord  # noqa: E402
+from diagnosis import ANSWER_NO, ANSWER_OTHER, ANSWER_YES  # noqa: E402
+from questionnaire import NOT_SELECTED  # noqa: E402
+
+TRI_STATE_KEY = "muscle_pressure_2s_value"
+VALUE_KEY = "name"
+
+
+def test_keys_are_split_by_kind():
+    assert TRI_STATE_KEY in TRI_STATE_KEYS
+    assert VALUE_KEY in VALUE_KEYS
+    assert ANSWER_KEYS == TRI_STATE_KEYS + VALUE_KEYS
+
+
+@pytest.mark.parametrize("answer, code", [("예", ANSWER_YES), ("아니오", ANSWER_NO), (NOT_SELECTED, ANSWER_OTHER)])
+def test_tri_state_stored_as_code(answer, code):
+    answers = AnswerRecord({TRI_STATE_KEY: answer})
+
+    assert getattr(answers, TRI_STATE_KEY) == code
+    assert answers[TRI_STATE_KEY] == answer
+    assert answers.get(TRI_STATE_KEY) == answer
+
+
+def test_tri_state_rejects_other_answers():
+    answers = AnswerRecord()
+    with pytest.raises(ValueError):
+        answers[TRI_STATE_KEY] = "모름"
+    assert TRI_STATE_KEY not in answers
+
+
+def test_missing_key():
+    answers = AnswerRecord()
+
+    for key in (TRI_STATE_KEY, VALUE_KEY, "no_such_key"):
+        with pytest.raises(KeyError):
+            answers[key]
+        assert answers.get(key) is None
+        assert answers.get(key, "기본") == "기본"
+        assert key not in answers
+    assert answers.setdefault(VALUE_KEY, "홍길동") == "홍길동"
+    with pytest.raises(KeyError):
+        answers["no_such_key"] = "값"
+
+
+def test_del():
+    answers = AnswerRecord({TRI_STATE_KEY: "예", VALUE_KEY: "홍길동"})
+
+    del answers[TRI_STATE_KEY]
+    del answers[VALUE_KEY]
+
+    assert len(answers) == 0
+    assert getattr(answers, TRI_STATE_KEY) is None
+    with pytest.raises(KeyError):
+        del answers[VALUE_KEY]
+    assert answers.pop(VALUE_KEY, "없음") == "없음"
+
+
+def test_iteration_follows_answer_keys():
+    values = {VALUE_KEY: "홍길동", "selected_habits": ["코골이"], TRI_STATE_KEY: "아니오", "jaw_aggravation": "예"}
+    answers = AnswerRecord(values)
+
+    assert list(answers) == [key for key in ANSWER_KEYS if key in values]
+    assert len(answers) == len(values)
+    assert answers["selected_habits"] == ("코골이",)
+    assert dict(answers) == {**values, "selected_habits": ("코골이",)}
+
+
+def test_pickle_round_trip():
+    answers = AnswerRecord({TRI_STATE_KEY: "예", VALUE_KEY: "홍길동", "selected_habits": ["코골이", "껌 씹기"]})
+
+    assert answers.__getstate__() == tuple(getattr(answers, key) for key in ANSWER_KEYS)
+    restored = pickle.loads(pickle.dumps(answers))
+
+    assert type(restored) is AnswerRecord
+    assert dict(restored) == dict(answers)
+    assert getattr(restored, TRI_STATE_KEY) == ANSWER_YES
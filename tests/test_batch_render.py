@@ -0,0 +1,29 @@
+"""batch_render 의 입력 처리: 읽을 수 없는 줄은 그 줄만 실패로 남기고, 워커 수는 1 이상."""
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from batch_render import main, read_records  # noqa: E402
+
+
+def test_read_records_reports_bad_lines(tmp_path):
+    path = tmp_path / "records.jsonl"
+    path.write_text('{"name": "a"}\n{bad json\n\n[1, 2]\n{"name": "b"}\n', encoding="utf-8")
+
+    rows = list(read_records(path))
+
+    assert [(line_no, record) for line_no, record, error in rows if not error] == [(1, {"name": "a"}), (5, {"name": "b"})]
+    errors = {line_no: error for line_no, record, error in rows if error}
+    assert sorted(errors) == [2, 4]
+    assert errors[2].startswith("JSONDecodeError")
+
+
+@pytest.mark.parametrize("jobs", ["0", "-1", "x"])
+def test_jobs_must_be_positive(tmp_path, jobs):
+    with pytest.raises(SystemExit) as exit_info:
+        main([str(tmp_path / "records.jsonl"), "-o", str(tmp_path), "--jobs", jobs])
+    assert exit_info.value.code == 2
@@ -0,0 +1,80 @@
+"""
+새 워커 프로세스의 콜드 스타트 예산: 앱 첫 실행(AppTest, 0단계)이 1300 ms, 최대 RSS 80 MB 안이어야 하고
+보고서를 만들 때까지 미루는 무거운 모듈(PyMuPDF, reportlab)은 아직 import 되지 않아야 합니다.
+
+매번 새 파이썬 프로세스에서 streamlit import 부터 첫 실행이 끝날 때까지를 재고, 중앙값을 예산과 비교합니다.
+"""
+import json
+import logging
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "app.py")
+
+# 보고서를 만들 때까지 미루는 무거운 모듈 (첫 실행에 있으면 안 됨)
+DEFERRED_MODULES = ("fitz", "pymupdf", "reportlab")
+
+MAX_START_MS = 1300
+MAX_START_RSS_MB = 80
+REPEAT = 3
+
+
+def peak_rss_mb():
+    """
+    이 프로세스의 최대 RSS (MB).
+
+    Linux 에서는 /proc 의 VmHWM 을 씁니다. ru_maxrss 는 fork/exec 를 거쳐도 부모(pytest)의 값을 물려받기 때문입니다.
+    그 밖에서는 ru_maxrss 를 씁니다 (단위는 macOS 에서 byte, 그 외 KB).
+    """
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def cold_start():
+    """새 프로세스 안에서 실행: 앱 첫 실행을 재서 dict 로 돌려줍니다."""
+    start = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP, default_timeout=120)
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return {
+        "start_ms": (time.perf_counter() - start) * 1000,
+        "start_rss_mb": peak_rss_mb(),
+        "deferred": [name for name in DEFERRED_MODULES if name in sys.modules],
+    }
+
+
+def measure():
+    """cold_start() 를 새 파이썬 프로세스에서 한 번 실행한 결과"""
+    out = subprocess.run([sys.executable, os.path.abspath(__file__)],
+                         check=True, capture_output=True, text=True, cwd=ROOT)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def test_cold_start_budget():
+    runs = [measure() for _ in range(REPEAT)]
+
+    assert sorted({name for r in runs for name in r["deferred"]}) == []
+    start_ms = statistics.median(r["start_ms"] for r in runs)
+    start_rss = statistics.median(r["start_rss_mb"] for r in runs)
+    assert start_ms <= MAX_START_MS, f"첫 실행 시간 {start_ms:.1f} ms > {MAX_START_MS} ms"
+    assert start_rss <= MAX_START_RSS_MB, f"첫 실행 RSS {start_rss:.1f} MB > {MAX_START_RSS_MB} MB"
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)  # 앱의 빈 label 경고 등은 측정과 무관
+    print(json.dumps(cold_start()))
@@ -0,0 +1,187 @@
+"""
+진단 규칙: 대표 답변에서 compute_diagnoses 와 규칙 엔진(evaluate)이 예전 if 문 진단과 같은 결과를 내는지,
+미리 계산한 진단 표가 규칙과 같은 값을 갖고 규칙이 바뀌면 거부되는지,
+실시간(증분) 진단이 전체 평가와 같은지 확인합니다.
+"""
+import copy
+import logging
+import os
+import random
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from answers import AnswerRecord  # noqa: E402
+import diagnosis  # noqa: E402
+from diagnosis import (  # noqa: E402
+    ANSWER_NO,
+    DIAGNOSIS_INPUT_KEYS,
+    DIAGNOSIS_RULES,
+    INPUT_CODE_TABLES,
+    INPUT_RADICES,
+    TABLE_FILE,
+    answer_index,
+    compile_rules,
+    compute_diagnoses,
+    diagnosis_labels,
+    encode_answers,
+    evaluate,
+    load_table,
+    pack_table,
+    rules_fingerprint,
+    state_index,
+    unpack_table,
+    update_diagnosis,
+)
+
+LOCAL_MYALGIA = "국소 근육통 (Local Myalgia)"
+MYOFASCIAL = "방사성 근막통 (Myofascial Pain with Referral)"
+MYALGIA = "근육통 (Myalgia)"
+ARTHRALGIA = "관절통 (Arthralgia)"
+HEADACHE = "TMD에 기인한 두통 (Headache attributed to TMD)"
+DJD = "퇴행성 관절 질환 (Degenerative Joint Disease)"
+DDWOR = "비정복성 관절원판 변위, 개구 제한 없음 (Disc Displacement without Reduction)"
+DDWOR_LIMITED = "비정복성 관절원판 변위, 개구 제한 동반 (Disc Displacement without Reduction with Limited opening)"
+DDWR_LOCKING = "정복성 관절원판 변위, 간헐적 개구 장애 동반 (Disc Displacement with reduction, with intermittent locking)"
+DDWR = "정복성 관절원판 변위 (Disc Displacement with Reduction)"
+
+# (답변, 기대 진단 목록), 기대값은 규칙을 표로 옮기기 전 compute_diagnoses 의 if 문 순서 그대로
+CASES = {
+    "empty": ({}, []),
+    "not_selected": ({
+        "muscle_pressure_2s_value": "선택 안 함", "tmj_press_pain_value": "선택 안 함",
+        "tmj_sound_value": "선택 안 함",
+    }, []),
+    "local_myalgia": ({
+        "muscle_pressure_2s_value": "예", "muscle_referred_pain_value": "예",
+        "muscle_referred_remote_pain_value": "아니오",
+    }, [LOCAL_MYALGIA]),
+    "myofascial": ({
+        "muscle_pressure_2s_value": "예", "muscle_referred_pain_value": "예",
+        "muscle_referred_remote_pain_value": "예",
+    }, [MYOFASCIAL]),
+    "myalgia_no_pressure": ({"muscle_pressure_2s_value": "아니오"}, [MYALGIA]),
+    "myalgia_no_referral": ({
+        "muscle_pressure_2s_value": "예", "muscle_referred_pain_value": "아니오",
+    }, [MYALGIA]),
+    "pressure_without_referral_answer": ({"muscle_pressure_2s_value": "예"}, []),
+    "arthralgia_and_crepitus": ({
+        "tmj_press_pain_value": "예", "tmj_sound_value": "사각사각소리(크레피투스)",
+        "crepitus_confirmed_value": "예",
+    }, [ARTHRALGIA, DJD]),
+    "headache_with_jaw": ({
+        "headache_with_jaw_value": "예", "headache_temples_value": "예",
+        "headache_reproduce_by_pressure_value": "예", "headache_not_elsewhere_value": "예",
+    }, [HEADACHE]),
+    "headache_with_jaw_elsewhere": ({
+        "headache_with_jaw_value": "예", "headache_temples_value": "예",
+        "headache_reproduce_by_pressure_value": "예", "headache_not_elsewhere_value": "아니오",
+    }, []),
+    "headache_without_jaw": ({
+        "headache_with_jaw_value": "아니오", "headache_temples_value": "예",
+        "headache_reproduce_by_pressure_value": "예",
+    }, [HEADACHE]),
+    "mao_fits": ({"mao_fits_3fingers_value": "예"}, [DDWOR]),
+    "mao_limited": ({"mao_fits_3fingers_value": "아니오"}, [DDWOR_LIMITED]),
+    "locked_unlock_no": ({"jaw_locked_now_value": "예", "jaw_unlock_possible_value": "아니오"}, [DDWOR_LIMITED]),
+    "locked_unlock_yes": ({"jaw_locked_now_value": "예", "jaw_unlock_possible_value": "예"}, [DDWR_LOCKING]),
+    "click": ({"tmj_sound_value": "딸깍소리"}, [DDWR]),
+    "sound_none": ({"tmj_sound_value": "없음"}, []),
+    "many": ({
+        "muscle_pressure_2s_value": "예", "muscle_referred_pain_value": "아니오",
+        "tmj_press_pain_value": "예", "headache_with_jaw_value": "아니오",
+        "headache_temples_value": "예", "headache_reproduce_by_pressure_value": "예",
+        "tmj_sound_value": "딸깍소리", "mao_fits_3fingers_value": "아니오",
+    }, [MYALGIA, ARTHRALGIA, HEADACHE, DDWOR_LIMITED, DDWR]),
+}
+
+
+@pytest.mark.parametrize("answers, expected", CASES.values(), ids=CASES.keys())
+def test_compute_diagnoses_matches_rules(answers, expected):
+    assert compute_diagnoses(answers) == expected
+    assert diagnosis_labels(evaluate(encode_answers(answers))) == expected
+    assert compute_diagnoses(AnswerRecord(answers)) == expected
+
+
+def test_unless_must_point_to_earlier_rule():
+    rules = [dict(rule) for rule in DIAGNOSIS_RULES]
+    rules.insert(0, rules.pop(2))  # myalgia 를 국소/방사성 앞으로
+
+    with pytest.raises(ValueError, match="unless"):
+        compile_rules(rules)
+
+
+def test_table_matches_rules():
+    table = load_table()
+    assert table is not None, f"{TABLE_FILE} 를 읽을 수 없습니다"
+    for answers, _ in CASES.values():
+        assert table[state_index(answers)] == evaluate(encode_answers(answers))
+
+    rng = random.Random(16)
+    for _ in range(5000):
+        codes = tuple(rng.randrange(radix) for radix in INPUT_RADICES)
+        assert table[answer_index(codes)] == evaluate(codes), codes
+
+
+@pytest.fixture
+def table_blob():
+    with open(TABLE_FILE, "rb") as f:
+        return f.read()
+
+
+@pytest.fixture
+def changed_rules(monkeypatch):
+    """관절통 규칙의 답 코드를 바꾼 규칙 (진단 표의 지문과 맞지 않게 됨)"""
+    rules = copy.deepcopy(DIAGNOSIS_RULES)
+    rules[3]["when"] = [{"tmj_press_pain_value": ANSWER_NO}]
+    fingerprint = rules_fingerprint()
+    monkeypatch.setattr(diagnosis, "DIAGNOSIS_RULES", rules)
+    assert rules_fingerprint() != fingerprint
+    return rules
+
+
+def test_table_round_trip(table_blob):
+    table = unpack_table(table_blob)
+    assert unpack_table(pack_table(table)) == table
+
+
+def test_table_rejected_when_rules_change(table_blob, changed_rules):
+    with pytest.raises(ValueError, match="규칙"):
+        unpack_table(table_blob)
+
+
+def test_stale_table_falls_back_to_rules(monkeypatch, caplog, changed_rules):
+    monkeypatch.setattr(diagnosis, "_table", None)
+    monkeypatch.setattr(diagnosis, "_table_loaded", False)
+
+    with caplog.at_level(logging.WARNING, logger="diagnosis"):
+        assert load_table() is None
+    assert "규칙을 직접 평가" in caplog.text
+    answers, expected = CASES["many"]
+    assert compute_diagnoses(answers) == expected
+
+
+def test_table_rejects_other_format(table_blob):
+    with pytest.raises(ValueError, match="형식"):
+        unpack_table(b"XXXX" + table_blob[4:])
+
+
+def test_update_diagnosis_matches_evaluate():
+    rng = random.Random(18)
+    choices = {key: [*table, "선택 안 함", None] for key, table in INPUT_CODE_TABLES}
+    state = {}
+    memo = update_diagnosis(None, state)
+    assert memo["mask"] == evaluate(encode_answers(state))
+
+    for _ in range(3000):
+        # 한 번에 답 1~3개를 바꾸며 진행 (같은 값으로 바뀌어 그대로인 경우 포함)
+        for key in rng.sample(DIAGNOSIS_INPUT_KEYS, rng.randint(1, 3)):
+            state[key] = rng.choice(choices[key])
+        previous = memo
+        memo = update_diagnosis(memo, state)
+        assert memo["mask"] == evaluate(encode_answers(state)), state
+        if memo["codes"] == previous["codes"]:
+            assert memo is previous
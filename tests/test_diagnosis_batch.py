@@ -0,0 +1,47 @@
+"""diagnosis_batch: 무작위 답변 묶음에서 열 단위 진단이 diagnosis.evaluate 와 같은지 확인합니다."""
+import os
+import random
+import sys
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from diagnosis import (  # noqa: E402
+    DIAGNOSIS_BITS,
+    DIAGNOSIS_INPUT_KEYS,
+    INPUT_CODE_TABLES,
+    INPUT_RADICES,
+    answer_index,
+    encode_answers,
+    evaluate,
+)
+from diagnosis_batch import diagnose_columns, diagnosis_masks, encode_records, table_indices  # noqa: E402
+
+N = 2000
+
+
+def random_records(rng, n):
+    """진단 입력마다 표의 답, "선택 안 함", 빈 값 중 하나를 고른 기록 n 건"""
+    choices = {key: [*table, "선택 안 함", None] for key, table in INPUT_CODE_TABLES}
+    return [{key: rng.choice(choices[key]) for key in DIAGNOSIS_INPUT_KEYS} for _ in range(n)]
+
+
+def test_diagnose_columns_matches_evaluate():
+    records = random_records(random.Random(17), N)
+    expected = [evaluate(encode_answers(record)) for record in records]
+
+    results = diagnose_columns(encode_records(records))
+
+    for name, bit in DIAGNOSIS_BITS.items():
+        assert results[name].tolist() == [bool(mask & bit) for mask in expected], name
+
+
+def test_code_matrix_matches_evaluate():
+    rng = np.random.default_rng(17)
+    matrix = np.stack([rng.integers(0, radix, N) for radix in INPUT_RADICES], axis=1).astype(np.int8)
+    rows = [tuple(int(code) for code in row) for row in matrix]
+
+    assert diagnosis_masks(matrix).tolist() == [evaluate(codes) for codes in rows]
+    assert table_indices(matrix).tolist() == [answer_index(codes) for codes in rows]
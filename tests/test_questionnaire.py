@@ -0,0 +1,123 @@
+"""문진 스키마: 단계마다 필수/선택 항목, 기본값을 답이 없는 것으로 보는지, missing_answers 의 when 조건을 확인합니다."""
+import datetime
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from questionnaire import FIELDS, NOT_SELECTED, compile_schema, is_answered, missing_answers  # noqa: E402
+
+SCHEMA = compile_schema()
+
+# 단계 → 필수 항목 (when 조건이 있는 항목 포함, FIELDS 순서)
+REQUIRED = {
+    1: ["name", "gender", "email", "phone"],
+    2: ["chief_complaint", "chief_complaint_other", "onset"],
+    3: ["jaw_aggravation", "pain_quality"],
+    4: ["pain_types_value", "muscle_movement_pain_value", "muscle_pressure_2s_value", "muscle_referred_pain_value",
+        "muscle_referred_remote_pain_value", "tmj_movement_pain_value", "tmj_press_pain_value",
+        "headache_temples_value", "headache_reproduce_by_pressure_value", "headache_with_jaw_value",
+        "headache_not_elsewhere_value"],
+    5: ["tmj_sound_value", "tmj_click_context", "crepitus_confirmed_value", "jaw_locked_now_value",
+        "jaw_unlock_possible_value", "jaw_locked_past_value", "mao_fits_3fingers_value"],
+    6: ["frequency_choice", "headache_areas", "headache_severity", "headache_frequency"],
+    13: ["neck_trauma_radio"],
+    14: ["stress_radio"],
+    15: ["ortho_exp", "prosth_exp", "tmd_treatment_history"],
+    18: ["impact_daily", "impact_work", "impact_quality_of_life", "sleep_quality", "sleep_tmd_relation"],
+}
+
+# 단계 → 필수가 아닌 답 항목 (summary/group 제외)
+OPTIONAL = {
+    1: ["birthdate", "address", "occupation", "visit_reason"],
+    3: ["pain_quality_other"],
+    6: ["pain_level", "time_morning", "time_afternoon", "time_evening", "has_headache_now",
+        "headache_triggers", "headache_reliefs"],
+    7: ["habit_none", "habit_bruxism_night", "habit_clenching_day", "habit_clenching_night", "selected_habits"],
+    8: ["active_opening", "active_pain", "passive_opening", "passive_pain"],
+    9: ["deviation", "deviation2", "deflection", "protrusion", "protrusion_pain", "latero_right",
+        "latero_right_pain", "latero_left", "latero_left_pain", "occlusion", "occlusion_shift"],
+    10: ["tmj_noise_right_open", "tmj_noise_left_open", "tmj_noise_right_close", "tmj_noise_left_close"],
+    11: ["palpation_temporalis", "palpation_medial_pterygoid", "palpation_lateral_pterygoid", "pain_mapping"],
+    12: ["selected_ear_symptoms"],
+    13: ["neck_none", "neck_pain", "shoulder_pain", "stiffness", "additional_none", "eye_pain", "nose_pain",
+         "throat_pain"],
+    14: ["stress_detail"],
+    15: ["ortho_detail", "prosth_detail", "other_dental", "tmd_treatment_detail", "tmd_treatment_response",
+         "tmd_current_medications"],
+    16: ["past_history", "current_medications"],
+    17: ["bite_right", "bite_left", "loading_test", "resistance_test", "attrition"],
+}
+
+
+def required_keys(step):
+    return [key for key, _, _ in SCHEMA["required"].get(step, ())]
+
+
+@pytest.mark.parametrize("step", range(1, 19))
+def test_required_and_optional_fields(step):
+    asked = [key for key, _ in SCHEMA["step_defaults"][step]]
+
+    assert required_keys(step) == REQUIRED.get(step, [])
+    assert [key for key in asked if key not in REQUIRED.get(step, [])] == OPTIONAL.get(step, [])
+
+
+def test_defaults_are_not_answers():
+    # 날짜는 위젯이 항상 값을 가지므로 기본값도 답으로 봄 (필수 항목이 아님)
+    answered = {key for key, default in SCHEMA["defaults"].items() if is_answered(default)}
+    assert answered == {"birthdate"}
+    assert SCHEMA["defaults"]["birthdate"] == datetime.date(2000, 1, 1)
+
+
+@pytest.mark.parametrize("value, answered", [
+    (None, False), ("", False), ("  ", False), (NOT_SELECTED, False), ((), False), (0, False), (False, False),
+    ("예", True), (" 홍길동 ", True), (("코골이",), True), (3, True), (True, True),
+])
+def test_is_answered(value, answered):
+    assert is_answered(value) is answered
+
+
+@pytest.mark.parametrize("step", sorted(REQUIRED))
+def test_defaults_miss_unconditional_answers(step):
+    unconditional = [key for key, _, conditions in SCHEMA["required"][step] if not conditions]
+
+    assert [key for key, _ in missing_answers(SCHEMA, step, SCHEMA["defaults"])] == unconditional
+    assert [key for key, _ in missing_answers(SCHEMA, step, {})] == unconditional
+
+
+def test_missing_answers_follows_when():
+    answers = {**SCHEMA["defaults"], "pain_types_value": "두통"}
+    assert [key for key, _ in missing_answers(SCHEMA, 4, answers)] == [
+        "headache_temples_value", "headache_reproduce_by_pressure_value", "headache_with_jaw_value",
+    ]
+
+    answers.update({"headache_temples_value": "예", "headache_reproduce_by_pressure_value": "아니오",
+                    "headache_with_jaw_value": "예"})
+    assert [key for key, _ in missing_answers(SCHEMA, 4, answers)] == ["headache_not_elsewhere_value"]
+
+    answers["headache_not_elsewhere_value"] = "아니오"
+    assert missing_answers(SCHEMA, 4, answers) == []
+
+
+def test_missing_answers_returns_warnings():
+    answers = {"tmj_sound_value": "딸깍소리", "tmj_click_context": ()}
+
+    assert missing_answers(SCHEMA, 5, answers) == [
+        ("tmj_click_context", SCHEMA["fields"]["tmj_click_context"]["required"]),
+    ]
+
+
+@pytest.mark.parametrize("change, message", [
+    ({"key": "name"}, "겹칩니다"),
+    ({"kind": "slider"}, "종류"),
+    ({"default": "모름"}, "기본값"),
+    ({"when": {"no_such_key": ("예",)}}, "when"),
+])
+def test_compile_schema_rejects_bad_fields(change, message):
+    field = {"key": "extra", "step": 3, "kind": "choice", "options": ("예", NOT_SELECTED), "required": "경고"}
+
+    with pytest.raises(ValueError, match=message):
+        compile_schema([*FIELDS, {**field, **change}])
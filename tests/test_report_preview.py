@@ -0,0 +1,31 @@
+"""마지막 단계의 문진 기록 미리보기: 사용자가 입력한 값은 markdown/HTML 로 해석되지 않고 글자 그대로 보여야 합니다."""
+import html
+import os
+import sys
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from answers import AnswerRecord  # noqa: E402
+
+APP = os.path.join(ROOT, "app.py")
+FINAL_STEP = 19  # app.final_step
+
+
+def test_preview_escapes_user_values():
+    name = "*김* _철수_ [링크](http://x) # <b>굵게</b>"
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.session_state["step"] = FINAL_STEP
+    at.session_state["validation_errors"] = {}
+    at.session_state["answers"] = AnswerRecord({"name": name})
+    at.run()
+    assert not at.exception
+
+    # markdown 요소로 그리지 않고, HTML 요소 안에 escape 된 값이 그대로 들어감
+    assert not any(name in markdown.value or "철수" in markdown.value for markdown in at.markdown)
+    previews = [element.proto.body for element in at.get("html")]
+    assert len(previews) == 1
+    assert html.escape(name, quote=False) in previews[0]
+    assert "<b>굵게</b>" not in previews[0]
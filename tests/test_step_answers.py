@@ -0,0 +1,102 @@
+"""
+여러 개 고르는 체크박스 답과 요약 답이 '다음' 버튼 한 번에 답 기록에 남는지 확인합니다.
+
+batched 모드(TMJ_INPUT_MODE=batched)에서는 단계 form 의 값과 콜백이 버튼을 누를 때 한꺼번에 들어오고,
+다음 단계로 넘어간 뒤에는 이전 단계 화면을 다시 그리지 않으므로, 화면 본문에서 답을 만들면 빠집니다.
+live 모드도 같은 순서(값을 고르고 바로 버튼)로 확인합니다.
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import steps.common  # noqa: E402
+from answers import AnswerRecord  # noqa: E402
+from pdf_report import normalize_report_values  # noqa: E402
+
+APP = os.path.join(ROOT, "app.py")
+
+
+@pytest.fixture(params=[False, True], ids=["live", "batched"])
+def open_step(request, monkeypatch):
+    """단계 화면을 연 AppTest 를 돌려주는 함수 (answers: 미리 넣어 둘 답)"""
+    # app.py 와 단계 모듈은 실행마다 steps.common.batched_input 을 읽음
+    monkeypatch.setattr(steps.common, "batched_input", request.param)
+
+    def open_step(step, answers=()):
+        at = AppTest.from_file(APP, default_timeout=60)
+        at.session_state["step"] = step
+        at.session_state["validation_errors"] = {}
+        at.session_state["answers"] = AnswerRecord(answers)
+        at.run()
+        assert not at.exception
+        return at
+    return open_step
+
+
+def press_next(at):
+    """다음 단계 버튼을 누릅니다 (그 전에 at.run() 을 부르지 않아야 batched 모드의 form 값이 함께 들어감)."""
+    next(button for button in at.button if button.label.startswith("다음 단계로 이동")).click()
+    at.run()
+    assert not at.exception
+    assert not at.warning, [warning.value for warning in at.warning]
+    return at.session_state["answers"]
+
+
+def test_step_05_click_context(open_step):
+    at = open_step(5, {"tmj_sound_value": "딸깍소리"})
+    at.checkbox(key="click_입 벌릴 때").check()
+    at.checkbox(key="click_음식 씹을 때").check()
+    answers = press_next(at)
+
+    assert at.session_state["step"] == 6
+    assert answers["tmj_click_context"] == ("입 벌릴 때", "음식 씹을 때")
+    assert answers["tmj_click_summary"] == "입 벌릴 때, 음식 씹을 때"
+
+
+def test_step_06_headache_details(open_step):
+    at = open_step(6, {
+        "frequency_choice": "매일", "time_morning": True, "has_headache_now": "예",
+        "headache_severity": 4, "headache_frequency": "주 1~2회",
+    })
+    at.checkbox(key="headache_area_정수리").check()
+    at.checkbox(key="headache_area_이마").check()
+    at.checkbox(key="trigger_스트레스").check()
+    at.checkbox(key="relief_휴식").check()
+    answers = press_next(at)
+
+    assert at.session_state["step"] == 7
+    assert answers["headache_areas"] == ("이마", "정수리")
+    assert answers["headache_triggers"] == ("스트레스",)
+    assert answers["headache_reliefs"] == ("휴식",)
+
+
+def test_step_07_additional_habits(open_step):
+    at = open_step(7)
+    at.checkbox(key="habit_bruxism_night").check()
+    at.checkbox(key="habit_코골이_widget").check()
+    answers = press_next(at)
+
+    assert at.session_state["step"] == 8
+    assert answers["selected_habits"] == ("코골이",)
+    assert answers["habit_summary"] == "이갈이 (밤)"
+    assert answers["additional_habits"] == "코골이"
+
+
+def test_step_13_symptom_groups(open_step):
+    at = open_step(13)
+    at.checkbox(key="neck_pain").check()
+    at.checkbox(key="additional_none").check()
+    at.radio(key="neck_trauma_radio").set_value("아니오")
+    answers = press_next(at)
+
+    assert at.session_state["step"] == 14
+    values = normalize_report_values(answers)
+    assert values["neck_shoulder_symptoms"] == "목 통증"
+    assert values["additional_symptoms"] == "없음"